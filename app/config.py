@@ -2,8 +2,158 @@
 """Configurações do projeto carregadas de variáveis de ambiente"""
 
 import os
+from typing import List
 from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def _get_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _get_list(name: str, default: str) -> List[str]:
+    value = os.getenv(name, default)
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
 MONGO_URI: str = os.getenv("MONGO_URI")
+MONGO_MAX_POOL_SIZE: int = int(os.getenv("MONGO_MAX_POOL_SIZE", "10"))
+MONGO_CONNECT_TIMEOUT_MS: int = int(
+    os.getenv("MONGO_CONNECT_TIMEOUT_MS", "2000")
+)
+
+# Gravação dos logs de requisições em segundo plano
+LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "1000"))
+LOG_BATCH_SIZE: int = int(os.getenv("LOG_BATCH_SIZE", "50"))
+LOG_FLUSH_INTERVAL: float = float(os.getenv("LOG_FLUSH_INTERVAL", "1"))
+LOG_SPILL_PATH: str = os.getenv(
+    "LOG_SPILL_PATH", "/tmp/smart-resume-analyzer-logs.jsonl"
+)
+
+# Carrega modelos (EasyOCR, sumarizador, flan-t5) em segundo plano na
+# inicialização; desativado, cada modelo é carregado no primeiro uso
+MODELS_WARMUP: bool = _get_bool("MODELS_WARMUP", True)
+
+# OCR
+OCR_LANGUAGES: List[str] = _get_list("OCR_LANGUAGES", "pt,en")
+OCR_FILE_WORKERS: int = int(os.getenv("OCR_FILE_WORKERS", "2"))
+OCR_PAGE_WORKERS: int = int(os.getenv("OCR_PAGE_WORKERS", "2"))
+OCR_READER_INSTANCES: int = int(
+    os.getenv("OCR_READER_INSTANCES", str(OCR_PAGE_WORKERS))
+)
+OCR_USE_GPU: bool = _get_bool("OCR_USE_GPU", False)
+OCR_PDF_DPI: int = int(os.getenv("OCR_PDF_DPI", "300"))
+OCR_MAX_IMAGE_SIDE: int = int(os.getenv("OCR_MAX_IMAGE_SIDE", "2000"))
+OCR_PAGE_WINDOW: int = int(os.getenv("OCR_PAGE_WINDOW", "2"))
+OCR_MAX_REQUEST_MEMORY_MB: int = int(
+    os.getenv("OCR_MAX_REQUEST_MEMORY_MB", "64")
+)
+
+# Cache de resultados (OCR, resumos e respostas)
+CACHE_ENABLED: bool = _get_bool("CACHE_ENABLED", True)
+CACHE_MAX_ITEMS: int = int(os.getenv("CACHE_MAX_ITEMS", "1024"))
+CACHE_TTL_SECONDS: float = float(os.getenv("CACHE_TTL_SECONDS", "86400"))
+# Segundo nível opcional: "" (desativado), "disk" ou "mongo"
+CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "").strip().lower()
+CACHE_DIR: str = os.getenv("CACHE_DIR", "/tmp/smart-resume-analyzer-cache")
+
+# Jobs de análise em lote: "memory" (padrão) ou "mongo"
+JOBS_BACKEND: str = os.getenv("JOBS_BACKEND", "memory").strip().lower()
+JOBS_MAX_CONCURRENCY: int = int(os.getenv("JOBS_MAX_CONCURRENCY", "4"))
+# Jobs concluídos mantidos em memória: por quanto tempo e quantos no máximo
+JOBS_RETENTION_SECONDS: float = float(os.getenv("JOBS_RETENTION_SECONDS", "3600"))  # noqa: E501
+JOBS_MAX_FINISHED: int = int(os.getenv("JOBS_MAX_FINISHED", "1000"))
+# Jobs em andamento renovam `heartbeat_at`; sem renovação por
+# JOBS_STALE_SECONDS (processo que caiu), viram "failed" no startup
+JOBS_HEARTBEAT_SECONDS: float = float(os.getenv("JOBS_HEARTBEAT_SECONDS", "30"))  # noqa: E501
+JOBS_STALE_SECONDS: float = float(os.getenv("JOBS_STALE_SECONDS", "300"))
+# Espera pelos jobs em andamento no encerramento antes de cancelá-los
+JOBS_SHUTDOWN_TIMEOUT: float = float(os.getenv("JOBS_SHUTDOWN_TIMEOUT", "10"))  # noqa: E501
+
+# Taxonomia de habilidades e cargos (YAML)
+SKILLS_TAXONOMY_PATH: str = os.getenv(
+    "SKILLS_TAXONOMY_PATH",
+    os.path.join(os.path.dirname(__file__), "data", "skills.yaml")
+)
+
+# Repositório de currículos analisados (busca sem novo upload)
+# Desligado por padrão: guarda o texto completo (dados pessoais) de cada
+# currículo analisado
+RESUME_STORE_ENABLED: bool = _get_bool("RESUME_STORE_ENABLED", False)
+RESUME_STORE_BACKEND: str = os.getenv("RESUME_STORE_BACKEND", "memory").strip().lower()  # noqa: E501
+# Limite do backend "memory": acima dele saem os menos usados
+RESUME_STORE_MAX_RECORDS: int = int(os.getenv("RESUME_STORE_MAX_RECORDS", "5000"))  # noqa: E501
+RESUME_SEARCH_LIMIT: int = int(os.getenv("RESUME_SEARCH_LIMIT", "10"))
+
+# Ranqueamento lexical antes do flan-t5 (/analyze/rank)
+RANKING_TOP_K: int = int(os.getenv("RANKING_TOP_K", "5"))
+RANKING_MIN_SCORE: float = float(os.getenv("RANKING_MIN_SCORE", "0"))
+
+# Cascata de análise da vaga: estágios em ordem e confiança mínima
+# para aceitar a resposta de cada um sem passar ao próximo
+CASCADE_STAGES: List[str] = _get_list("CASCADE_STAGES", "keyword,lexical,model")  # noqa: E501
+CASCADE_KEYWORD_THRESHOLD: float = float(os.getenv("CASCADE_KEYWORD_THRESHOLD", "0.85"))  # noqa: E501
+CASCADE_LEXICAL_THRESHOLD: float = float(os.getenv("CASCADE_LEXICAL_THRESHOLD", "0.8"))  # noqa: E501
+
+# Micro-batching do flan-t5 entre requisições concorrentes
+QA_BATCHING_ENABLED: bool = _get_bool("QA_BATCHING_ENABLED", True)
+QA_BATCH_MAX_SIZE: int = int(os.getenv("QA_BATCH_MAX_SIZE", "8"))
+QA_BATCH_MAX_WAIT_MS: float = float(os.getenv("QA_BATCH_MAX_WAIT_MS", "20"))
+
+# Tamanho do lote enviado ao pipeline de sumarização
+SUMMARIZER_BATCH_SIZE: int = int(os.getenv("SUMMARIZER_BATCH_SIZE", "8"))
+
+# Sumarização de textos longos: "truncate" (primeiros caracteres) ou
+# "chunked" (blocos por tokens resumidos em lote e depois combinados)
+SUMMARIZER_MODE: str = os.getenv("SUMMARIZER_MODE", "truncate").strip().lower()  # noqa: E501
+SUMMARIZER_CHUNK_TOKENS: int = int(os.getenv("SUMMARIZER_CHUNK_TOKENS", "960"))  # noqa: E501
+SUMMARIZER_CHUNK_OVERLAP: int = int(os.getenv("SUMMARIZER_CHUNK_OVERLAP", "64"))  # noqa: E501
+SUMMARIZER_MAX_CHUNKS: int = int(os.getenv("SUMMARIZER_MAX_CHUNKS", "8"))
+
+# Tokens máximos do prompt do flan-t5 (o currículo é cortado para caber)
+QA_PROMPT_MAX_TOKENS: int = int(os.getenv("QA_PROMPT_MAX_TOKENS", "800"))
+
+# Concorrência das etapas executadas fora do event loop
+SUMMARIZE_WORKERS: int = int(os.getenv("SUMMARIZE_WORKERS", "2"))
+QA_WORKERS: int = int(os.getenv("QA_WORKERS", str(QA_BATCH_MAX_SIZE)))
+
+# Perfil de inferência dos modelos: quality (fp32, beam search),
+# balanced (int8 dinâmico, 2 beams) ou fast (int8, decodificação gulosa)
+INFERENCE_PROFILE: str = os.getenv("INFERENCE_PROFILE", "quality").strip().lower()  # noqa: E501
+
+# Processos da API (workers do gunicorn); divide os núcleos entre eles
+WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Threads intra-op do torch por processo
+# (0 = núcleos / (OCR_PAGE_WORKERS * WEB_CONCURRENCY))
+TORCH_THREADS: int = int(os.getenv("TORCH_THREADS", "0"))
+
+# Profiling (cProfile) de uma requisição de /analyze/: pelo cabeçalho
+# X-Profile com o token abaixo ou por amostragem (0 = desligado)
+PROFILING_ENABLED: bool = _get_bool("PROFILING_ENABLED", False)
+PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN", "")
+PROFILING_SAMPLE_RATE: float = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))  # noqa: E501
+PROFILING_DIR: str = os.getenv("PROFILING_DIR", "/tmp/smart-resume-analyzer-profiles")  # noqa: E501
+PROFILING_TOP_N: int = int(os.getenv("PROFILING_TOP_N", "20"))
+
+# Uploads: gravados em disco em blocos; limites respondem 413
+# (páginas: 0 = sem limite)
+UPLOAD_SPOOL_DIR: str = os.getenv("UPLOAD_SPOOL_DIR", "/tmp/smart-resume-analyzer-uploads")  # noqa: E501
+UPLOAD_CHUNK_SIZE: int = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))  # noqa: E501
+UPLOAD_MAX_FILE_MB: float = float(os.getenv("UPLOAD_MAX_FILE_MB", "20"))
+UPLOAD_MAX_REQUEST_MB: float = float(os.getenv("UPLOAD_MAX_REQUEST_MB", "100"))  # noqa: E501
+UPLOAD_MAX_FILE_PAGES: int = int(os.getenv("UPLOAD_MAX_FILE_PAGES", "50"))
+UPLOAD_MAX_REQUEST_PAGES: int = int(os.getenv("UPLOAD_MAX_REQUEST_PAGES", "200"))  # noqa: E501
+
+# PDF
+PDF_MAX_PAGES: int = int(os.getenv("PDF_MAX_PAGES", "10"))
+PDF_TEXT_LAYER_ENABLED: bool = _get_bool("PDF_TEXT_LAYER_ENABLED", True)
+PDF_TEXT_MIN_CHARS: int = int(os.getenv("PDF_TEXT_MIN_CHARS", "50"))
+PDF_TEXT_MIN_ALNUM_RATIO: float = float(
+    os.getenv("PDF_TEXT_MIN_ALNUM_RATIO", "0.6")
+)
+PDF_TEXT_TIMEOUT: float = float(os.getenv("PDF_TEXT_TIMEOUT", "15"))
@@ -1,11 +1,56 @@
 # app/main.py
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+import logging
+import threading
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from app.config import MODELS_WARMUP, UPLOAD_MAX_REQUEST_MB
 from app.routers.analyze import analyze_router
+from app.routers.health import health_router
+from app.routers.jobs import jobs_router
+from app.routers.metrics import metrics_router
+from app.routers.resumes import resumes_router
+from app.services import executors, logger as log_sink, metrics
+from app.services.jobs import job_manager
+from app.services.models import registry
+
+logger = logging.getLogger(__name__)
+
+http_seconds = metrics.registry.histogram(
+    "resume_http_request_duration_seconds",
+    "Duração das requisições HTTP por rota",
+    ("method", "route", "status")
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Carrega os modelos em segundo plano para a API subir imediatamente;
+    # /health/ready indica quando terminaram
+    if MODELS_WARMUP:
+        threading.Thread(
+            target=registry.warmup,
+            name="models-warmup",
+            daemon=True
+        ).start()
+    log_sink.sink.start()
+    # Jobs que ficaram "running" quando um processo caiu
+    await job_manager.recover()
+    yield
+    # Jobs em andamento terminam ou são marcados como falhos
+    await job_manager.shutdown()
+    executors.shutdown(wait=False)
+    # Grava os logs pendentes antes de encerrar
+    log_sink.sink.stop()
+
 
 app = FastAPI(
     title="Smart Resume Analyzer",
     description="Recebe currículos, extrai informações e responde queries via IA.",  # noqa: E501
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 
@@ -15,6 +60,70 @@ app.include_router(
     tags=["Analyze"]
 )
 
+app.include_router(
+    jobs_router,
+    prefix="/jobs",
+    tags=["Jobs"]
+)
+
+app.include_router(
+    resumes_router,
+    prefix="/resumes",
+    tags=["Resumes"]
+)
+
+app.include_router(
+    metrics_router,
+    tags=["Metrics"]
+)
+
+app.include_router(
+    health_router,
+    prefix="/health",
+    tags=["Health"]
+)
+
+
+# Folga para os cabeçalhos e campos do multipart além dos arquivos
+MULTIPART_OVERHEAD = 1024 * 1024
+
+
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    """Recusa com 413, antes de ler o corpo, requisições acima do limite."""
+    length = request.headers.get("content-length")
+    limit = UPLOAD_MAX_REQUEST_MB * 1024 * 1024 + MULTIPART_OVERHEAD
+    if request.method == "POST" and length and length.isdigit() and int(length) > limit:  # noqa: E501
+        return JSONResponse(
+            status_code=413,
+            content={"detail": f"A requisição excede o limite de {UPLOAD_MAX_REQUEST_MB:.0f} MB"}  # noqa: E501
+        )
+    return await call_next(request)
+
+
+@app.middleware("http")
+async def record_latency(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    http_seconds.observe(
+        time.perf_counter() - start,
+        method=request.method,
+        route=_route_label(request),
+        status=str(response.status_code)
+    )
+    return response
+
+
+def _route_label(request: Request) -> str:
+    """Modelo da rota (ex.: /resumes/{resume_id}), para não criar um rótulo por id."""  # noqa: E501
+    if "route" not in request.scope:
+        return "unmatched"
+    names = {str(value): name for name, value in request.path_params.items()}
+    return "/".join(
+        f"{{{names[segment]}}}" if segment in names else segment
+        for segment in request.url.path.split("/")
+    )
+
 
 # Rota raiz só para ver se está no ar
 @app.get("/")
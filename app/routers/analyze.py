@@ -1,19 +1,66 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+import asyncio
+import json
+import os
+import time
+from fastapi import APIRouter, UploadFile, File, Form, Header, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
-from app.services import ocr, logger, summarizer, question_answering
-from app.schemas.analyze import AnalyzeResponse
+from app.config import RANKING_MIN_SCORE, RANKING_TOP_K
+from app.services import cache, logger, metrics, pipeline, profiling, ranking
+from app.schemas.analyze import AnalyzeResponse, RankingResponse
+from app.services.uploads import (
+    SpooledUpload,
+    UploadLimitError,
+    remove_uploads,
+    spool_uploads
+)
 import logging
 
 analyze_router = APIRouter()
 
+files_per_request = metrics.registry.histogram(
+    "resume_request_files",
+    "Arquivos enviados por requisição",
+    buckets=metrics.COUNT_BUCKETS
+)
+
 
 logging.basicConfig(level=logging.INFO)
 logger_system = logging.getLogger(__name__)
 
 
+async def read_uploads(
+    files: List[UploadFile]
+) -> List[Tuple[str, Optional[SpooledUpload]]]:
+    """
+    Valida o tipo dos arquivos e grava cada upload em disco, aplicando os
+    limites de tamanho e de páginas (413). Quem chama apaga os arquivos
+    com `remove_uploads` ao terminar o OCR.
+    """
+    if not files:
+        raise HTTPException(status_code=400, detail="Nenhum arquivo foi enviado")  # noqa: E501
+
+    # Valida e processa arquivos
+    allowed_types = {"application/pdf", "image/jpeg", "image/png"}
+
+    for file in files:
+        if file.content_type not in allowed_types:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Tipo de arquivo inválido: {file.filename} ({file.content_type})"  # noqa: E501
+            )
+
+    try:
+        uploads = await spool_uploads(files)
+    except UploadLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    files_per_request.observe(len(uploads))
+    return uploads
+
+
 @analyze_router.post(
     "/",
     summary="Analisa currículos (PDF ou imagens)",
@@ -21,6 +68,7 @@ logger_system = logging.getLogger(__name__)
     responses={
         200: {"description": "Resultado da análise dos currículos"},
         400: {"description": "Requisição malformada ou sem arquivos válidos"},
+        413: {"description": "Arquivo ou requisição acima dos limites de tamanho ou páginas"},  # noqa: E501
         500: {"description": "Erro interno da aplicação"},
     }
 )
@@ -34,6 +82,10 @@ async def analyze_files(
     query: Optional[str] = Form(
         None,
         description="Consulta de recrutamento. Ex: 'Quem se encaixa melhor para vaga de Engenheiro Python?'"  # noqa: E501
+    ),
+    x_profile: Optional[str] = Header(
+        None,
+        description="Token de profiling (PROFILING_TOKEN): grava o cProfile desta requisição"  # noqa: E501
     )
 ):
     """
@@ -48,97 +100,51 @@ async def analyze_files(
     - request_id (UUID): ID da requisição (para auditoria).
     - user_id (str): ID do usuário que fez a solicitação.
     - query (Optional[str]): Pergunta ou filtro da vaga para análise.
+    - X-Profile (header): com PROFILING_ENABLED, perfila a requisição; o
+    caminho do arquivo volta no cabeçalho `X-Profile-File`.
 
     Returns:
     - dict: Resultado por arquivo, com resposta ou resumo.
     """
-    if not files:
-        raise HTTPException(status_code=400, detail="Nenhum arquivo foi enviado")  # noqa: E501
+    uploads = await read_uploads(files)
 
-    resumes_texts = []
-    filenames = []
+    filenames = [filename for filename, _ in uploads]
+    cache_events = cache.start_tracking()
+    timings = metrics.start_request_timing()
+    profile_reason = profiling.should_profile(x_profile)
+    profile = profiling.start(str(request_id), profile_reason) if profile_reason else None  # noqa: E501
 
-    # Valida e processa arquivos
-    allowed_types = {"application/pdf", "image/jpeg", "image/png"}
-
-    for file in files:
-        if file.content_type not in allowed_types:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Tipo de arquivo inválido: {file.filename} ({file.content_type})"  # noqa: E501
-            )
-
-        try:
-            content = await file.read()
-            logger_system.info(f"Processando arquivo: {file.filename}")
-
-            text = ocr.extract_text(file.filename, content)
-
-            if not text or len(text.strip()) < 20:
-                logger_system.warning(f"Texto extraído muito curto para {file.filename}")  # noqa: E501
-                text = f"Erro: Não foi possível extrair texto suficiente de {file.filename}"  # noqa: E501
-
-            resumes_texts.append(text)
-            filenames.append(file.filename)
-
-        except Exception as e:
-            logger_system.error(f"Erro ao processar {file.filename}: {str(e)}")
-            resumes_texts.append(f"Erro ao processar arquivo: {str(e)}")
-            filenames.append(file.filename)
-
-    results = {}
+    # Cada etapa roda em seu próprio pool; o event loop só aguarda, ficando
+    # livre para aceitar outros uploads e health checks.
+    logger_system.info(f"Processando {len(uploads)} arquivo(s)")
+    try:
+        extractions = await asyncio.gather(*(
+            pipeline.extract(filename, content) for filename, content in uploads  # noqa: E501
+        ))
+    finally:
+        remove_uploads(uploads)
+    resumes_texts = [text for text, _ in extractions]
 
     if query:
         logger_system.info(f"Analisando currículos para query: {query}")
 
-        summarized_texts = []
-        for i, text in enumerate(resumes_texts):
-            if text.startswith("Erro"):
-                summarized_texts.append(text)
-            else:
-                summary = summarizer.summarize_text(text)
-                summarized_texts.append(summary)
-                logger_system.info(f"Resumo gerado para {filenames[i]}: {summary[:100]}...")  # noqa: E501
-
-        for i, (summary, filename) in enumerate(zip(summarized_texts, filenames)):  # noqa: E501
-            try:
-                if summary.startswith("Erro"):
-                    results[filename] = {
-                        "answer": "Erro",
-                        "justification": summary
-                    }
-                else:
-                    analysis = question_answering.analyze_resume_for_position(summary, query)  # noqa: E501
-                    results[filename] = {
-                        "answer": analysis["answer"],
-                        "justification": analysis["justification"],
-                        "resume_summary": summary
-                    }
-            except Exception as e:
-                logger_system.error(f"Erro na análise de {filename}: {str(e)}")
-                results[filename] = {
-                    "answer": "Erro",
-                    "justification": f"Erro durante análise: {str(e)}"
-                }
+        summarized_texts = await pipeline.summarize_all(filenames, resumes_texts)  # noqa: E501
+        analyses = await asyncio.gather(*(
+            pipeline.answer(filename, summary, query)
+            for filename, summary in zip(filenames, summarized_texts)
+        ))
 
     else:
         logger_system.info("Gerando resumos dos currículos")
-        for i, (text, filename) in enumerate(zip(resumes_texts, filenames)):
-            try:
-                if text.startswith("Erro"):
-                    results[filename] = {
-                        "summary": text
-                    }
-                else:
-                    summary = summarizer.summarize_text(text)
-                    results[filename] = {
-                        "summary": summary
-                    }
-            except Exception as e:
-                logger_system.error(f"Erro ao gerar resumo para {filename}: {str(e)}")  # noqa: E501
-                results[filename] = {
-                    "summary": f"Erro ao gerar resumo: {str(e)}"
-                }
+        summaries = await pipeline.summarize_all(filenames, resumes_texts)
+        analyses = [{"summary": summary} for summary in summaries]
+
+    results = {}
+    for filename, analysis, (_, pages) in zip(filenames, analyses, extractions):  # noqa: E501
+        results[filename] = analysis
+        # Informa por página se o texto veio da camada do PDF ou do OCR
+        if pages:
+            results[filename]["pages"] = pages
 
     log_data = {
         "request_id": str(request_id),
@@ -147,13 +153,258 @@ async def analyze_files(
         "query": query,
         "files_processed": len(files),
         "filenames": filenames,
-        "resultado": results
+        "resultado": results,
+        "cache": cache_events,
+        "timings": timings.as_dict()
     }
+    headers = {}
+    if profile is not None:
+        log_data["profile"] = await asyncio.to_thread(profile.finish)
+        if log_data["profile"]["file"]:
+            headers["X-Profile-File"] = os.path.basename(log_data["profile"]["file"])  # noqa: E501
 
+    # Apenas enfileira: a gravação no MongoDB ocorre em segundo plano
     try:
         logger.save_log(log_data)
-        logger_system.info(f"Log salvo para request_id: {request_id}")
+        logger_system.info(f"Log enfileirado para request_id: {request_id}")
+    except Exception as e:
+        logger_system.error(f"Erro ao salvar log: {str(e)}")
+
+    return JSONResponse(content=results, headers=headers)
+
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def _encode_record(record: dict, fmt: str) -> str:
+    data = json.dumps(record, ensure_ascii=False)
+    if fmt == "sse":
+        return f"event: {record['type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+async def _stream_results(
+    uploads: List[Tuple[str, Optional[SpooledUpload]]],
+    request_id: UUID,
+    user_id: str,
+    query: Optional[str],
+    fmt: str
+) -> AsyncIterator[str]:
+    """Emite um registro por arquivo assim que ele termina e um resumo final."""  # noqa: E501
+    start = time.perf_counter()
+    cache_events = cache.start_tracking()
+    request_timings = metrics.start_request_timing()
+
+    async def run_one(index: int, filename: str, content: Optional[SpooledUpload]):  # noqa: E501
+        timings = {}
+        try:
+            result = await pipeline.analyze_file(filename, content, query, timings)  # noqa: E501
+        finally:
+            remove_uploads([(filename, content)])
+        return {
+            "type": "result",
+            "index": index,
+            "filename": filename,
+            "result": result,
+            "timings_ms": timings
+        }
+
+    tasks = [
+        asyncio.create_task(run_one(index, filename, content))
+        for index, (filename, content) in enumerate(uploads)
+    ]
+    results = {}
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            record = await next_done
+            results[record["filename"]] = record["result"]
+            yield _encode_record(record, fmt)
+    finally:
+        # Cliente desconectado: não continua processando os demais arquivos
+        for task in tasks:
+            task.cancel()
+        remove_uploads(uploads)
+
+    total_ms = round((time.perf_counter() - start) * 1000, 2)
+    yield _encode_record({
+        "type": "summary",
+        "files_processed": len(uploads),
+        "total_ms": total_ms
+    }, fmt)
+
+    try:
+        logger.save_log({
+            "request_id": str(request_id),
+            "user_id": user_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "query": query,
+            "files_processed": len(uploads),
+            "filenames": [filename for filename, _ in uploads],
+            "resultado": results,
+            "cache": cache_events,
+            "timings": request_timings.as_dict()
+        })
+    except Exception as e:
+        logger_system.error(f"Erro ao salvar log: {str(e)}")
+
+
+@analyze_router.post(
+    "/stream",
+    summary="Analisa currículos retornando cada resultado assim que fica pronto",  # noqa: E501
+    responses={
+        200: {
+            "description": "Um registro JSON por arquivo e um registro final de resumo",  # noqa: E501
+            "content": {media_type: {} for media_type in STREAM_MEDIA_TYPES.values()}  # noqa: E501
+        },
+        400: {"description": "Requisição malformada ou sem arquivos válidos"},
+        413: {"description": "Arquivo ou requisição acima dos limites de tamanho ou páginas"},  # noqa: E501
+    }
+)
+async def analyze_files_stream(
+    files: List[UploadFile] = File(
+        ...,
+        description="Lista de arquivos (PDFs ou imagens JPG/PNG)"
+    ),
+    request_id: UUID = Form(..., description="Identificador único da requisição"),  # noqa: E501
+    user_id: str = Form(..., description="ID do usuário solicitante"),
+    query: Optional[str] = Form(
+        None,
+        description="Consulta de recrutamento. Ex: 'Quem se encaixa melhor para vaga de Engenheiro Python?'"  # noqa: E501
+    ),
+    format: str = Form(
+        "ndjson",
+        description="Formato do stream: 'ndjson' ou 'sse' (Server-Sent Events)"  # noqa: E501
+    )
+):
+    """
+    Variante em streaming de `/analyze/`: cada arquivo é emitido como um
+    registro `{"type": "result", ...}` com o tempo de cada etapa
+    (`timings_ms`) assim que termina, seguido de um registro
+    `{"type": "summary", ...}`.
+    """
+    if format not in STREAM_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Formato inválido: {format}. Use 'ndjson' ou 'sse'"
+        )
+
+    uploads = await read_uploads(files)
+    return StreamingResponse(
+        _stream_results(uploads, request_id, user_id, query, format),
+        media_type=STREAM_MEDIA_TYPES[format]
+    )
+
+
+@analyze_router.post(
+    "/rank",
+    summary="Ranqueia currículos para uma vaga e analisa só os melhores",
+    response_model=RankingResponse,
+    responses={
+        200: {"description": "Currículos ordenados por aderência lexical"},
+        400: {"description": "Requisição malformada ou sem arquivos válidos"},
+        413: {"description": "Arquivo ou requisição acima dos limites de tamanho ou páginas"},  # noqa: E501
+    }
+)
+async def rank_files(
+    files: List[UploadFile] = File(
+        ...,
+        description="Lista de arquivos (PDFs ou imagens JPG/PNG)"
+    ),
+    request_id: UUID = Form(..., description="Identificador único da requisição"),  # noqa: E501
+    user_id: str = Form(..., description="ID do usuário solicitante"),
+    query: str = Form(
+        ...,
+        description="Consulta de recrutamento. Ex: 'Engenheiro Python com Django e AWS'"  # noqa: E501
+    ),
+    top_k: int = Form(
+        RANKING_TOP_K,
+        ge=0,
+        description="Quantos dos melhores candidatos passam pela análise com o modelo"  # noqa: E501
+    ),
+    min_score: float = Form(
+        RANKING_MIN_SCORE,
+        description="Pontuação mínima (BM25) para um candidato ser analisado"  # noqa: E501
+    )
+):
+    """
+    Pontua todos os resumos contra a consulta com BM25 (barato e
+    vetorizado) e executa a análise com flan-t5 apenas nos `top_k`
+    melhores acima de `min_score`. Triar 200 currículos custa `top_k`
+    gerações em vez de 200.
+    """
+    uploads = await read_uploads(files)
+    filenames = [filename for filename, _ in uploads]
+    cache_events = cache.start_tracking()
+    timings = metrics.start_request_timing()
+
+    try:
+        extractions = await asyncio.gather(*(
+            pipeline.extract(filename, content) for filename, content in uploads  # noqa: E501
+        ))
+    finally:
+        remove_uploads(uploads)
+    summaries = await pipeline.summarize_all(
+        filenames, [text for text, _ in extractions]
+    )
+
+    ranked = ranking.rank_candidates(
+        summaries,
+        query,
+        top_k=top_k,
+        min_score=min_score,
+        excluded=[summary.startswith("Erro") for summary in summaries]
+    )
+    selected = [item for item in ranked if item["evaluate"]]
+    logger_system.info(f"Ranking de {len(ranked)} currículo(s), {len(selected)} analisado(s) pelo modelo")  # noqa: E501
+
+    analyses = await asyncio.gather(*(
+        pipeline.answer(filenames[item["index"]], summaries[item["index"]], query)  # noqa: E501
+        for item in selected
+    ))
+    analysis_by_index = {
+        item["index"]: analysis for item, analysis in zip(selected, analyses)
+    }
+
+    candidates = []
+    for item in ranked:
+        index = item["index"]
+        candidate = {
+            "rank": item["rank"],
+            "filename": filenames[index],
+            "score": item["score"],
+            "evaluated": item["evaluate"],
+            "resume_summary": summaries[index]
+        }
+        if index in analysis_by_index:
+            candidate["answer"] = analysis_by_index[index]["answer"]
+            candidate["justification"] = analysis_by_index[index]["justification"]  # noqa: E501
+            if "cascade" in analysis_by_index[index]:
+                candidate["cascade"] = analysis_by_index[index]["cascade"]
+        candidates.append(candidate)
+
+    response = {
+        "query": query,
+        "top_k": top_k,
+        "min_score": min_score,
+        "ranking": candidates
+    }
+
+    try:
+        logger.save_log({
+            "request_id": str(request_id),
+            "user_id": user_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "query": query,
+            "files_processed": len(uploads),
+            "filenames": filenames,
+            "resultado": response,
+            "cache": cache_events,
+            "timings": timings.as_dict()
+        })
     except Exception as e:
         logger_system.error(f"Erro ao salvar log: {str(e)}")
 
-    return JSONResponse(content=results)
+    return JSONResponse(content=response)
@@ -0,0 +1,47 @@
+# app/routers/health.py
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from app.config import MODELS_WARMUP
+from app.services.logger import sink
+from app.services.models import registry
+from app.services.question_answering import qa_batcher
+from app.services.reader_pool import reader_pool
+
+health_router = APIRouter()
+
+
+@health_router.get("/live", summary="Processo no ar")
+def live():
+    """Responde assim que o processo aceita requisições."""
+    return {"status": "alive"}
+
+
+@health_router.get(
+    "/ready",
+    summary="Modelos carregados",
+    responses={503: {"description": "Modelos ainda não carregados"}}
+)
+def ready():
+    """
+    Responde 200 somente quando todos os modelos estão carregados. Com
+    MODELS_WARMUP desligado os modelos carregam no primeiro uso, e a
+    sonda responde 200 desde o início.
+    """
+    is_ready = registry.ready(lazy=not MODELS_WARMUP)
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "status": "ready" if is_ready else "loading",
+            "models": registry.status()
+        }
+    )
+
+
+@health_router.get("/stats", summary="Estatísticas internas")
+def stats():
+    """Uso do pool de leitores EasyOCR, lotes do flan-t5 e fila de logs."""
+    return {
+        "easyocr": reader_pool.stats(),
+        "qa_batching": qa_batcher.stats(),
+        "logs": sink.stats()
+    }
@@ -0,0 +1,70 @@
+# app/routers/jobs.py
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from typing import List, Optional
+from uuid import UUID
+from app.routers.analyze import read_uploads
+from app.schemas.jobs import JobResults, JobStatus, JobSubmitted
+from app.services.jobs import job_manager
+
+jobs_router = APIRouter()
+
+
+@jobs_router.post(
+    "/",
+    summary="Envia currículos para análise em segundo plano",
+    response_model=JobSubmitted,
+    status_code=202,
+    responses={
+        202: {"description": "Job aceito para processamento"},
+        400: {"description": "Requisição malformada ou sem arquivos válidos"},
+        413: {"description": "Arquivo ou requisição acima dos limites de tamanho ou páginas"},  # noqa: E501
+    }
+)
+async def submit_job(
+    files: List[UploadFile] = File(
+        ...,
+        description="Lista de arquivos (PDFs ou imagens JPG/PNG)"
+    ),
+    request_id: UUID = Form(..., description="Identificador único da requisição"),  # noqa: E501
+    user_id: str = Form(..., description="ID do usuário solicitante"),
+    query: Optional[str] = Form(
+        None,
+        description="Consulta de recrutamento. Ex: 'Quem se encaixa melhor para vaga de Engenheiro Python?'"  # noqa: E501
+    )
+):
+    """
+    Recebe os arquivos e devolve imediatamente o id do job. O progresso é
+    consultado em `/jobs/{job_id}` e os resultados em
+    `/jobs/{job_id}/results`, à medida que cada arquivo termina.
+    """
+    uploads = await read_uploads(files)
+    job_id = await job_manager.submit(uploads, str(request_id), user_id, query)  # noqa: E501
+    return {"job_id": job_id, "status": "queued", "total": len(uploads)}
+
+
+@jobs_router.get(
+    "/{job_id}",
+    summary="Progresso do job",
+    response_model=JobStatus,
+    responses={404: {"description": "Job não encontrado"}}
+)
+def get_job(job_id: str):
+    """Estado geral do job e de cada arquivo."""
+    job = job_manager.status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job não encontrado")
+    return job
+
+
+@jobs_router.get(
+    "/{job_id}/results",
+    summary="Resultados já concluídos do job",
+    response_model=JobResults,
+    responses={404: {"description": "Job não encontrado"}}
+)
+def get_job_results(job_id: str):
+    """Resultados por arquivo, incluindo apenas os arquivos já concluídos."""
+    results = job_manager.results(job_id)
+    if results is None:
+        raise HTTPException(status_code=404, detail="Job não encontrado")
+    return results
@@ -0,0 +1,35 @@
+# app/routers/metrics.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.services import executors, metrics
+from app.services.logger import sink
+from app.services.question_answering import qa_batcher
+
+metrics_router = APIRouter()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+queue_depth = metrics.registry.gauge(
+    "resume_queue_depth",
+    "Itens aguardando em cada fila interna",
+    ("queue",)
+)
+queue_depth.set_function(lambda: qa_batcher.stats()["queue_depth"], queue="qa_batch")  # noqa: E501
+# Tamanhos dos lotes do flan-t5: `resume_batch_size{batcher="qa"}`,
+# observado pelo próprio MicroBatcher a cada lote disparado
+queue_depth.set_function(lambda: sink.stats()["queue_depth"], queue="logs")
+for _name in executors.EXECUTOR_SIZES:
+    queue_depth.set_function(
+        lambda name=_name: executors.queue_sizes().get(name, 0),
+        queue=f"executor_{_name}"
+    )
+
+
+@metrics_router.get(
+    "/metrics",
+    summary="Métricas no formato do Prometheus",
+    response_class=PlainTextResponse
+)
+def get_metrics():
+    """Latência por etapa, páginas, cascata, caches e profundidade das filas."""  # noqa: E501
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,58 @@
+# app/routers/resumes.py
+import asyncio
+import time
+from fastapi import APIRouter, HTTPException, Query
+from typing import List
+from app.config import RESUME_SEARCH_LIMIT
+from app.schemas.resumes import ResumeSearchResponse, StoredResume
+from app.services.resume_store import resume_repository
+
+resumes_router = APIRouter()
+
+
+@resumes_router.get(
+    "/search",
+    summary="Busca currículos já analisados",
+    response_model=ResumeSearchResponse,
+    responses={
+        200: {"description": "Currículos armazenados que atendem à consulta"},  # noqa: E501
+        400: {"description": "Consulta sem termos nem habilidades"},
+    }
+)
+async def search_resumes(
+    q: str = Query("", description="Termos da busca. Ex: 'python django aws'"),  # noqa: E501
+    skills: List[str] = Query(
+        [],
+        description="Habilidades obrigatórias (repita o parâmetro para várias)"  # noqa: E501
+    ),
+    limit: int = Query(RESUME_SEARCH_LIMIT, ge=1, le=100)
+):
+    """
+    Consulta o índice invertido dos currículos já processados, sem
+    repetir OCR nem modelos. Resultados ordenados por BM25.
+    """
+    if not q.strip() and not skills:
+        raise HTTPException(status_code=400, detail="Informe `q` ou `skills`")  # noqa: E501
+
+    start = time.perf_counter()
+    results = await asyncio.to_thread(resume_repository.search, q, skills, limit)  # noqa: E501
+    return {
+        "query": q,
+        "skills": skills,
+        "took_ms": round((time.perf_counter() - start) * 1000, 2),
+        "results": results
+    }
+
+
+@resumes_router.get(
+    "/{resume_id}",
+    summary="Currículo armazenado",
+    response_model=StoredResume,
+    responses={404: {"description": "Currículo não encontrado"}}
+)
+async def get_resume(resume_id: str):
+    """Texto normalizado, resumo e dados extraídos de um currículo."""
+    record = await asyncio.to_thread(resume_repository.get, resume_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Currículo não encontrado")  # noqa: E501
+    return record
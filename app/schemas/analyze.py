@@ -1,17 +1,52 @@
 # app/schemas/analyze.py
 from pydantic import BaseModel, RootModel
-from typing import Dict, Union
+from typing import Dict, List, Optional, Union
+
+
+class PageExtraction(BaseModel):
+    page: int
+    method: str
+    chars: int
+
+
+class CascadeTrace(BaseModel):
+    stage: Optional[str] = None
+    confidence: float
+    accepted: bool
+    confidences: Dict[str, float] = {}
+    timings_ms: Dict[str, float] = {}
 
 
 class ResumeSummary(BaseModel):
     summary: str
+    pages: Optional[List[PageExtraction]] = None
 
 
 class ResumeAnalysis(BaseModel):
     answer: str
     justification: str
     resume_summary: str
+    cascade: Optional[CascadeTrace] = None
+    pages: Optional[List[PageExtraction]] = None
 
 
 class AnalyzeResponse(RootModel[Dict[str, Union[ResumeAnalysis, ResumeSummary]]]):  # noqa: E501
     pass
+
+
+class RankedCandidate(BaseModel):
+    rank: int
+    filename: str
+    score: float
+    evaluated: bool
+    resume_summary: str
+    answer: Optional[str] = None
+    justification: Optional[str] = None
+    cascade: Optional[CascadeTrace] = None
+
+
+class RankingResponse(BaseModel):
+    query: str
+    top_k: int
+    min_score: float
+    ranking: List[RankedCandidate]
@@ -0,0 +1,38 @@
+# app/schemas/jobs.py
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+
+class JobSubmitted(BaseModel):
+    job_id: str
+    status: str
+    total: int
+
+
+class JobFileStatus(BaseModel):
+    filename: str
+    state: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
+class JobStatus(BaseModel):
+    job_id: str
+    request_id: str
+    user_id: str
+    query: Optional[str] = None
+    status: str
+    created_at: str
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+    total: int
+    completed: int
+    files: List[JobFileStatus]
+
+
+class JobResults(BaseModel):
+    job_id: str
+    status: str
+    completed: int
+    total: int
+    results: Dict[str, Any]
@@ -0,0 +1,34 @@
+# app/schemas/resumes.py
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class ResumeMatch(BaseModel):
+    resume_id: str
+    filename: Optional[str] = None
+    summary: str
+    skills: List[str] = []
+    job_titles: List[str] = []
+    experience_years: Optional[str] = None
+    updated_at: Optional[str] = None
+    score: float
+    matched_terms: List[str] = []
+
+
+class ResumeSearchResponse(BaseModel):
+    query: str
+    skills: List[str]
+    took_ms: float
+    results: List[ResumeMatch]
+
+
+class StoredResume(BaseModel):
+    resume_id: str
+    filename: Optional[str] = None
+    text: Optional[str] = None
+    summary: str
+    skills: List[str] = []
+    job_titles: List[str] = []
+    experience_years: Optional[str] = None
+    sections_found: List[str] = []
+    updated_at: Optional[str] = None
@@ -0,0 +1,156 @@
+# app/services/batching.py
+"""Agendador de micro-batches para modelos compartilhados entre requisições"""
+
+import contextvars
+import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from app.services import metrics, profiling
+
+logger = logging.getLogger(__name__)
+
+batch_sizes = metrics.registry.histogram(
+    "resume_batch_size",
+    "Itens por lote disparado em cada micro-batcher",
+    ("batcher",),
+    buckets=(1, 2, 4, 8, 16, 32)
+)
+
+
+class MicroBatcher:
+    """
+    Agrupa itens enviados por threads diferentes em um único lote.
+
+    Um lote é disparado quando atinge `max_batch_size` itens ou quando o
+    primeiro item do lote espera `max_wait_ms`. `batch_fn` recebe a lista de
+    itens e deve devolver uma lista de resultados na mesma ordem; cada
+    resultado volta para quem enviou o item correspondente.
+
+    Argumentos nomeados passados a `submit` (ex.: `max_length`) vão para
+    `batch_fn`; itens com argumentos diferentes saem em lotes separados.
+
+    O lote roda na thread do agendador, fora do contexto das requisições:
+    quem chama mede a espera (ver `completion`), e o lote é perfilado se
+    alguma das requisições dele estiver sendo perfilada.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 20
+    ):
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._batch_sizes: Counter = Counter()
+        self._items = 0
+
+    def _ensure_started(self) -> None:
+        # A thread é criada no primeiro uso (e recriada após um fork),
+        # pois threads não sobrevivem ao fork de workers
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"batcher-{self.name}",
+                daemon=True
+            )
+            self._thread.start()
+
+    def submit(self, item: Any, **kwargs) -> Future:
+        """Enfileira um item e retorna um Future com o seu resultado."""
+        self._ensure_started()
+        future: Future = Future()
+        group = tuple(sorted(kwargs.items()))
+        self._queue.put((item, group, future, contextvars.copy_context()))
+        return future
+
+    def __call__(self, item: Any, **kwargs) -> Any:
+        """Enfileira um item e aguarda o resultado."""
+        return self.submit(item, **kwargs).result()
+
+    def _collect(self) -> List[tuple]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _batch_fn_for(self, contexts: List[contextvars.Context]) -> Callable:  # noqa: E501
+        """`batch_fn` perfilada no profile da primeira requisição perfilada."""  # noqa: E501
+        for context in contexts:
+            fn = context.run(profiling.profiled, self.batch_fn)
+            if fn is not self.batch_fn:
+                return fn
+        return self.batch_fn
+
+    def _run(self) -> None:
+        while True:
+            groups: Dict[tuple, List[tuple]] = {}
+            for entry in self._collect():
+                groups.setdefault(entry[1], []).append(entry)
+            for group, batch in groups.items():
+                self._dispatch(batch, dict(group))
+
+    def _dispatch(self, batch: List[tuple], kwargs: Dict[str, Any]) -> None:
+        items = [item for item, _, _, _ in batch]
+        batch_fn = self._batch_fn_for([context for _, _, _, context in batch])  # noqa: E501
+
+        with self._lock:
+            self._batch_sizes[len(batch)] += 1
+            self._items += len(batch)
+        batch_sizes.observe(len(batch), batcher=self.name)
+
+        try:
+            outputs = batch_fn(items, **kwargs)
+            if len(outputs) != len(items):
+                raise RuntimeError(
+                    f"Lote de {len(items)} itens retornou {len(outputs)} resultados"  # noqa: E501
+                )
+        except Exception as e:
+            logger.error(f"Erro no lote de {self.name}: {str(e)}")
+            for _, _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        for (_, _, future, _), output in zip(batch, outputs):
+            future.set_result(output)
+
+    def stats(self) -> Dict[str, Any]:
+        """Histograma de tamanhos de lote e profundidade atual da fila."""
+        with self._lock:
+            batches = sum(self._batch_sizes.values())
+            return {
+                "batches": batches,
+                "items": self._items,
+                "mean_batch_size": self._items / batches if batches else 0.0,
+                "batch_sizes": dict(sorted(self._batch_sizes.items())),
+                "queue_depth": self._queue.qsize()
+            }
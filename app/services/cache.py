@@ -0,0 +1,373 @@
+# app/services/cache.py
+"""Cache de resultados endereçado por conteúdo (memória + segundo nível)"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config import (
+    CACHE_BACKEND,
+    CACHE_DIR,
+    CACHE_ENABLED,
+    CACHE_MAX_ITEMS,
+    CACHE_TTL_SECONDS
+)
+from app.services import metrics
+from app.services.mongo import mongo_client
+
+logger = logging.getLogger(__name__)
+
+cache_requests = metrics.registry.counter(
+    "resume_cache_requests_total",
+    "Consultas aos caches por resultado e nível que respondeu",
+    ("cache", "result", "tier")
+)
+
+_MISSING = object()
+
+# Eventos de cache da requisição atual (ativados por `track_events`)
+_events: ContextVar[Optional[List[dict]]] = ContextVar("cache_events", default=None)  # noqa: E501
+
+
+def hash_bytes(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+# Dataclasses que podem ser lidas do segundo nível (ver `register_type`)
+_TYPES: Dict[str, type] = {}
+
+
+def register_type(cls: type) -> type:
+    """
+    Permite guardar instâncias do dataclass `cls` no segundo nível. Só
+    tipos registrados são recriados na leitura.
+    """
+    _TYPES[cls.__name__] = cls
+    return cls
+
+
+def _to_json(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__type__": type(value).__name__,
+            **{
+                field.name: _to_json(getattr(value, field.name))
+                for field in dataclasses.fields(value)
+            }
+        }
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    return value
+
+
+def _from_json(obj: dict) -> Any:
+    name = obj.pop("__type__", None)
+    if name is None:
+        return obj
+    if name not in _TYPES:
+        raise ValueError(f"Tipo não registrado no cache: {name}")
+    return _TYPES[name](**obj)
+
+
+def dumps(value: Any) -> str:
+    """Serializa em JSON (tuplas viram listas; dataclasses levam o tipo)."""
+    return json.dumps(_to_json(value), ensure_ascii=False)
+
+
+def loads(data: str) -> Any:
+    return json.loads(data, object_hook=_from_json)
+
+
+class LRUCache:
+    """Cache em memória com limite de itens e expiração por TTL."""
+
+    def __init__(
+        self,
+        max_items: int = CACHE_MAX_ITEMS,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_items = max(1, max_items)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._items: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return _MISSING
+            stored_at, value = entry
+            if self.ttl_seconds > 0 and self._clock() - stored_at > self.ttl_seconds:  # noqa: E501
+                del self._items[key]
+                return _MISSING
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = (self._clock(), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class DiskTier:
+    """Segundo nível em disco: um arquivo JSON por chave."""
+
+    name = "disk"
+
+    def __init__(self, directory: str = CACHE_DIR, ttl_seconds: float = CACHE_TTL_SECONDS):  # noqa: E501
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hash_text(key) + ".json")
+
+    def get(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            if self.ttl_seconds > 0 and time.time() - os.path.getmtime(path) > self.ttl_seconds:  # noqa: E501
+                os.remove(path)
+                return _MISSING
+            with open(path, encoding="utf-8") as f:
+                return loads(f.read())
+        except FileNotFoundError:
+            return _MISSING
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(dumps(value))
+        os.replace(tmp_path, path)
+
+
+class MongoTier:
+    """Segundo nível no MongoDB, com índice TTL em `created_at`."""
+
+    name = "mongo"
+
+    def __init__(self, uri: Optional[str] = None, ttl_seconds: float = CACHE_TTL_SECONDS):  # noqa: E501
+        self.collection = mongo_client(uri)["resume_analyzer"]["cache"]
+        if ttl_seconds > 0:
+            self.collection.create_index(
+                "created_at", expireAfterSeconds=int(ttl_seconds)
+            )
+
+    def get(self, key: str) -> Any:
+        doc = self.collection.find_one({"_id": key})
+        if doc is None:
+            return _MISSING
+        return loads(doc["value"])
+
+    def set(self, key: str, value: Any) -> None:
+        from datetime import datetime, timezone
+
+        self.collection.replace_one(
+            {"_id": key},
+            {
+                "_id": key,
+                "value": dumps(value),
+                "created_at": datetime.now(timezone.utc)
+            },
+            upsert=True
+        )
+
+
+def _build_second_tier():
+    if CACHE_BACKEND == "disk":
+        return DiskTier()
+    if CACHE_BACKEND == "mongo":
+        return MongoTier()
+    return None
+
+
+class TieredCache:
+    """
+    Cache nomeado em dois níveis: LRU em memória e, opcionalmente, disco
+    ou MongoDB. Acertos no segundo nível são promovidos para a memória.
+    Falhas do segundo nível nunca interrompem a requisição.
+
+    `second_tier` pode ser o próprio nível ou uma função que o cria,
+    chamada apenas no primeiro acesso.
+    """
+
+    def __init__(self, name: str, memory: Optional[LRUCache] = None, second_tier=None):  # noqa: E501
+        self.name = name
+        self.memory = memory or LRUCache()
+        self._second_tier = second_tier
+
+    @property
+    def second_tier(self):
+        if callable(self._second_tier):
+            self._second_tier = self._second_tier()
+        return self._second_tier
+
+    def _key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def get(self, key: str) -> Tuple[bool, Any, Optional[str]]:
+        """Retorna (acerto, valor, nível que respondeu)."""
+        full_key = self._key(key)
+        value = self.memory.get(full_key)
+        if value is not _MISSING:
+            return True, value, "memory"
+
+        if self.second_tier is not None:
+            try:
+                value = self.second_tier.get(full_key)
+            except Exception as e:
+                logger.warning(f"Erro ao ler cache {self.name}: {str(e)}")
+                value = _MISSING
+            if value is not _MISSING:
+                self.memory.set(full_key, value)
+                return True, value, self.second_tier.name
+
+        return False, None, None
+
+    def set(self, key: str, value: Any) -> None:
+        full_key = self._key(key)
+        self.memory.set(full_key, value)
+        if self.second_tier is not None:
+            try:
+                self.second_tier.set(full_key, value)
+            except Exception as e:
+                logger.warning(f"Erro ao gravar cache {self.name}: {str(e)}")
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """Consulta o cache registrando o acesso (para uso em lotes)."""
+        if not CACHE_ENABLED:
+            return False, None
+
+        start = time.perf_counter()
+        hit, value, tier = self.get(key)
+        record_event(self.name, hit, tier, time.perf_counter() - start)
+        return hit, value
+
+    def store(self, key: str, value: Any) -> None:
+        if CACHE_ENABLED:
+            self.set(key, value)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        should_store: Callable[[Any], bool] = lambda value: True
+    ) -> Any:
+        """Consulta o cache e, em caso de falta, calcula e armazena."""
+        if not CACHE_ENABLED:
+            return compute()
+
+        start = time.perf_counter()
+        hit, value, tier = self.get(key)
+        if not hit:
+            value = compute()
+            if should_store(value):
+                self.set(key, value)
+
+        record_event(self.name, hit, tier, time.perf_counter() - start)
+        return value
+
+
+def record_event(name: str, hit: bool, tier: Optional[str], seconds: float) -> None:  # noqa: E501
+    """Registra no log (e na requisição atual) um acesso ao cache."""
+    elapsed_ms = seconds * 1000
+    cache_requests.inc(cache=name, result="hit" if hit else "miss", tier=tier or "")  # noqa: E501
+    if hit:
+        logger.info(f"Cache {name}: acerto ({tier}) em {elapsed_ms:.1f}ms")
+    else:
+        logger.info(f"Cache {name}: falta, calculado em {elapsed_ms:.1f}ms")
+
+    events = _events.get()
+    if events is not None:
+        events.append({
+            "cache": name,
+            "hit": hit,
+            "tier": tier,
+            "ms": round(elapsed_ms, 2)
+        })
+
+
+def start_tracking() -> List[dict]:
+    """
+    Inicia a coleta de eventos de cache no contexto atual. Cada requisição
+    roda em sua própria task, então a coleta termina junto com ela.
+    """
+    events: List[dict] = []
+    _events.set(events)
+    return events
+
+
+@contextmanager
+def track_events():
+    """Coleta os eventos de cache do contexto atual (e das threads dele)."""
+    events: List[dict] = []
+    token = _events.set(events)
+    try:
+        yield events
+    finally:
+        _events.reset(token)
+
+
+_shared_tier = None
+_shared_tier_lock = threading.Lock()
+
+
+def shared_second_tier():
+    """Segundo nível configurado (CACHE_BACKEND), criado no primeiro uso."""
+    global _shared_tier
+    with _shared_tier_lock:
+        if _shared_tier is None and CACHE_BACKEND:
+            try:
+                _shared_tier = _build_second_tier()
+            except Exception as e:
+                logger.error(f"Erro ao iniciar cache {CACHE_BACKEND}: {str(e)}")  # noqa: E501
+        return _shared_tier
+
+
+ocr_cache = TieredCache("ocr", second_tier=shared_second_tier)
+summary_cache = TieredCache("summary", second_tier=shared_second_tier)
+answer_cache = TieredCache("answer", second_tier=shared_second_tier)
+chunk_cache = TieredCache("chunks", second_tier=shared_second_tier)
+
+
+def clear_memory() -> None:
+    """Esvazia o nível em memória de todos os caches."""
+    for tiered in (ocr_cache, summary_cache, answer_cache, chunk_cache):
+        tiered.memory.clear()
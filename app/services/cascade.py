@@ -0,0 +1,114 @@
+# app/services/cascade.py
+"""Cascata de estágios de resposta com limiares de confiança"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+cascade_answers = metrics.registry.counter(
+    "resume_cascade_answers_total",
+    "Respostas da cascata por estágio que respondeu e se atingiu o limiar",
+    ("stage", "accepted")
+)
+
+
+@dataclass
+class StageResult:
+    answer: str
+    justification: str
+    confidence: float
+
+
+# Um estágio recebe (contexto, pergunta) e devolve um resultado ou None
+# quando não tem o que dizer
+Stage = Callable[[str, str], Optional[StageResult]]
+
+
+class StageError(Exception):
+    """Falha possivelmente transitória de um estágio (ex.: modelo)."""
+
+
+class Cascade:
+    """
+    Executa os estágios em ordem e para no primeiro cuja confiança atinge
+    o limiar configurado para ele. Se nenhum atingir, fica o resultado de
+    maior confiança. Cada execução registra qual estágio respondeu e
+    quanto tempo cada um levou.
+    """
+
+    def __init__(
+        self,
+        stages: List[Tuple[str, Stage]],
+        thresholds: Optional[Dict[str, float]] = None
+    ):
+        self.stages = stages
+        self.thresholds = thresholds or {}
+
+    def fingerprint(self) -> str:
+        """Estágios e limiares, para invalidar o cache quando mudarem."""
+        names = ">".join(name for name, _ in self.stages)
+        thresholds = ",".join(f"{k}={v:g}" for k, v in sorted(self.thresholds.items()))  # noqa: E501
+        return f"{names}|{thresholds}"
+
+    def run(self, context: str, question: str) -> Tuple[dict, bool]:
+        """
+        Retorna a análise (com o campo `cascade`) e se ela pode ir para o
+        cache, o que não acontece quando algum estágio falhou.
+        """
+        timings: Dict[str, float] = {}
+        confidences: Dict[str, float] = {}
+        best: Optional[Tuple[str, StageResult]] = None
+        accepted = None
+        cacheable = True
+
+        for name, stage in self.stages:
+            start = time.perf_counter()
+            try:
+                result = stage(context, question)
+            except StageError as e:
+                logger.warning(f"Estágio {name} falhou: {str(e)}")
+                result = None
+                cacheable = False
+            elapsed = time.perf_counter() - start
+            metrics.record_stage(f"cascade.{name}", elapsed)
+            timings[name] = round(elapsed * 1000, 2)
+
+            if result is None:
+                continue
+            confidences[name] = round(result.confidence, 3)
+            if best is None or result.confidence > best[1].confidence:
+                best = (name, result)
+            if result.confidence >= self.thresholds.get(name, 0.0):
+                accepted = (name, result)
+                break
+
+        stage_name, result = accepted or best or (None, None)
+        if result is None:
+            result = StageResult(
+                "Não",
+                "Não foi possível analisar o currículo para a pergunta.",
+                0.0
+            )
+
+        cascade_answers.inc(stage=stage_name or "none", accepted=str(accepted is not None).lower())  # noqa: E501
+        logger.info(
+            f"Cascata respondeu em {stage_name or 'nenhum estágio'} "
+            f"(confiança {result.confidence:.2f}, "
+            f"{sum(timings.values()):.1f}ms): {timings}"
+        )
+        return {
+            "answer": result.answer,
+            "justification": result.justification,
+            "cascade": {
+                "stage": stage_name,
+                "confidence": round(result.confidence, 3),
+                "accepted": accepted is not None,
+                "confidences": confidences,
+                "timings_ms": timings
+            }
+        }, cacheable
@@ -0,0 +1,113 @@
+# app/services/chunking.py
+"""Divisão de textos em blocos que cabem na janela de tokens do modelo"""
+
+import re
+from typing import Callable, List, Tuple
+
+# Contador de tokens do modelo (sem tokens especiais)
+TokenCounter = Callable[[str], int]
+
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.;!?])\s+')
+
+
+def token_counter(tokenizer) -> TokenCounter:
+    """Contador de tokens a partir de um tokenizer do transformers."""
+    return lambda text: len(tokenizer(text, add_special_tokens=False)["input_ids"])  # noqa: E501
+
+
+def _split_long(text: str, max_tokens: int, count_tokens: TokenCounter) -> List[str]:  # noqa: E501
+    """Quebra por palavras um trecho que sozinho excede `max_tokens`."""
+    pieces, current = [], []
+    for word in text.split():
+        candidate = " ".join(current + [word])
+        if current and count_tokens(candidate) > max_tokens:
+            pieces.append(" ".join(current))
+            current = [word]
+        else:
+            current.append(word)
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def _units(
+    sections: List[str],
+    max_tokens: int,
+    count_tokens: TokenCounter
+) -> List[Tuple[str, int, bool]]:
+    """Frases de cada seção: (texto, tokens, começa uma seção)."""
+    units = []
+    for section in sections:
+        first = True
+        for sentence in SENTENCE_BOUNDARY.split(section.strip()):
+            if not sentence:
+                continue
+            tokens = count_tokens(sentence)
+            parts = [sentence] if tokens <= max_tokens else _split_long(sentence, max_tokens, count_tokens)  # noqa: E501
+            for part in parts:
+                units.append((part, count_tokens(part) if len(parts) > 1 else tokens, first))  # noqa: E501
+                first = False
+    return units
+
+
+def chunk_sections(
+    sections: List[str],
+    max_tokens: int,
+    overlap_tokens: int,
+    count_tokens: TokenCounter
+) -> List[str]:
+    """
+    Agrupa as frases das seções em blocos de até `max_tokens` tokens.
+    Um bloco cheio é cortado de preferência no início de uma seção (se
+    ela começar depois da metade do bloco); o bloco seguinte repete as
+    últimas frases do anterior, até `overlap_tokens` tokens.
+    """
+    max_tokens = max(1, max_tokens)
+    overlap_tokens = max(0, min(overlap_tokens, max_tokens // 2))
+    units = _units(sections, max_tokens, count_tokens)
+
+    chunks: List[str] = []
+    current: List[Tuple[str, int, bool]] = []
+    size = 0
+
+    def overlap_from(previous):
+        carried, carried_size = [], 0
+        for unit in reversed(previous):
+            if carried_size + unit[1] > overlap_tokens:
+                break
+            carried.insert(0, (unit[0], unit[1], False))
+            carried_size += unit[1]
+        return carried, carried_size
+
+    for unit in units:
+        if current and size + unit[1] > max_tokens:
+            cut = len(current)
+            for i in range(len(current) - 1, 0, -1):
+                if current[i][2] and sum(u[1] for u in current[:i]) >= max_tokens // 2:  # noqa: E501
+                    cut = i
+                    break
+            chunks.append(" ".join(u[0] for u in current[:cut]))
+            carried, carried_size = overlap_from(current[:cut])
+            current = carried + current[cut:]
+            size = carried_size + sum(u[1] for u in current[len(carried):])
+            # Sem espaço para a sobreposição: começa só com o restante
+            while current and size + unit[1] > max_tokens and carried:
+                size -= carried.pop(0)[1]
+                current.pop(0)
+        current.append(unit)
+        size += unit[1]
+
+    if current:
+        chunks.append(" ".join(u[0] for u in current))
+    return chunks
+
+
+def truncate_to_tokens(text: str, max_tokens: int, count_tokens: TokenCounter) -> Tuple[str, bool]:  # noqa: E501
+    """
+    Mantém as frases iniciais que cabem em `max_tokens` tokens.
+    Retorna o texto e se algo foi cortado.
+    """
+    if count_tokens(text) <= max_tokens:
+        return text, False
+    chunks = chunk_sections([text], max_tokens, 0, count_tokens)
+    return (chunks[0] if chunks else ""), True
@@ -0,0 +1,125 @@
+# app/services/executors.py
+"""Pools de threads nomeados para as etapas de processamento"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, TypeVar
+
+from app.config import (
+    OCR_FILE_WORKERS,
+    OCR_PAGE_WORKERS,
+    QA_WORKERS,
+    SUMMARIZE_WORKERS,
+    TORCH_THREADS,
+    WEB_CONCURRENCY
+)
+from app.services import profiling
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Pools separados para arquivos e páginas: uma tarefa de arquivo aguarda
+# as tarefas de página, então compartilhar o pool poderia travar.
+# O tamanho de cada pool limita a concorrência da etapa.
+EXECUTOR_SIZES: Dict[str, int] = {
+    "ocr_files": OCR_FILE_WORKERS,
+    "ocr_pages": OCR_PAGE_WORKERS,
+    "summarize": SUMMARIZE_WORKERS,
+    "qa": QA_WORKERS,
+    # Indexação no repositório de currículos, fora do caminho da resposta
+    "index": 1,
+}
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+_torch_configured = False
+
+
+def torch_threads() -> int:
+    """Threads intra-op do torch para não sobrecarregar a CPU com os workers"""  # noqa: E501
+    if TORCH_THREADS > 0:
+        return TORCH_THREADS
+    workers = max(1, OCR_PAGE_WORKERS) * max(1, WEB_CONCURRENCY)
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def configure_torch_threads() -> None:
+    """Ajusta uma única vez o número de threads do torch no processo."""
+    global _torch_configured
+    with _lock:
+        if _torch_configured:
+            return
+        _torch_configured = True
+
+    try:
+        import torch
+    except ImportError:
+        return
+
+    threads = torch_threads()
+    torch.set_num_threads(threads)
+    logger.info(f"torch configurado com {threads} thread(s) por worker")
+
+
+def get_executor(name: str) -> ThreadPoolExecutor:
+    """Retorna (criando sob demanda) o pool de threads da etapa `name`."""
+    with _lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max(1, EXECUTOR_SIZES[name]),
+                thread_name_prefix=name,
+                initializer=configure_torch_threads
+            )
+            _executors[name] = executor
+        return executor
+
+
+def map_ordered(name: str, fn: Callable[[T], R], items: Iterable[T]) -> List[R]:  # noqa: E501
+    """Distribui `fn` pelo pool `name` e devolve os resultados na ordem."""
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    fn = profiling.profiled(fn)
+    calls = [(contextvars.copy_context(), item) for item in items]
+    return list(get_executor(name).map(lambda call: call[0].run(fn, call[1]), calls))  # noqa: E501
+
+
+def submit(name: str, fn: Callable[..., R], *args, **kwargs) -> "Future[R]":
+    """`submit` no pool `name`, propagando o contexto da thread atual."""
+    context = contextvars.copy_context()
+    return get_executor(name).submit(context.run, profiling.profiled(fn), *args, **kwargs)  # noqa: E501
+
+
+async def run(name: str, fn: Callable[..., R], *args, **kwargs) -> R:
+    """
+    Executa `fn` no pool `name` sem bloquear o event loop.
+    O contexto (contextvars) da requisição é propagado para a thread.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, profiling.profiled(fn), *args, **kwargs)  # noqa: E501
+    return await loop.run_in_executor(get_executor(name), call)
+
+
+def queue_sizes() -> Dict[str, int]:
+    """Tarefas aguardando uma thread livre em cada pool já criado."""
+    with _lock:
+        executors = dict(_executors)
+    return {name: executor._work_queue.qsize() for name, executor in executors.items()}  # noqa: E501
+
+
+def shutdown(wait: bool = True) -> None:
+    """Encerra todos os pools criados."""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
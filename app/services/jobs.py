@@ -0,0 +1,398 @@
+# app/services/jobs.py
+"""Jobs de análise em lote: envio, acompanhamento e resultados parciais"""
+
+import asyncio
+import copy
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from app.config import (
+    JOBS_BACKEND,
+    JOBS_HEARTBEAT_SECONDS,
+    JOBS_MAX_CONCURRENCY,
+    JOBS_MAX_FINISHED,
+    JOBS_RETENTION_SECONDS,
+    JOBS_SHUTDOWN_TIMEOUT,
+    JOBS_STALE_SECONDS
+)
+from app.services import logger as log_sink
+from app.services import metrics, pipeline
+from app.services.mongo import mongo_client
+from app.services.uploads import remove_uploads
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+FILE_PENDING = "pending"
+FILE_PROCESSING = "processing"
+FILE_DONE = "done"
+FILE_ERROR = "error"
+
+UNFINISHED = (STATUS_QUEUED, STATUS_RUNNING)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class InMemoryJobStore:
+    """
+    Estado dos jobs em memória do processo (padrão). Jobs encerrados são
+    descartados após `retention_seconds` ou quando passam de
+    `max_finished`, do mais antigo para o mais novo.
+    """
+
+    def __init__(
+        self,
+        retention_seconds: float = JOBS_RETENTION_SECONDS,
+        max_finished: int = JOBS_MAX_FINISHED,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.retention_seconds = retention_seconds
+        self.max_finished = max(1, max_finished)
+        self._clock = clock
+        self._jobs: Dict[str, dict] = {}
+        # job_id -> instante em que terminou, em ordem de término
+        self._finished: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self) -> None:
+        now = self._clock()
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            expired = self.retention_seconds > 0 and now - finished_at > self.retention_seconds  # noqa: E501
+            if not expired and len(self._finished) <= self.max_finished:
+                break
+            del self._finished[job_id]
+            self._jobs.pop(job_id, None)
+
+    def create(self, job: dict) -> None:
+        with self._lock:
+            self._evict()
+            self._jobs[job["job_id"]] = copy.deepcopy(job)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            self._evict()
+            job = self._jobs.get(job_id)
+            return copy.deepcopy(job) if job else None
+
+    def update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            self._jobs[job_id].update(fields)
+            if fields.get("status") in (STATUS_COMPLETED, STATUS_FAILED):
+                self._finished[job_id] = self._clock()
+                self._evict()
+
+    def update_file(self, job_id: str, index: int, **fields) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job["files"][index].update(fields)
+            if fields.get("state") in (FILE_DONE, FILE_ERROR):
+                job["completed"] += 1
+
+    def touch(self, job_ids: List[str], heartbeat_at: float) -> None:
+        with self._lock:
+            for job_id in job_ids:
+                if job_id in self._jobs:
+                    self._jobs[job_id]["heartbeat_at"] = heartbeat_at
+
+    def fail_stale(self, before: float, error: str) -> int:
+        """Marca como falhos os jobs não encerrados sem heartbeat desde `before`."""  # noqa: E501
+        with self._lock:
+            stale = [
+                job_id for job_id, job in self._jobs.items()
+                if job["status"] in UNFINISHED and job.get("heartbeat_at", 0) < before  # noqa: E501
+            ]
+        for job_id in stale:
+            self.update(job_id, status=STATUS_FAILED, error=error, finished_at=_now())  # noqa: E501
+        return len(stale)
+
+
+class MongoJobStore:
+    """Estado dos jobs na coleção `jobs` do MongoDB."""
+
+    def __init__(self, uri: Optional[str] = None):
+        self.collection = mongo_client(uri)["resume_analyzer"]["jobs"]
+        self.collection.create_index("job_id", unique=True)
+
+    def create(self, job: dict) -> None:
+        self.collection.insert_one(copy.deepcopy(job))
+
+    def get(self, job_id: str) -> Optional[dict]:
+        return self.collection.find_one({"job_id": job_id}, {"_id": 0})
+
+    def update(self, job_id: str, **fields) -> None:
+        self.collection.update_one({"job_id": job_id}, {"$set": fields})
+
+    def update_file(self, job_id: str, index: int, **fields) -> None:
+        update = {"$set": {f"files.{index}.{k}": v for k, v in fields.items()}}  # noqa: E501
+        if fields.get("state") in (FILE_DONE, FILE_ERROR):
+            update["$inc"] = {"completed": 1}
+        self.collection.update_one({"job_id": job_id}, update)
+
+    def touch(self, job_ids: List[str], heartbeat_at: float) -> None:
+        self.collection.update_many(
+            {"job_id": {"$in": list(job_ids)}},
+            {"$set": {"heartbeat_at": heartbeat_at}}
+        )
+
+    def fail_stale(self, before: float, error: str) -> int:
+        result = self.collection.update_many(
+            {"status": {"$in": list(UNFINISHED)}, "heartbeat_at": {"$lt": before}},  # noqa: E501
+            {"$set": {"status": STATUS_FAILED, "error": error, "finished_at": _now()}}  # noqa: E501
+        )
+        return result.modified_count
+
+
+def create_store():
+    if JOBS_BACKEND == "mongo":
+        return MongoJobStore()
+    return InMemoryJobStore()
+
+
+class JobManager:
+    """
+    Recebe jobs e processa seus arquivos em segundo plano, com no máximo
+    `max_concurrency` arquivos em andamento somando todos os jobs.
+    Cada arquivo passa pelas mesmas etapas de `pipeline.analyze_file`.
+
+    Jobs em andamento renovam `heartbeat_at` a cada `heartbeat_seconds`;
+    no startup (`recover`), os que estão sem heartbeat há
+    `stale_seconds` (processo que caiu) são marcados como falhos. No
+    encerramento (`shutdown`), os que não terminarem a tempo são
+    cancelados e marcados como falhos.
+    """
+
+    def __init__(
+        self,
+        store=None,
+        max_concurrency: int = JOBS_MAX_CONCURRENCY,
+        heartbeat_seconds: float = JOBS_HEARTBEAT_SECONDS,
+        stale_seconds: float = JOBS_STALE_SECONDS
+    ):
+        self._store = store
+        self.max_concurrency = max(1, max_concurrency)
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stale_seconds = stale_seconds
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._running: Set[str] = set()
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    @property
+    def store(self):
+        # Criado no primeiro uso para não conectar ao banco no import
+        if self._store is None:
+            self._store = create_store()
+        return self._store
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Criado dentro do event loop em execução
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def submit(
+        self,
+        uploads: List[Tuple[str, pipeline.Content]],
+        request_id: str,
+        user_id: str,
+        query: Optional[str] = None
+    ) -> str:
+        """Registra o job e agenda o processamento; retorna o id do job."""
+        job_id = str(uuid.uuid4())
+        job = {
+            "job_id": job_id,
+            "request_id": request_id,
+            "user_id": user_id,
+            "query": query,
+            "status": STATUS_QUEUED,
+            "created_at": _now(),
+            "heartbeat_at": time.time(),
+            "finished_at": None,
+            "total": len(uploads),
+            "completed": 0,
+            "files": [
+                {
+                    "filename": filename,
+                    "state": FILE_PENDING,
+                    "result": None,
+                    "started_at": None,
+                    "finished_at": None
+                }
+                for filename, _ in uploads
+            ]
+        }
+        await asyncio.to_thread(self.store.create, job)
+
+        self._running.add(job_id)
+        task = asyncio.create_task(self._run(job_id, uploads, request_id, user_id, query))  # noqa: E501
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if self._heartbeat is None or self._heartbeat.done():
+            self._heartbeat = asyncio.create_task(self._beat())
+        return job_id
+
+    async def _beat(self) -> None:
+        """Renova o heartbeat dos jobs deste processo enquanto houver algum."""  # noqa: E501
+        while self._running:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                await asyncio.to_thread(self.store.touch, list(self._running), time.time())  # noqa: E501
+            except Exception as e:
+                logger.error(f"Erro ao renovar o heartbeat dos jobs: {str(e)}")  # noqa: E501
+
+    async def _fail(self, job_id: str, error: str) -> None:
+        try:
+            await asyncio.to_thread(
+                self.store.update, job_id,
+                status=STATUS_FAILED, error=error, finished_at=_now()
+            )
+        except Exception as store_error:
+            logger.error(f"Erro ao marcar o job {job_id} como falho: {str(store_error)}")  # noqa: E501
+
+    async def recover(self) -> int:
+        """Marca como falhos os jobs abandonados por processos que caíram."""
+        try:
+            count = await asyncio.to_thread(
+                self.store.fail_stale,
+                time.time() - self.stale_seconds,
+                "Job interrompido: o processo que o executava foi encerrado"
+            )
+        except Exception as e:
+            logger.error(f"Erro ao recuperar jobs abandonados: {str(e)}")
+            return 0
+        if count:
+            logger.warning(f"{count} job(s) abandonado(s) marcado(s) como falho(s)")  # noqa: E501
+        return count
+
+    async def shutdown(self, timeout: float = JOBS_SHUTDOWN_TIMEOUT) -> None:
+        """Aguarda os jobs em andamento por até `timeout` e cancela o resto."""  # noqa: E501
+        tasks = set(self._tasks)
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"{len(pending)} job(s) cancelado(s) no encerramento")  # noqa: E501
+                await asyncio.gather(*pending, return_exceptions=True)
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            await asyncio.gather(self._heartbeat, return_exceptions=True)
+            self._heartbeat = None
+
+    async def _process_file(
+        self,
+        job_id: str,
+        index: int,
+        filename: str,
+        content: pipeline.Content,
+        query: Optional[str]
+    ) -> dict:
+        async with self._get_semaphore():
+            await asyncio.to_thread(
+                self.store.update_file, job_id, index,
+                state=FILE_PROCESSING, started_at=_now()
+            )
+            try:
+                result = await pipeline.analyze_file(filename, content, query)
+                state = FILE_DONE
+            except Exception as e:
+                logger.error(f"Erro no job {job_id} ({filename}): {str(e)}")
+                result = {"error": f"Erro durante análise: {str(e)}"}
+                state = FILE_ERROR
+            finally:
+                # O upload em disco só é usado pelo OCR deste arquivo
+                remove_uploads([(filename, content)])
+
+            await asyncio.to_thread(
+                self.store.update_file, job_id, index,
+                state=state, result=result, finished_at=_now()
+            )
+            return result
+
+    async def _run(
+        self,
+        job_id: str,
+        uploads: List[Tuple[str, pipeline.Content]],
+        request_id: str,
+        user_id: str,
+        query: Optional[str]
+    ) -> None:
+        timings = metrics.start_request_timing()
+        try:
+            await asyncio.to_thread(self.store.update, job_id, status=STATUS_RUNNING)  # noqa: E501
+            results = await asyncio.gather(*(
+                self._process_file(job_id, index, filename, content, query)
+                for index, (filename, content) in enumerate(uploads)
+            ))
+            await asyncio.to_thread(
+                self.store.update, job_id,
+                status=STATUS_COMPLETED, finished_at=_now()
+            )
+        except asyncio.CancelledError:
+            await self._fail(job_id, "Job interrompido pelo encerramento do servidor")  # noqa: E501
+            raise
+        except Exception as e:
+            # Sem isso a task morre calada e o job fica "running" para sempre
+            logger.exception(f"Job {job_id} falhou: {str(e)}")
+            await self._fail(job_id, str(e))
+            return
+        finally:
+            self._running.discard(job_id)
+            remove_uploads(uploads)
+        logger.info(f"Job {job_id} concluído ({len(uploads)} arquivo(s))")
+
+        filenames = [filename for filename, _ in uploads]
+        log_sink.save_log({
+            "request_id": request_id,
+            "job_id": job_id,
+            "user_id": user_id,
+            "timestamp": _now(),
+            "query": query,
+            "files_processed": len(uploads),
+            "filenames": filenames,
+            "resultado": dict(zip(filenames, results)),
+            "timings": timings.as_dict()
+        })
+
+    def status(self, job_id: str) -> Optional[dict]:
+        """Estado do job e de cada arquivo, sem os resultados."""
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        job["files"] = [
+            {k: v for k, v in file.items() if k != "result"}
+            for file in job["files"]
+        ]
+        return job
+
+    def results(self, job_id: str) -> Optional[dict]:
+        """Resultados dos arquivos já concluídos."""
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        return {
+            "job_id": job_id,
+            "status": job["status"],
+            "completed": job["completed"],
+            "total": job["total"],
+            "results": {
+                file["filename"]: file["result"]
+                for file in job["files"]
+                if file["state"] in (FILE_DONE, FILE_ERROR)
+            }
+        }
+
+
+job_manager = JobManager()
@@ -1,11 +1,176 @@
 # app/services/logger.py
-import pymongo
-from app.config import MONGO_URI
+"""Gravação assíncrona dos logs de requisições no MongoDB"""
 
-client = pymongo.MongoClient(MONGO_URI)
-db = client["resume_analyzer"]
-collection = db["logs"]
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config import (
+    LOG_BATCH_SIZE,
+    LOG_FLUSH_INTERVAL,
+    LOG_QUEUE_SIZE,
+    LOG_SPILL_PATH
+)
+from app.services import metrics
+from app.services.mongo import mongo_client
+
+logger = logging.getLogger(__name__)
+
+logs_total = metrics.registry.counter(
+    "resume_logs_total",
+    "Logs de requisições gravados no MongoDB ou no arquivo local",
+    ("destination",)
+)
+
+
+def _mongo_collection():
+    return mongo_client()["resume_analyzer"]["logs"]
+
+
+class InMemoryCollection:
+    """Substituto em processo da coleção do MongoDB (para testes)."""
+
+    def __init__(self):
+        self.documents: List[dict] = []
+        self._lock = threading.Lock()
+
+    def insert_one(self, document: dict):
+        with self._lock:
+            self.documents.append(document)
+
+    def insert_many(self, documents: List[dict], ordered: bool = True):
+        with self._lock:
+            self.documents.extend(documents)
+
+
+class LogSink:
+    """
+    Fila limitada de logs com uma thread que grava em lote (`insert_many`)
+    ao atingir `batch_size` documentos ou a cada `flush_interval` segundos.
+
+    Se a fila estiver cheia ou o banco indisponível, os documentos são
+    gravados em um arquivo JSONL local (`spill_path`) em vez de perdidos.
+    """
+
+    def __init__(
+        self,
+        collection: Optional[Any] = None,
+        collection_factory: Callable[[], Any] = _mongo_collection,
+        max_queue: int = LOG_QUEUE_SIZE,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        spill_path: str = LOG_SPILL_PATH
+    ):
+        self._collection = collection
+        self._collection_factory = collection_factory
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.spill_path = spill_path
+        self._queue: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=max_queue)  # noqa: E501
+        self._lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._stats = {"written": 0, "spilled": 0, "failed_batches": 0}
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            self._collection = self._collection_factory()
+        return self._collection
+
+    def start(self) -> None:
+        """Inicia a thread de gravação (também recriada após um fork)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():  # noqa: E501
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="log-sink",
+                daemon=True
+            )
+            self._thread.start()
+
+    def save(self, document: dict) -> None:
+        """Enfileira o documento sem bloquear a requisição."""
+        self.start()
+        try:
+            self._queue.put_nowait(document)
+        except queue.Full:
+            logger.warning("Fila de logs cheia, gravando em arquivo local")
+            self._spill([document])
+
+    def _collect(self) -> Tuple[List[dict], bool]:
+        batch: List[dict] = []
+        stop = False
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=max(remaining, 0.001))
+            except queue.Empty:
+                break
+            if item is None:
+                stop = True
+                break
+            batch.append(item)
+        return batch, stop
+
+    def _run(self) -> None:
+        while True:
+            batch, stop = self._collect()
+            if batch:
+                self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch: List[dict]) -> None:
+        try:
+            with metrics.track("log.write"):
+                self.collection.insert_many(batch, ordered=False)
+            logs_total.inc(len(batch), destination="mongo")
+            with self._lock:
+                self._stats["written"] += len(batch)
+        except Exception as e:
+            logger.error(f"Erro ao gravar {len(batch)} log(s) no MongoDB: {str(e)}")  # noqa: E501
+            with self._lock:
+                self._stats["failed_batches"] += 1
+            self._spill(batch)
+
+    def _spill(self, documents: List[dict]) -> None:
+        try:
+            with self._spill_lock, open(self.spill_path, "a", encoding="utf-8") as f:  # noqa: E501
+                for document in documents:
+                    f.write(json.dumps(document, default=str, ensure_ascii=False) + "\n")  # noqa: E501
+            logs_total.inc(len(documents), destination="spill")
+            with self._lock:
+                self._stats["spilled"] += len(documents)
+        except Exception as e:
+            logger.error(f"Erro ao gravar logs em {self.spill_path}: {str(e)}")
+
+    def stop(self, timeout: float = 10) -> None:
+        """Grava o que estiver na fila e encerra a thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "queue_depth": self._queue.qsize()}
+
+
+sink = LogSink()
 
 
 def save_log(log_data: dict):
-    collection.insert_one(log_data)
+    sink.save(log_data)
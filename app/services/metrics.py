@@ -0,0 +1,257 @@
+# app/services/metrics.py
+"""Métricas em processo (formato texto do Prometheus) e tempos por etapa"""
+
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Limites (segundos) dos histogramas de latência: de 1ms a 2min
+LATENCY_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0
+)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:  # noqa: E501
+    parts = [
+        f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'  # noqa: E501
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))  # noqa: E501
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()):  # noqa: E501
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]  # noqa: E501
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"  # noqa: E501
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):  # noqa: E501
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            # [contagem por faixa..., soma, total]
+            data = self._values.setdefault(key, [0.0] * (len(self.buckets) + 2))  # noqa: E501
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data[i] += 1
+                    break
+            data[-2] += value
+            data[-1] += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            data = self._values.get(self._key(labels))
+            return int(data[-1]) if data else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(data)) for key, data in self._values.items())  # noqa: E501
+        lines = self.header()
+        for key, data in items:
+            cumulative = 0.0
+            for i, bound in enumerate(self.buckets):
+                cumulative += data[i]
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')  # noqa: E501
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")  # noqa: E501
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(data[-2])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(data[-1])}")  # noqa: E501
+        return lines
+
+
+class Gauge(_Metric):
+    """Valor lido no momento da coleta, por uma função por conjunto de rótulos."""  # noqa: E501
+
+    kind = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._callbacks: Dict[LabelValues, Callable[[], float]] = {}
+
+    def set_function(self, fn: Callable[[], float], **labels) -> None:
+        with self._lock:
+            self._callbacks[self._key(labels)] = fn
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._callbacks.items())
+        lines = self.header()
+        for key, fn in items:
+            try:
+                value = float(fn())
+            except Exception:
+                continue
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")  # noqa: E501
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, *args, **kwargs)
+                self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames=()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, tuple(labelnames))  # noqa: E501
+
+    def histogram(self, name: str, help_text: str, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:  # noqa: E501
+        return self._get_or_create(Histogram, name, help_text, tuple(labelnames), buckets)  # noqa: E501
+
+    def gauge(self, name: str, help_text: str, labelnames=()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, tuple(labelnames))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        lines: List[str] = []
+        for _, metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+stage_seconds = registry.histogram(
+    "resume_stage_duration_seconds",
+    "Duração de cada etapa do processamento",
+    ("stage",)
+)
+stage_errors = registry.counter(
+    "resume_stage_errors_total",
+    "Etapas que terminaram com exceção",
+    ("stage",)
+)
+
+
+class RequestTimings:
+    """Tempo acumulado por etapa dentro de uma requisição."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, List[float]] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._stages.setdefault(stage, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """{etapa: {"ms": total, "count": chamadas}}"""
+        with self._lock:
+            return {
+                stage: {"ms": round(total * 1000, 2), "count": int(count)}
+                for stage, (total, count) in self._stages.items()
+            }
+
+
+# Tempos da requisição atual (ativados por `start_request_timing`);
+# `executors.run` copia o contexto, então as threads também registram
+_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)  # noqa: E501
+
+
+def start_request_timing() -> RequestTimings:
+    """Inicia a coleta dos tempos por etapa no contexto atual."""
+    timings = RequestTimings()
+    _timings.set(timings)
+    return timings
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    stage_seconds.observe(seconds, stage=stage)
+    timings = _timings.get()
+    if timings is not None:
+        timings.add(stage, seconds)
+
+
+@contextmanager
+def track(stage: str):
+    """Mede o bloco como a etapa `stage`."""
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        stage_errors.inc(stage=stage)
+        raise
+    finally:
+        record_stage(stage, time.perf_counter() - start)
+
+
+def timed(stage: str):
+    """Decorador equivalente a `track(stage)`."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with track(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def render() -> str:
+    return registry.render()
@@ -0,0 +1,105 @@
+# app/services/models.py
+"""Registro de modelos carregados sob demanda (lazy) ou via warmup"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRegistry:
+    """
+    Guarda funções de carga de modelos e só as executa no primeiro uso
+    (`get`) ou no warmup. Cada modelo é carregado uma única vez, mesmo
+    com chamadas concorrentes.
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._models: Dict[str, Any] = {}
+        self._errors: Dict[str, str] = {}
+        self._load_seconds: Dict[str, float] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        """Registra a função que carrega o modelo `name`."""
+        with self._lock:
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+
+    def set(self, name: str, model: Any) -> None:
+        """Define diretamente a instância de um modelo (ex.: stubs)."""
+        with self._lock:
+            self._locks.setdefault(name, threading.Lock())
+            self._models[name] = model
+            self._errors.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Retorna o modelo `name`, carregando-o se necessário."""
+        model = self._models.get(name)
+        if model is not None:
+            return model
+
+        with self._locks[name]:
+            model = self._models.get(name)
+            if model is not None:
+                return model
+
+            logger.info(f"Carregando modelo: {name}")
+            start = time.perf_counter()
+            try:
+                model = self._loaders[name]()
+            except Exception as e:
+                self._errors[name] = str(e)
+                raise
+            elapsed = time.perf_counter() - start
+
+            self._models[name] = model
+            self._load_seconds[name] = elapsed
+            self._errors.pop(name, None)
+            logger.info(f"Modelo {name} carregado em {elapsed:.2f}s")
+            return model
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def warmup(self, names: Optional[Iterable[str]] = None) -> None:
+        """Carrega antecipadamente os modelos (todos, por padrão)."""
+        for name in list(names or self._loaders):
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.error(f"Erro no warmup do modelo {name}: {str(e)}")
+
+    def ready(self, lazy: bool = False) -> bool:
+        """
+        Indica se todos os modelos registrados estão carregados. Com
+        `lazy` (sem warmup) os modelos só carregam no primeiro uso, então
+        o processo já está pronto para receber tráfego.
+        """
+        if lazy:
+            return True
+        return all(name in self._models for name in self._loaders)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Estado de carga de cada modelo registrado."""
+        status = {}
+        for name in set(self._loaders) | set(self._models):
+            if name in self._models:
+                state = "loaded"
+            elif name in self._errors:
+                state = "error"
+            else:
+                state = "pending"
+            status[name] = {
+                "state": state,
+                "load_seconds": self._load_seconds.get(name),
+                "error": self._errors.get(name)
+            }
+        return status
+
+
+registry = ModelRegistry()
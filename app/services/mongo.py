@@ -0,0 +1,22 @@
+# app/services/mongo.py
+"""Cliente MongoDB com os limites de pool e timeout configurados"""
+
+from typing import Optional
+
+from app.config import MONGO_CONNECT_TIMEOUT_MS, MONGO_MAX_POOL_SIZE, MONGO_URI
+
+
+def mongo_client(uri: Optional[str] = None):
+    """
+    Cria um MongoClient com MONGO_MAX_POOL_SIZE e MONGO_CONNECT_TIMEOUT_MS,
+    para que um banco indisponível não trave threads nem requisições.
+    """
+    import pymongo
+
+    return pymongo.MongoClient(
+        uri or MONGO_URI,
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+        connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+        serverSelectionTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+        socketTimeoutMS=MONGO_CONNECT_TIMEOUT_MS
+    )
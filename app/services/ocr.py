@@ -1,14 +1,70 @@
 from PIL import Image
-import easyocr
 import io
-from pdf2image import convert_from_bytes
+import subprocess
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from pdf2image import (
+    convert_from_bytes,
+    convert_from_path,
+    pdfinfo_from_bytes,
+    pdfinfo_from_path
+)
 from pdf2image.exceptions import PDFPageCountError
 import numpy as np
 import logging
+from app.config import (
+    OCR_LANGUAGES,
+    OCR_MAX_IMAGE_SIDE,
+    OCR_MAX_REQUEST_MEMORY_MB,
+    OCR_PAGE_WINDOW,
+    OCR_PDF_DPI,
+    PDF_MAX_PAGES,
+    PDF_TEXT_LAYER_ENABLED,
+    PDF_TEXT_MIN_ALNUM_RATIO,
+    PDF_TEXT_MIN_CHARS,
+    PDF_TEXT_TIMEOUT
+)
+from app.services import executors, metrics
+from app.services.cache import hash_bytes, hash_file, ocr_cache, register_type  # noqa: E501
+from app.services.models import registry
+from app.services.reader_pool import reader_pool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+METHOD_TEXT_LAYER = "text_layer"
+METHOD_OCR = "ocr"
+
+# Conteúdo do arquivo em memória ou caminho do arquivo em disco
+Source = Union[bytes, str]
+
+
+def _load_readers():
+    """Carrega os leitores EasyOCR do pool para o conjunto padrão de idiomas"""  # noqa: E501
+    reader_pool.warmup()
+    return reader_pool
+
+
+registry.register("easyocr", _load_readers)
+
+
+@register_type
+@dataclass
+class PageExtraction:
+    """Origem do texto de uma página (camada de texto ou OCR)"""
+    page: int
+    method: str
+    chars: int
+
+
+@register_type
+@dataclass
+class ExtractionResult:
+    """Texto extraído de um arquivo e o caminho usado em cada página"""
+    text: str
+    pages: List[PageExtraction] = field(default_factory=list)
+
 
 def preprocess_image(image_array):
     """Converte imagem para escala de cinza e redimensiona se necessário"""
@@ -18,8 +74,8 @@ def preprocess_image(image_array):
         image = image.convert('L')
 
     width, height = image.size
-    if width > 2000 or height > 2000:
-        ratio = min(2000 / width, 2000 / height)
+    if width > OCR_MAX_IMAGE_SIDE or height > OCR_MAX_IMAGE_SIDE:
+        ratio = min(OCR_MAX_IMAGE_SIDE / width, OCR_MAX_IMAGE_SIDE / height)
         image = image.resize(
             (int(width * ratio), int(height * ratio)),
             Image.Resampling.LANCZOS
@@ -31,18 +87,18 @@ def preprocess_image(image_array):
 def extract_text_from_image(image_array):
     """Executa OCR com EasyOCR em uma imagem"""
     try:
-        processed_image = preprocess_image(image_array)
+        with metrics.track("ocr.preprocess"):
+            processed_image = preprocess_image(image_array)
 
-        # Lazy load do EasyOCR
-        reader = easyocr.Reader(['pt', 'en'])
-
-        result = reader.readtext(
-            processed_image,
-            paragraph=True,
-            detail=0,
-            width_ths=0.9,
-            height_ths=0.9
-        )
+        # Reutiliza um leitor já carregado do pool do processo
+        with reader_pool.acquire() as reader, metrics.track("ocr.easyocr"):
+            result = reader.readtext(
+                processed_image,
+                paragraph=True,
+                detail=0,
+                width_ths=0.9,
+                height_ths=0.9
+            )
 
         text = " ".join(result) if isinstance(result, list) else str(result)
         return text.strip()
@@ -52,61 +108,281 @@ def extract_text_from_image(image_array):
         return f"[ERRO OCR]: {str(e)}"
 
 
-def extract_text(filename: str, content_bytes: bytes) -> str:
+def extract_pdf_text_layer(
+    source: Source,
+    first_page: int = 1,
+    last_page: int = PDF_MAX_PAGES
+) -> Optional[List[str]]:
     """
-    Extrai texto de arquivos enviados (PDFs ou imagens).
-    Não aplica filtro de qualidade — retorna todo o texto possível.
+    Lê a camada de texto embutida no PDF via `pdftotext` (poppler), a
+    partir do caminho do arquivo ou do conteúdo (via stdin).
+    Retorna uma lista com o texto de cada página ou None se não for possível.
     """
+    from_path = isinstance(source, str)
     try:
-        logger.info(f"Iniciando extração de: {filename}")
+        with metrics.track("ocr.text_layer"):
+            completed = subprocess.run(
+                [
+                    "pdftotext",
+                    "-f", str(first_page),
+                    "-l", str(last_page),
+                    "-enc", "UTF-8",
+                    source if from_path else "-", "-"
+                ],
+                input=None if from_path else source,
+                capture_output=True,
+                timeout=PDF_TEXT_TIMEOUT,
+                check=True
+            )
+    except FileNotFoundError:
+        logger.warning("pdftotext não encontrado, usando apenas OCR")
+        return None
+    except subprocess.TimeoutExpired:
+        logger.warning("Tempo esgotado ao ler a camada de texto do PDF")
+        return None
+    except subprocess.CalledProcessError as e:
+        logger.warning(f"pdftotext falhou (código {e.returncode})")
+        return None
 
-        if filename.lower().endswith(".pdf"):
-            try:
-                images = convert_from_bytes(
-                    content_bytes,
-                    dpi=300,
-                    first_page=1,
-                    last_page=10
-                )
+    output = completed.stdout.decode("utf-8", errors="replace")
+    # pdftotext separa as páginas com form feed e termina com um extra
+    pages = output.split("\f")
+    if pages and not pages[-1].strip():
+        pages = pages[:-1]
+    return pages or None
+
+
+def is_usable_text(text: str) -> bool:
+    """Indica se o texto da camada do PDF é aproveitável (não vazio nem lixo)"""  # noqa: E501
+    stripped = "".join(text.split())
+    if len(stripped) < PDF_TEXT_MIN_CHARS:
+        return False
+
+    if stripped.count("\ufffd") / len(stripped) > 0.05:
+        return False
+
+    alnum = sum(1 for char in stripped if char.isalnum())
+    return alnum / len(stripped) >= PDF_TEXT_MIN_ALNUM_RATIO
+
+
+def max_pages_in_memory() -> int:
+    """
+    Quantidade de páginas rasterizadas mantidas em memória ao mesmo tempo,
+    limitada pelo orçamento por requisição (escala de cinza, 1 byte/pixel).
+    """
+    page_bytes = OCR_MAX_IMAGE_SIDE * OCR_MAX_IMAGE_SIDE
+    budget_bytes = OCR_MAX_REQUEST_MEMORY_MB * 1024 * 1024
+    return max(1, budget_bytes // page_bytes)
+
+
+def page_window_size() -> int:
+    """Quantidade de páginas rasterizadas por chamada ao poppler."""
+    return max(1, min(OCR_PAGE_WINDOW, max_pages_in_memory()))
+
+
+def _page_windows(pages: Iterable[int], window: int) -> Iterator[Tuple[int, int]]:  # noqa: E501
+    """Agrupa páginas consecutivas em intervalos de no máximo `window`"""
+    first = last = None
+    for page in sorted(set(pages)):
+        if first is not None and page == last + 1 and page - first < window:
+            last = page
+            continue
+        if first is not None:
+            yield first, last
+        first = last = page
+    if first is not None:
+        yield first, last
+
+
+def iter_pdf_pages(
+    source: Source,
+    pages: Iterable[int]
+) -> Iterator[Tuple[int, Image.Image]]:
+    """
+    Rasteriza as páginas pedidas sob demanda, uma janela por vez, já em
+    escala de cinza e no tamanho máximo usado pelo OCR.
+    Cada imagem só fica referenciada aqui até ser entregue ao consumidor.
+    """
+    convert = convert_from_path if isinstance(source, str) else convert_from_bytes  # noqa: E501
+    for first, last in _page_windows(pages, page_window_size()):
+        with metrics.track("ocr.rasterize"):
+            images = convert(
+                source,
+                dpi=OCR_PDF_DPI,
+                first_page=first,
+                last_page=last,
+                grayscale=True,
+                size=OCR_MAX_IMAGE_SIDE
+            )
+        for offset in range(len(images)):
+            image, images[offset] = images[offset], None
+            yield first + offset, image
+        del images
+
+
+def _extract_pdf(source: Source) -> ExtractionResult:
+    """
+    Usa a camada de texto das páginas que a possuem e aplica OCR somente
+    nas páginas vazias ou com texto ilegível, rasterizando-as em streaming.
+    """
+    text_layer = None
+    if PDF_TEXT_LAYER_ENABLED:
+        text_layer = extract_pdf_text_layer(source)
+
+    page_texts = {}
+    if text_layer:
+        for idx, layer_text in enumerate(text_layer):
+            if is_usable_text(layer_text):
+                page_texts[idx + 1] = layer_text.strip()
+        total_pages = len(text_layer)
+    else:
+        info = pdfinfo_from_path(source) if isinstance(source, str) else pdfinfo_from_bytes(source)  # noqa: E501
+        total_pages = min(int(info["Pages"]), PDF_MAX_PAGES)
+
+    if total_pages < 1:
+        return ExtractionResult("[ERRO]: PDF sem páginas processáveis.")
+
+    ocr_pages = [
+        page for page in range(1, total_pages + 1) if page not in page_texts
+    ]
+    if ocr_pages and text_layer:
+        logger.info(f"Páginas sem camada de texto útil, aplicando OCR: {ocr_pages}")  # noqa: E501
+
+    # As páginas são distribuídas pelo pool de OCR conforme são
+    # rasterizadas; o número de páginas pendentes respeita o orçamento
+    # de memória da requisição.
+    ocr_texts = {}
+    pending = deque()
+    limit = max(1, max_pages_in_memory() - page_window_size() + 1)
 
-                if not images:
-                    return "[ERRO]: PDF sem páginas processáveis."
+    for page, image in iter_pdf_pages(source, ocr_pages):
+        logger.info(f"Página {page} de {total_pages}")
+        pending.append((page, executors.submit("ocr_pages", extract_text_from_image, image)))  # noqa: E501
+        del image
+        while len(pending) >= limit:
+            done_page, future = pending.popleft()
+            ocr_texts[done_page] = future.result()
 
-                full_text = ""
-                for idx, image in enumerate(images):
-                    logger.info(f"Página {idx+1} de {len(images)}")
-                    image_array = np.array(image)
-                    page_text = extract_text_from_image(image_array)
+    while pending:
+        done_page, future = pending.popleft()
+        ocr_texts[done_page] = future.result()
 
-                    if page_text:
-                        full_text += page_text + "\n\n"
-                    else:
-                        logger.warning(f"Nenhum texto extraído na página {idx+1}")  # noqa: E501
+    texts = []
+    pages = []
+    for page in range(1, total_pages + 1):
+        if page in page_texts:
+            page_text, method = page_texts[page], METHOD_TEXT_LAYER
+        else:
+            page_text, method = ocr_texts.get(page, ""), METHOD_OCR
+
+        pages.append(PageExtraction(page, method, len(page_text)))
+        if page_text:
+            texts.append(page_text)
+        else:
+            logger.warning(f"Nenhum texto extraído na página {page}")
 
-                return full_text.strip() or "[AVISO]: Nenhum texto extraído do PDF."  # noqa: E501
+    full_text = "\n\n".join(texts)
+    return ExtractionResult(
+        full_text or "[AVISO]: Nenhum texto extraído do PDF.",
+        pages
+    )
+
+
+def _extract_document(filename: str, source: Source) -> ExtractionResult:
+    """
+    Extrai texto de arquivos enviados (PDFs ou imagens), informando por
+    página se o texto veio da camada do PDF ou do OCR.
+    Não aplica filtro de qualidade — retorna todo o texto possível.
+    """
+    try:
+        logger.info(f"Iniciando extração de: {filename}")
+
+        if filename.lower().endswith(".pdf"):
+            try:
+                return _extract_pdf(source)
 
             except PDFPageCountError:
-                return "[ERRO]: PDF vazio ou inválido."
+                return ExtractionResult("[ERRO]: PDF vazio ou inválido.")
             except Exception as e:
                 logger.error(f"Erro no processamento do PDF: {str(e)}")
-                return f"[ERRO PDF]: {str(e)}"
+                return ExtractionResult(f"[ERRO PDF]: {str(e)}")
 
         else:
             try:
-                image = Image.open(io.BytesIO(content_bytes))
+                image = Image.open(source if isinstance(source, str) else io.BytesIO(source))  # noqa: E501
 
                 if image.mode == 'RGBA':
                     image = image.convert('RGB')
 
                 image_array = np.array(image)
-                text = extract_text_from_image(image_array)
+                text = extract_text_from_image(image_array).strip()
 
-                return text.strip() or "[AVISO]: Nenhum texto extraído da imagem."  # noqa: E501
+                return ExtractionResult(
+                    text or "[AVISO]: Nenhum texto extraído da imagem.",
+                    [PageExtraction(1, METHOD_OCR, len(text))]
+                )
 
             except Exception as e:
                 logger.error(f"Erro no processamento da imagem: {str(e)}")
-                return f"[ERRO IMAGEM]: {str(e)}"
+                return ExtractionResult(f"[ERRO IMAGEM]: {str(e)}")
 
     except Exception as e:
         logger.error(f"Erro geral na extração: {str(e)}")
-        return f"[ERRO GERAL]: {str(e)}"
+        return ExtractionResult(f"[ERRO GERAL]: {str(e)}")
+
+
+def extraction_settings(kind: str) -> str:
+    """
+    Configurações que mudam o texto extraído, para a chave do cache:
+    idiomas e tamanho máximo da imagem no OCR e, em PDFs, DPI, limite de
+    páginas e critérios da camada de texto.
+    """
+    settings = f"{','.join(OCR_LANGUAGES)}:{OCR_MAX_IMAGE_SIDE}"
+    if kind == "pdf":
+        text_layer = f"{PDF_TEXT_MIN_CHARS}:{PDF_TEXT_MIN_ALNUM_RATIO:g}" if PDF_TEXT_LAYER_ENABLED else "off"  # noqa: E501
+        settings += f":{OCR_PDF_DPI}:{PDF_MAX_PAGES}:{text_layer}"
+    return settings
+
+
+def extract_document(
+    filename: str,
+    source: Source,
+    content_hash: Optional[str] = None
+) -> ExtractionResult:
+    """
+    Extrai texto de arquivos enviados (PDFs ou imagens), em memória ou em
+    disco (caminho), reaproveitando o resultado de arquivos idênticos já
+    processados (chave: hash do conteúdo, calculado no upload).
+    Resultados com erro não são armazenados.
+    """
+    if content_hash is None:
+        content_hash = hash_file(source) if isinstance(source, str) else hash_bytes(source)  # noqa: E501
+    kind = "pdf" if filename.lower().endswith(".pdf") else "image"
+    key = f"{kind}:{content_hash}:{extraction_settings(kind)}"
+    return ocr_cache.get_or_compute(
+        key,
+        lambda: _extract_document(filename, source),
+        should_store=lambda result: not result.text.startswith("[ERRO")
+    )
+
+
+def extract_documents(
+    files: Iterable[Tuple[str, Source]]
+) -> List[ExtractionResult]:
+    """
+    Extrai o texto de vários arquivos em paralelo (pool `ocr_files`),
+    devolvendo os resultados na mesma ordem recebida.
+    """
+    return executors.map_ordered(
+        "ocr_files",
+        lambda item: extract_document(*item),
+        files
+    )
+
+
+def extract_text(filename: str, source: Source) -> str:
+    """
+    Extrai texto de arquivos enviados (PDFs ou imagens).
+    Não aplica filtro de qualidade — retorna todo o texto possível.
+    """
+    return extract_document(filename, source).text
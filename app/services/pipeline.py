@@ -0,0 +1,192 @@
+# app/services/pipeline.py
+"""Etapas assíncronas da análise de um currículo (OCR, resumo e vaga)"""
+
+import logging
+import time
+from concurrent.futures import Future
+from dataclasses import asdict
+from typing import Dict, List, Optional, Union
+
+from app.config import RESUME_STORE_ENABLED
+from app.services import (
+    executors,
+    metrics,
+    ocr,
+    question_answering,
+    summarizer
+)
+from app.services.resume_store import resume_repository
+from app.services.uploads import SpooledUpload
+
+# Upload em disco (rotas) ou em memória; None quando a leitura falhou
+Content = Optional[Union[SpooledUpload, bytes]]
+
+logger = logging.getLogger(__name__)
+
+pages_total = metrics.registry.counter(
+    "resume_pages_total",
+    "Páginas extraídas por origem do texto (camada do PDF ou OCR)",
+    ("method",)
+)
+document_pages = metrics.registry.histogram(
+    "resume_document_pages",
+    "Páginas por documento enviado",
+    buckets=metrics.COUNT_BUCKETS
+)
+
+
+async def extract(filename: str, content: Content):
+    """Etapa de OCR de um arquivo, executada no pool `ocr_files`."""
+    if content is None:
+        return "Erro ao processar arquivo: falha na leitura do upload", []
+
+    # Uploads em disco vão para o OCR pelo caminho, com o hash já calculado
+    if isinstance(content, SpooledUpload):
+        source, content_hash = content.path, content.sha256
+    else:
+        source, content_hash = content, None
+
+    try:
+        with metrics.track("extract"):
+            extraction = await executors.run(
+                "ocr_files", ocr.extract_document, filename, source, content_hash  # noqa: E501
+            )
+        text = extraction.text
+        pages = [asdict(page) for page in extraction.pages]
+        document_pages.observe(len(pages))
+        for page in pages:
+            pages_total.inc(method=page["method"])
+
+        if not text or len(text.strip()) < 20:
+            logger.warning(f"Texto extraído muito curto para {filename}")  # noqa: E501
+            text = f"Erro: Não foi possível extrair texto suficiente de {filename}"  # noqa: E501
+
+        return text, pages
+
+    except Exception as e:
+        logger.error(f"Erro ao processar {filename}: {str(e)}")
+        return f"Erro ao processar arquivo: {str(e)}", []
+
+
+async def summarize_all(filenames: List[str], texts: List[str]) -> List[str]:  # noqa: E501
+    """
+    Etapa de sumarização de todos os arquivos em um único lote, executada
+    no pool `summarize`. Textos de erro do OCR são repassados sem resumo.
+    """
+    indexes = [i for i, text in enumerate(texts) if not text.startswith("Erro")]  # noqa: E501
+    summaries = list(texts)
+    if not indexes:
+        return summaries
+
+    try:
+        with metrics.track("summarize"):
+            batch = await executors.run(
+                "summarize",
+                summarizer.summarize_texts,
+                [texts[i] for i in indexes]
+            )
+    except Exception as e:
+        logger.error(f"Erro ao gerar resumos: {str(e)}")
+        batch = [f"Erro ao gerar resumo: {str(e)}"] * len(indexes)
+
+    for i, summary in zip(indexes, batch):
+        summaries[i] = summary
+        logger.info(f"Resumo gerado para {filenames[i]}: {summary[:100]}...")  # noqa: E501
+
+    if RESUME_STORE_ENABLED:
+        store_resumes(
+            [filenames[i] for i in indexes],
+            [texts[i] for i in indexes],
+            [summaries[i] for i in indexes]
+        )
+    return summaries
+
+
+def store_resumes(
+    filenames: List[str],
+    texts: List[str],
+    summaries: List[str]
+) -> "Future[None]":
+    """
+    Agenda no pool `index` a indexação dos currículos resumidos com
+    sucesso, sem que a resposta espere pelo repositório (ou pelo banco).
+    """
+    def _save_all():
+        for filename, text, summary in zip(filenames, texts, summaries):
+            if summary.startswith("Erro"):
+                continue
+            try:
+                resume_repository.save(filename, text, summary)
+            except Exception as e:
+                logger.error(f"Erro ao indexar {filename}: {str(e)}")
+
+    return executors.submit("index", _save_all)
+
+
+async def answer(filename: str, summary: str, query: str) -> dict:
+    """Etapa de análise da vaga de um arquivo, executada no pool `qa`."""
+    try:
+        if summary.startswith("Erro"):
+            return {
+                "answer": "Erro",
+                "justification": summary
+            }
+
+        with metrics.track("answer"):
+            analysis = await executors.run(
+                "qa",
+                question_answering.analyze_resume_for_position,
+                summary,
+                query
+            )
+        result = {
+            "answer": analysis["answer"],
+            "justification": analysis["justification"],
+            "resume_summary": summary
+        }
+        if "cascade" in analysis:
+            result["cascade"] = analysis["cascade"]
+        return result
+    except Exception as e:
+        logger.error(f"Erro na análise de {filename}: {str(e)}")
+        return {
+            "answer": "Erro",
+            "justification": f"Erro durante análise: {str(e)}"
+        }
+
+
+async def analyze_file(
+    filename: str,
+    content: Content,
+    query: Optional[str] = None,
+    timings: Optional[Dict[str, float]] = None
+) -> dict:
+    """
+    Executa todas as etapas para um único arquivo.
+    Se `timings` for informado, recebe a duração (ms) de cada etapa.
+    """
+    timings = {} if timings is None else timings
+    start = time.perf_counter()
+
+    text, pages = await extract(filename, content)
+    timings["ocr"] = _elapsed_ms(start)
+
+    stage_start = time.perf_counter()
+    summary = (await summarize_all([filename], [text]))[0]
+    timings["summarize"] = _elapsed_ms(stage_start)
+
+    if query:
+        stage_start = time.perf_counter()
+        result = await answer(filename, summary, query)
+        timings["qa"] = _elapsed_ms(stage_start)
+    else:
+        result = {"summary": summary}
+
+    if pages:
+        result["pages"] = pages
+    timings["total"] = _elapsed_ms(start)
+    return result
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
@@ -0,0 +1,153 @@
+# app/services/profiling.py
+"""Profiling opcional (cProfile) de uma requisição, inclusive nas threads"""
+
+import cProfile
+import functools
+import hmac
+import logging
+import os
+import pstats
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, TypeVar
+
+from app.config import (
+    PROFILING_DIR,
+    PROFILING_ENABLED,
+    PROFILING_SAMPLE_RATE,
+    PROFILING_TOKEN,
+    PROFILING_TOP_N
+)
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# Profile da requisição atual; `executors` o leva para as threads
+_active: ContextVar[Optional["RequestProfile"]] = ContextVar("request_profile", default=None)  # noqa: E501
+
+# Cada thread aceita um único cProfile ativo por vez
+_thread_state = threading.local()
+
+
+class RequestProfile:
+    """
+    Junta os perfis (cProfile) de todas as threads que trabalharam para
+    uma requisição. O event loop não é perfilado: ele é compartilhado
+    com as outras requisições.
+    """
+
+    def __init__(self, request_id: str, reason: str):
+        self.request_id = request_id
+        self.reason = reason
+        self._stats: Optional[pstats.Stats] = None
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def section(self):
+        """Perfila o bloco na thread atual."""
+        if getattr(_thread_state, "busy", False):
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        _thread_state.busy = True
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            _thread_state.busy = False
+            with self._lock:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profiler)
+                else:
+                    self._stats.add(profiler)
+
+    def top(self, n: Optional[int] = None) -> List[Dict]:
+        """Funções com mais tempo próprio (tottime)."""
+        n = PROFILING_TOP_N if n is None else n
+        with self._lock:
+            if self._stats is None:
+                return []
+            entries = self._stats.stats.items()
+            ranked = sorted(entries, key=lambda item: item[1][2], reverse=True)[:n]  # noqa: E501
+        return [
+            {
+                "function": f"{os.path.basename(filename)}:{line}({name})",
+                "calls": calls,
+                "tottime_ms": round(tottime * 1000, 2),
+                "cumtime_ms": round(cumtime * 1000, 2)
+            }
+            for (filename, line, name), (_, calls, tottime, cumtime, _) in ranked  # noqa: E501
+        ]
+
+    def dump(self, directory: Optional[str] = None) -> Optional[str]:
+        """Grava o perfil (formato pstats) e retorna o caminho."""
+        directory = PROFILING_DIR if directory is None else directory
+        with self._lock:
+            if self._stats is None or not directory:
+                return None
+            os.makedirs(directory, exist_ok=True)
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+            path = os.path.join(directory, f"{stamp}_{self.request_id}.prof")
+            self._stats.dump_stats(path)
+            return path
+
+    def finish(self, directory: Optional[str] = None, top_n: Optional[int] = None) -> Dict:  # noqa: E501
+        """Grava o perfil e devolve o resumo das funções mais caras."""
+        try:
+            path = self.dump(directory)
+        except OSError as e:
+            logger.error(f"Erro ao gravar profile em {directory or PROFILING_DIR}: {str(e)}")  # noqa: E501
+            path = None
+        summary = {
+            "reason": self.reason,
+            "wall_ms": round((time.perf_counter() - self._start) * 1000, 2),
+            "file": path,
+            "top": self.top(top_n)
+        }
+        logger.info(f"Profile da requisição {self.request_id} ({self.reason}) em {path}")  # noqa: E501
+        return summary
+
+
+def should_profile(header_token: Optional[str]) -> Optional[str]:
+    """
+    Motivo para perfilar a requisição ("header" ou "sample"), ou None.
+    O cabeçalho só vale se for igual ao PROFILING_TOKEN configurado.
+    """
+    if not PROFILING_ENABLED:
+        return None
+    if header_token and PROFILING_TOKEN and hmac.compare_digest(header_token, PROFILING_TOKEN):  # noqa: E501
+        return "header"
+    if PROFILING_SAMPLE_RATE > 0 and random.random() < PROFILING_SAMPLE_RATE:
+        return "sample"
+    return None
+
+
+def start(request_id: str, reason: str) -> RequestProfile:
+    """Ativa o profiling no contexto atual (e nas threads dele)."""
+    profile = RequestProfile(request_id, reason)
+    _active.set(profile)
+    return profile
+
+
+def profiled(fn: Callable[..., R]) -> Callable[..., R]:
+    """
+    `fn` perfilada se houver profile ativo no contexto de quem chama;
+    caso contrário, a própria `fn` (custo de uma leitura de contextvar).
+    """
+    profile = _active.get()
+    if profile is None:
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with profile.section():
+            return fn(*args, **kwargs)
+    return wrapper
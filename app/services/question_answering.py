@@ -1,13 +1,63 @@
 # app/services/question_answering.py
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-import torch
+import logging
 import re
+from typing import List, Optional
+from app.config import (
+    CASCADE_KEYWORD_THRESHOLD,
+    CASCADE_LEXICAL_THRESHOLD,
+    CASCADE_STAGES,
+    QA_BATCH_MAX_SIZE,
+    QA_BATCH_MAX_WAIT_MS,
+    QA_BATCHING_ENABLED,
+    QA_PROMPT_MAX_TOKENS
+)
+from app.services import metrics
+from app.services.batching import MicroBatcher
+from app.services.cache import answer_cache, hash_text, normalize_query
+from app.services.cascade import Cascade, StageError, StageResult
+from app.services.chunking import token_counter, truncate_to_tokens
+from app.services.inference import (
+    InferenceProfile,
+    get_profile,
+    inference_mode,
+    prepare_model
+)
+from app.services.models import registry
+from app.services.ranking import tokenize
+from app.services.taxonomy import KIND_ROLE, KIND_SKILL, find_matches
+
+logger = logging.getLogger(__name__)
+
+QA_MODEL = "google/flan-t5-large"
+
+
+def _load_qa_model(profile: Optional[InferenceProfile] = None):
+    """Carrega tokenizer e modelo seq2seq usados na análise de vagas"""
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+
+    profile = profile or get_profile()
+    device = 0 if torch.cuda.is_available() else -1
+    tokenizer = AutoTokenizer.from_pretrained(QA_MODEL)
+    model = AutoModelForSeq2SeqLM.from_pretrained(QA_MODEL)
+    if device >= 0:
+        model = model.to(device)
+    model = prepare_model(model, device, profile)
+    return {
+        "tokenizer": tokenizer,
+        "model": model,
+        "device": device,
+        "profile": profile
+    }
+
+
+registry.register("qa", _load_qa_model)
+
+
+def get_qa_model() -> dict:
+    """Retorna tokenizer, modelo e device, carregando-os no primeiro uso."""
+    return registry.get("qa")
 
-device = 0 if torch.cuda.is_available() else -1
-tokenizer = AutoTokenizer.from_pretrained("google/flan-t5-large")
-model = AutoModelForSeq2SeqLM.from_pretrained("google/flan-t5-large")
-if device >= 0:
-    model = model.to(device)
 
 PROMPT_TEMPLATE = """
 Analise o currículo abaixo e responda se o candidato se enquadra para a 
@@ -30,22 +80,70 @@ Resposta:
 """
 
 
-def completion(prompt: str, max_length=800):
-    inputs = tokenizer(prompt, return_tensors="pt", truncation=True, max_length=800)  # noqa: E501
+def generate_batch(
+    prompts: List[str],
+    max_length=800,
+    qa: Optional[dict] = None
+) -> List[str]:
+    """
+    Executa um único `generate` para vários prompts (com padding), com a
+    decodificação do perfil de inferência com que o modelo foi carregado.
+    """
+    qa = qa or get_qa_model()
+    tokenizer, model, device = qa["tokenizer"], qa["model"], qa["device"]
+    profile = qa.get("profile") or get_profile()
+
+    # O orçamento já foi aplicado em build_prompt; o corte aqui é só garantia
+    inputs = tokenizer(prompts, return_tensors="pt", padding=True, truncation=True, max_length=QA_PROMPT_MAX_TOKENS)  # noqa: E501
     if device >= 0:
         inputs = {k: v.to(device) for k, v in inputs.items()}
 
-    outputs = model.generate(
-        **inputs,
-        max_length=max_length,
-        do_sample=False,
-        num_beams=3,
-        early_stopping=True,
-        pad_token_id=tokenizer.eos_token_id,
-        no_repeat_ngram_size=2,
-        temperature=0.1
-    )
-    return tokenizer.decode(outputs[0], skip_special_tokens=True).strip()
+    with metrics.track("qa.generate"), inference_mode():
+        outputs = model.generate(
+            **inputs,
+            **profile.qa_generation_kwargs(max_length),
+            pad_token_id=tokenizer.eos_token_id,
+            no_repeat_ngram_size=2
+        )
+    return [
+        text.strip()
+        for text in tokenizer.batch_decode(outputs, skip_special_tokens=True)  # noqa: E501
+    ]
+
+
+def build_prompt(context: str, question: str, tokenizer=None) -> str:
+    """
+    Monta o prompt dentro de QA_PROMPT_MAX_TOKENS tokens: o currículo é
+    cortado em fim de frase para caber junto com o modelo e a pergunta.
+    """
+    tokenizer = tokenizer or get_qa_model()["tokenizer"]
+    count_tokens = token_counter(tokenizer)
+    question = question.strip()
+
+    fixed = count_tokens(PROMPT_TEMPLATE.format(curriculo="", query=question))  # noqa: E501
+    budget = max(0, QA_PROMPT_MAX_TOKENS - fixed - 1)  # 1 = token de fim
+    resume, truncated = truncate_to_tokens(context.strip(), budget, count_tokens)  # noqa: E501
+    if truncated:
+        logger.warning(f"Currículo cortado para {budget} tokens no prompt (limite {QA_PROMPT_MAX_TOKENS})")  # noqa: E501
+    return PROMPT_TEMPLATE.format(curriculo=resume, query=question)
+
+
+# Agrupa prompts de requisições concorrentes em um único generate
+qa_batcher = MicroBatcher(
+    "qa",
+    generate_batch,
+    max_batch_size=QA_BATCH_MAX_SIZE,
+    max_wait_ms=QA_BATCH_MAX_WAIT_MS
+)
+
+
+def completion(prompt: str, max_length=800):
+    if QA_BATCHING_ENABLED:
+        # O `generate` roda na thread do batcher, sem os tempos da
+        # requisição: a espera pelo lote é medida aqui
+        with metrics.track("qa.batch"):
+            return qa_batcher(prompt, max_length=max_length)
+    return generate_batch([prompt], max_length=max_length)[0]
 
 
 def extract_answer_and_justification(text: str):
@@ -54,12 +152,11 @@ def extract_answer_and_justification(text: str):
     """
     text = text.strip()
 
-    # Debug: imprimir o texto original para análise
-    print(f"Texto original do modelo: '{text}'")
+    logger.debug(f"Texto original do modelo: '{text}'")
 
     # Verificar se o modelo retornou o texto dos exemplos/placeholders
     if "[justificativa" in text.lower() or "[cite tecnologias" in text.lower() or "[explique o que falta" in text.lower():  # noqa: E501
-        print("Modelo retornou placeholder - tentando fallback")
+        logger.warning("Modelo retornou placeholder - tentando fallback")
         return "Erro", "Modelo retornou resposta genérica. Tente novamente."
 
     # Padrões para capturar resposta e justificativa
@@ -114,65 +211,12 @@ def extract_answer_and_justification(text: str):
 
 def fallback_analysis(context: str, question: str):
     """Análise de fallback baseada em palavras-chave do currículo"""
-    context_lower = context.lower()
     question_lower = question.lower()
 
-    # Tecnologias encontradas no currículo
-    technologies = []
-    experiences = []
-
-    # Mapeamento mais abrangente de tecnologias
-    tech_keywords = {
-        'python': 'Python',
-        'javascript': 'JavaScript',
-        'js': 'JavaScript',
-        'fastapi': 'FastAPI',
-        'postgresql': 'PostgreSQL',
-        'postgres': 'PostgreSQL',
-        'mysql': 'MySQL',
-        'oracle': 'Oracle',
-        'selenium': 'Selenium',
-        'matplotlib': 'Matplotlib',
-        'whisper': 'Whisper',
-        'openai': 'OpenAI',
-        'api openal': 'OpenAI',
-        'n8n': 'N8N',
-        'django': 'Django',
-        'flask': 'Flask',
-        'react': 'React',
-        'node': 'Node.js',
-        'mongodb': 'MongoDB',
-        'redis': 'Redis',
-        'docker': 'Docker',
-        'kubernetes': 'Kubernetes',
-        'git': 'Git',
-        'aws': 'AWS',
-        'azure': 'Azure',
-        'gcp': 'Google Cloud'
-    }
-
-    # Buscar tecnologias
-    for keyword, tech_name in tech_keywords.items():
-        if keyword in context_lower:
-            technologies.append(tech_name)
-
-    # Buscar experiências/cargos
-    job_keywords = {
-        'desenvolvedor': 'desenvolvedor',
-        'developer': 'desenvolvedor',
-        'programador': 'programador',
-        'analista': 'analista',
-        'engenheiro': 'engenheiro de software',
-        'tech lead': 'tech lead',
-        'arquiteto': 'arquiteto de software',
-        'full stack': 'desenvolvedor full stack',
-        'backend': 'desenvolvedor backend',
-        'frontend': 'desenvolvedor frontend'
-    }
-
-    for keyword, job_name in job_keywords.items():
-        if keyword in context_lower:
-            experiences.append(job_name)
+    # Tecnologias e cargos encontrados no currículo (taxonomia)
+    matches = find_matches(context)
+    technologies = list(dict.fromkeys(m.name for m in matches if m.kind == KIND_SKILL))  # noqa: E501
+    experiences = list(dict.fromkeys(m.name for m in matches if m.kind == KIND_ROLE))  # noqa: E501
 
     # Verificar tipo de pergunta e gerar resposta apropriada
     if any(word in question_lower for word in ['desenvolvedor', 'developer', 'software', 'programação', 'backend', 'frontend', 'programador']):  # noqa: E501
@@ -221,43 +265,146 @@ def fallback_analysis(context: str, question: str):
     }
 
 
-def answer_question(context: str, question: str):
-    """Executa análise principal: pergunta baseada no conteúdo do currículo"""
+def keyword_stage(context: str, question: str) -> Optional[StageResult]:
+    """
+    Compara as habilidades (ou cargos) da taxonomia citados na pergunta
+    com os do currículo. Sem termos na pergunta, usa `fallback_analysis`
+    com confiança baixa.
+    """
+    question_matches = find_matches(question)
+    required = list(dict.fromkeys(m.name for m in question_matches if m.kind == KIND_SKILL))  # noqa: E501
+    if not required:
+        required = list(dict.fromkeys(m.name for m in question_matches if m.kind == KIND_ROLE))  # noqa: E501
+    if not required:
+        analysis = fallback_analysis(context, question)
+        return StageResult(analysis["answer"], analysis["justification"], 0.3)  # noqa: E501
+
+    found = {m.name for m in find_matches(context)}
+    present = [name for name in required if name in found]
+    missing = [name for name in required if name not in found]
+    coverage = len(present) / len(required)
+
+    if coverage >= 0.5:
+        justification = f"O candidato cita {', '.join(present)} no currículo."  # noqa: E501
+        if missing:
+            justification += f" Não foram encontrados: {', '.join(missing)}."  # noqa: E501
+        return StageResult("Sim", justification, 0.95 * coverage)
+
+    justification = f"O currículo não menciona {', '.join(missing)}."
+    # Ausência de palavra-chave é evidência mais fraca (sinônimos)
+    return StageResult("Não", justification, 0.8 * (1 - coverage))
+
+
+def lexical_stage(context: str, question: str) -> Optional[StageResult]:
+    """Fração dos termos relevantes da pergunta presentes no currículo."""
+    terms = list(dict.fromkeys(tokenize(question)))
+    if not terms:
+        return None
+
+    context_terms = set(tokenize(context))
+    present = [term for term in terms if term in context_terms]
+    coverage = len(present) / len(terms)
+
+    if coverage >= 0.5:
+        return StageResult(
+            "Sim",
+            f"Termos da pergunta encontrados no currículo: {', '.join(present)}.",  # noqa: E501
+            0.85 * coverage
+        )
+    missing = [term for term in terms if term not in context_terms]
+    return StageResult(
+        "Não",
+        f"Termos da pergunta ausentes no currículo: {', '.join(missing)}.",
+        0.7 * (1 - coverage)
+    )
+
+
+def model_stage(context: str, question: str) -> Optional[StageResult]:
+    """Análise com o flan-t5; só responde quando a saída é válida."""
+    try:
+        prompt = build_prompt(context, question)
+        result = completion(prompt)
+    except Exception as e:
+        raise StageError(f"Erro ao usar modelo: {str(e)}") from e
+
+    answer, justification = extract_answer_and_justification(result)
+    if answer in ["Sim", "Não"] and len(justification) > 20:
+        return StageResult(answer, justification, 1.0)
+    return None
+
+
+# Estágios disponíveis para CASCADE_STAGES; novos estágios podem ser
+# registrados aqui antes de `build_cascade`
+CASCADE_STAGE_FUNCTIONS = {
+    "keyword": keyword_stage,
+    "lexical": lexical_stage,
+    "model": model_stage
+}
+
+
+def build_cascade(stage_names: List[str] = CASCADE_STAGES) -> Cascade:
+    stages = []
+    for name in stage_names:
+        stage = CASCADE_STAGE_FUNCTIONS.get(name)
+        if stage is None:
+            logger.warning(f"Estágio de cascata desconhecido ignorado: {name}")  # noqa: E501
+            continue
+        stages.append((name, stage))
+    return Cascade(stages, thresholds={
+        "keyword": CASCADE_KEYWORD_THRESHOLD,
+        "lexical": CASCADE_LEXICAL_THRESHOLD
+    })
+
+
+qa_cascade = build_cascade()
+
+
+def _answer_question(context: str, question: str):
+    """
+    Executa análise principal: pergunta baseada no conteúdo do currículo.
+    Retorna a análise e se ela pode ser reaproveitada pelo cache.
+    """
     if not context.strip() or len(context.strip()) < 20:
         return {
             "answer": "Não",
             "justification": "Currículo não contém informações suficientes para análise."  # noqa: E501
-        }
+        }, True
 
-    # Primeiro, tentar análise direta baseada no contexto
-    direct_analysis = fallback_analysis(context, question)
+    return qa_cascade.run(context, question)
 
-    # Se a análise direta for bem-sucedida e específica, usar ela
-    if (direct_analysis["answer"] in ["Sim", "Não"] and
-            "tecnologias:" in direct_analysis["justification"]):
-        return direct_analysis
 
-    # Caso contrário, tentar o modelo
-    prompt = PROMPT_TEMPLATE.format(
-        curriculo=context.strip(),
-        query=question.strip()
-    )
+def answer_question(context: str, question: str):
+    """
+    Executa análise principal: pergunta baseada no conteúdo do currículo.
+    Reaproveita respostas para o mesmo resumo e a mesma pergunta.
+    """
+    # O perfil de inferência muda as respostas do modelo (int8, decodificação)
+    key = f"{hash_text(context.strip())}:{hash_text(normalize_query(question))}:{get_profile().name}:{qa_cascade.fingerprint()}"  # noqa: E501
+    # Só a análise vai para o cache; respostas de fallback não são guardadas
+    computed = {}
 
-    try:
-        result = completion(prompt)
-        answer, justification = extract_answer_and_justification(result)
+    def compute():
+        analysis, computed["cacheable"] = _answer_question(context, question)
+        return analysis
 
-        # Se o modelo retornou algo válido, usar
-        if answer in ["Sim", "Não"] and len(justification) > 20:
-            return {
-                "answer": answer,
-                "justification": justification
-            }
-    except Exception as e:
-        print(f"Erro ao usar modelo: {str(e)}")
+    analysis = answer_cache.get_or_compute(
+        key, compute, should_store=lambda _: computed["cacheable"]
+    )
+    if not computed:
+        return _cached_analysis(analysis)
+    return dict(analysis)
 
-    # Fallback final: usar análise direta
-    return direct_analysis
+
+def _cached_analysis(analysis: dict) -> dict:
+    """
+    Cópia de uma análise do cache: os tempos da cascata são da execução
+    original, então saem e o campo `cached` indica o reaproveitamento.
+    """
+    analysis = dict(analysis)
+    if "cascade" in analysis:
+        cascade = {k: v for k, v in analysis["cascade"].items() if k != "timings_ms"}  # noqa: E501
+        analysis["cascade"] = {**cascade, "cached": True}
+    return analysis
 
 
 def process_resumes(resumes_texts: list[str], query: str):
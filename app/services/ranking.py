@@ -0,0 +1,135 @@
+# app/services/ranking.py
+"""Ranqueamento lexical (BM25) de currículos antes da análise com o modelo"""
+
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+from app.config import RANKING_MIN_SCORE, RANKING_TOP_K
+
+TOKEN_PATTERN = re.compile(r"[\w\+\#\.]+")
+
+STOPWORDS = {
+    "a", "as", "o", "os", "um", "uma", "de", "da", "das", "do", "dos", "e",
+    "em", "na", "nas", "no", "nos", "para", "por", "com", "que", "quem",
+    "se", "ao", "aos", "vaga", "melhor", "encaixa", "essa", "esse", "pessoa",
+    "tem", "experiencia", "the", "an", "and", "of", "for", "in", "to", "with",
+    "who", "is", "has", "best", "fit", "role", "position"
+}
+
+
+def _strip_accents(text: str) -> str:
+    normalized = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in normalized if not unicodedata.combining(char))  # noqa: E501
+
+
+def tokenize(text: str) -> List[str]:
+    """Termos em minúsculas, sem acentos e sem stopwords."""
+    tokens = TOKEN_PATTERN.findall(_strip_accents(text.lower()))
+    return [
+        token.strip(".")
+        for token in tokens
+        if len(token.strip(".")) > 1 and token.strip(".") not in STOPWORDS
+    ]
+
+
+def bm25_term_weight(
+    tf: float,
+    df: int,
+    n_docs: int,
+    length: float,
+    avg_length: float,
+    k1: float = 1.5,
+    b: float = 0.75
+) -> float:
+    """Contribuição BM25 de um termo, a partir de contagens já calculadas."""
+    idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+    norm = k1 * (1 - b + b * length / (avg_length or 1.0))
+    return float(idf * tf * (k1 + 1) / (tf + norm))
+
+
+def bm25_scores(
+    documents: List[str],
+    query: str,
+    k1: float = 1.5,
+    b: float = 0.75
+) -> np.ndarray:
+    """
+    Pontua todos os documentos contra a consulta com BM25, usando uma
+    matriz esparsa documento × termo (apenas os termos da consulta).
+    """
+    query_terms = list(dict.fromkeys(tokenize(query)))
+    scores = np.zeros(len(documents))
+    if not documents or not query_terms:
+        return scores
+
+    vocabulary = {term: col for col, term in enumerate(query_terms)}
+    rows, cols = [], []
+    doc_lengths = np.zeros(len(documents))
+
+    for row, document in enumerate(documents):
+        tokens = tokenize(document)
+        doc_lengths[row] = len(tokens)
+        for token in tokens:
+            col = vocabulary.get(token)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+
+    tf = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)),
+        shape=(len(documents), len(query_terms))
+    )
+    if tf.nnz == 0:
+        return scores
+
+    n_docs = len(documents)
+    df = np.bincount(tf.indices, minlength=len(query_terms))
+    idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+    avg_length = doc_lengths.mean() or 1.0
+    norm = k1 * (1 - b + b * doc_lengths / avg_length)
+
+    # Aplica a saturação de BM25 somente nas entradas não nulas
+    tf = tf.tocoo()
+    weighted = tf.data * (k1 + 1) / (tf.data + norm[tf.row]) * idf[tf.col]
+    scores = np.bincount(tf.row, weights=weighted, minlength=n_docs)
+    return scores
+
+
+def rank_candidates(
+    summaries: List[str],
+    query: str,
+    top_k: int = RANKING_TOP_K,
+    min_score: float = RANKING_MIN_SCORE,
+    excluded: Optional[List[bool]] = None
+) -> List[Dict]:
+    """
+    Ordena os currículos pela pontuação BM25 e marca para avaliação com o
+    modelo apenas os `top_k` com pontuação acima de `min_score`.
+    """
+    scores = bm25_scores(summaries, query)
+    excluded = excluded or [False] * len(summaries)
+    order = sorted(range(len(summaries)), key=lambda i: (excluded[i], -scores[i], i))  # noqa: E501
+
+    ranking = []
+    selected = 0
+    for rank, index in enumerate(order, start=1):
+        score = float(scores[index])
+        evaluate = (
+            not excluded[index] and
+            selected < top_k and
+            score > min_score
+        )
+        if evaluate:
+            selected += 1
+        ranking.append({
+            "index": index,
+            "rank": rank,
+            "score": round(score, 4),
+            "evaluate": evaluate
+        })
+    return ranking
@@ -0,0 +1,162 @@
+# app/services/reader_pool.py
+"""Pool de leitores EasyOCR carregados uma única vez e reutilizados"""
+
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from app.config import OCR_LANGUAGES, OCR_READER_INSTANCES, OCR_USE_GPU
+
+logger = logging.getLogger(__name__)
+
+LanguageKey = Tuple[str, ...]
+
+
+def _language_key(languages: Iterable[str]) -> LanguageKey:
+    """Normaliza a lista de idiomas preservando a ordem informada."""
+    normalized = (lang.strip().lower() for lang in languages if lang.strip())
+    return tuple(dict.fromkeys(normalized))
+
+
+class ReaderPool:
+    """
+    Mantém até `instances` leitores EasyOCR por conjunto de idiomas.
+
+    Os leitores são criados sob demanda (ou no warmup) e emprestados às
+    threads via `acquire()`. Quando todos estão em uso, a chamada aguarda
+    um leitor ser devolvido em vez de carregar novos pesos.
+    """
+
+    def __init__(
+        self,
+        instances: int = OCR_READER_INSTANCES,
+        gpu: bool = OCR_USE_GPU,
+        factory: Optional[Callable[[LanguageKey], object]] = None
+    ):
+        self.instances = max(1, instances)
+        self.gpu = gpu
+        self._factory = factory or self._create_reader
+        self._lock = threading.Lock()
+        self._idle: Dict[LanguageKey, queue.Queue] = {}
+        self._stats: Dict[LanguageKey, Dict[str, float]] = {}
+
+    def _create_reader(self, languages: LanguageKey):
+        import easyocr
+
+        return easyocr.Reader(list(languages), gpu=self.gpu)
+
+    def _ensure(self, key: LanguageKey) -> queue.Queue:
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.Queue()
+                self._stats[key] = {
+                    "loaded": 0,
+                    "load_seconds": 0.0,
+                    "acquired": 0,
+                    "reused": 0,
+                    "wait_seconds": 0.0
+                }
+            return self._idle[key]
+
+    def _reserve_slot(self, key: LanguageKey) -> bool:
+        """Reserva espaço para um novo leitor, se o limite permitir."""
+        with self._lock:
+            stats = self._stats[key]
+            if stats["loaded"] < self.instances:
+                stats["loaded"] += 1
+                return True
+            return False
+
+    def _load(self, key: LanguageKey):
+        start = time.perf_counter()
+        try:
+            reader = self._factory(key)
+        except Exception:
+            with self._lock:
+                self._stats[key]["loaded"] -= 1
+            raise
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._stats[key]["load_seconds"] += elapsed
+        logger.info(f"Leitor EasyOCR {list(key)} carregado em {elapsed:.2f}s")
+        return reader
+
+    def _checkout(self, key: LanguageKey) -> Tuple[object, queue.Queue]:
+        """Leitor emprestado e a fila (da geração atual) para devolvê-lo."""
+        idle = self._ensure(key)
+        start = time.perf_counter()
+
+        try:
+            reader = idle.get_nowait()
+            reused = True
+        except queue.Empty:
+            if self._reserve_slot(key):
+                reader = self._load(key)
+                reused = False
+            else:
+                reader = idle.get()
+                reused = True
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is not None:
+                stats["acquired"] += 1
+                if reused:
+                    stats["reused"] += 1
+                    stats["wait_seconds"] += time.perf_counter() - start
+        return reader, idle
+
+    @contextmanager
+    def acquire(self, languages: Iterable[str] = OCR_LANGUAGES):
+        """Empresta um leitor para o conjunto de idiomas e o devolve ao final."""  # noqa: E501
+        key = _language_key(languages)
+        reader, idle = self._checkout(key)
+        try:
+            yield reader
+        finally:
+            # Volta para a fila de onde saiu: depois de um `reset`, essa
+            # fila já não está no pool e o leitor antigo é descartado
+            idle.put(reader)
+
+    def warmup(
+        self,
+        languages: Iterable[str] = OCR_LANGUAGES,
+        instances: Optional[int] = None
+    ) -> None:
+        """Carrega antecipadamente os leitores de um conjunto de idiomas."""
+        key = _language_key(languages)
+        idle = self._ensure(key)
+        target = min(instances or self.instances, self.instances)
+
+        while self._stats[key]["loaded"] < target:
+            if not self._reserve_slot(key):
+                break
+            idle.put(self._load(key))
+
+    def reset(self, factory: Optional[Callable[[LanguageKey], object]] = None) -> None:  # noqa: E501
+        """
+        Descarta os leitores carregados e, se informada, troca a fábrica.
+        Leitores emprestados no momento não voltam para o novo pool.
+        """
+        with self._lock:
+            self._idle.clear()
+            self._stats.clear()
+            if factory is not None:
+                self._factory = factory
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Tempo de carga e contagem de reutilização por conjunto de idiomas."""  # noqa: E501
+        with self._lock:
+            return {
+                ",".join(key): {
+                    **values,
+                    "idle": self._idle[key].qsize()
+                }
+                for key, values in self._stats.items()
+            }
+
+
+reader_pool = ReaderPool()
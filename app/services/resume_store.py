@@ -0,0 +1,296 @@
+# app/services/resume_store.py
+"""Repositório de currículos analisados com índice invertido para busca"""
+
+import copy
+import logging
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.config import (
+    RESUME_SEARCH_LIMIT,
+    RESUME_STORE_BACKEND,
+    RESUME_STORE_MAX_RECORDS
+)
+from app.services import summarizer
+from app.services.cache import hash_text
+from app.services.mongo import mongo_client
+from app.services.ranking import bm25_term_weight, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Campos devolvidos na busca (o texto completo fica de fora)
+SUMMARY_FIELDS = (
+    "resume_id", "filename", "summary", "skills", "job_titles",
+    "experience_years", "updated_at"
+)
+# Campos de `candidates`: o resumo e o que o BM25 usa
+CANDIDATE_FIELDS = SUMMARY_FIELDS + ("terms", "term_counts", "length")
+
+
+def build_record(filename: str, text: str, summary: str) -> dict:
+    """
+    Monta o documento do repositório a partir do texto extraído e do
+    resumo já gerado. O id é o hash do texto normalizado, então o mesmo
+    currículo enviado de novo substitui o registro anterior.
+    """
+    cleaned = summarizer.clean_text(text)
+    details = summarizer.analyze_resume_details(text, summary=summary)
+    counts = Counter(tokenize(f"{cleaned} {summary}"))
+    terms = sorted(counts)
+    return {
+        "resume_id": hash_text(cleaned),
+        "filename": filename,
+        "text": cleaned,
+        "summary": summary,
+        "skills": details["skills"],
+        "skill_keys": [skill.lower() for skill in details["skills"]],
+        "job_titles": details["job_titles"],
+        "experience_years": details["experience_years"],
+        "sections_found": details["sections_found"],
+        "terms": terms,
+        "term_counts": [counts[term] for term in terms],
+        "length": sum(counts.values()),
+        "updated_at": datetime.now(timezone.utc).isoformat()
+    }
+
+
+class InMemoryResumeStore:
+    """
+    Registros e listas invertidas (termo → ids) em memória. Acima de
+    `max_records`, os registros menos usados (LRU) são descartados.
+    """
+
+    def __init__(self, max_records: int = RESUME_STORE_MAX_RECORDS):
+        self.max_records = max(1, max_records)
+        self._records: "OrderedDict[str, dict]" = OrderedDict()
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._skill_postings: Dict[str, Set[str]] = defaultdict(set)
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def upsert(self, record: dict) -> None:
+        with self._lock:
+            previous = self._records.get(record["resume_id"])
+            if previous is not None:
+                self._unindex(previous)
+            self._records[record["resume_id"]] = copy.deepcopy(record)
+            self._records.move_to_end(record["resume_id"])
+            for term in record["terms"]:
+                self._postings[term].add(record["resume_id"])
+            for skill in record["skill_keys"]:
+                self._skill_postings[skill].add(record["resume_id"])
+            self._total_length += record["length"]
+            while len(self._records) > self.max_records:
+                _, evicted = self._records.popitem(last=False)
+                self._unindex(evicted)
+
+    def _unindex(self, record: dict) -> None:
+        for term in record["terms"]:
+            self._postings[term].discard(record["resume_id"])
+            if not self._postings[term]:
+                del self._postings[term]
+        for skill in record["skill_keys"]:
+            self._skill_postings[skill].discard(record["resume_id"])
+            if not self._skill_postings[skill]:
+                del self._skill_postings[skill]
+        self._total_length -= record["length"]
+
+    def get(self, resume_id: str) -> Optional[dict]:
+        with self._lock:
+            record = self._records.get(resume_id)
+            if record is None:
+                return None
+            self._records.move_to_end(resume_id)
+            return copy.deepcopy(record)
+
+    def candidates(
+        self,
+        terms: List[str],
+        skills: List[str]
+    ) -> Tuple[List[dict], Dict[str, int], int, float]:
+        """
+        Registros com ao menos um termo (e todas as habilidades pedidas),
+        frequência de documento dos termos, total e tamanho médio.
+        Os registros trazem só CANDIDATE_FIELDS, por referência: `upsert`
+        troca o registro inteiro em vez de alterá-lo, e quem chama não
+        deve modificá-los.
+        """
+        with self._lock:
+            n_docs = len(self._records)
+            df = {term: len(self._postings.get(term, ())) for term in terms}
+            ids: Optional[Set[str]] = None
+            if terms:
+                ids = set().union(*(self._postings.get(t, set()) for t in terms))  # noqa: E501
+            for skill in skills:
+                skill_ids = self._skill_postings.get(skill, set())
+                ids = skill_ids.copy() if ids is None else ids & skill_ids
+            records = [
+                {field: self._records[i][field] for field in CANDIDATE_FIELDS}
+                for i in (ids or ())
+            ]
+            avg_length = self._total_length / n_docs if n_docs else 0.0
+            return records, df, n_docs, avg_length
+
+
+class MongoResumeStore:
+    """
+    Registros na coleção `resumes` do MongoDB, com índices multikey. A
+    frequência de documento de cada termo (`resume_terms`) e os totais
+    (`resume_stats`) são atualizados a cada `upsert`, para que a busca
+    não precise contar nem agregar a coleção inteira.
+    """
+
+    def __init__(self, uri: Optional[str] = None):
+        database = mongo_client(uri)["resume_analyzer"]
+        self.collection = database["resumes"]
+        self.terms = database["resume_terms"]
+        self.stats = database["resume_stats"]
+        self.collection.create_index("resume_id", unique=True)
+        self.collection.create_index("terms")
+        self.collection.create_index("skill_keys")
+        if self.stats.find_one({"_id": "totals"}) is None:
+            self._rebuild_stats()
+
+    def _rebuild_stats(self) -> None:
+        """Recalcula frequências e totais (coleção criada antes deles)."""
+        from pymongo import UpdateOne
+
+        df = self.collection.aggregate([
+            {"$unwind": "$terms"},
+            {"$group": {"_id": "$terms", "df": {"$sum": 1}}}
+        ])
+        ops = [UpdateOne({"_id": d["_id"]}, {"$set": {"df": d["df"]}}, upsert=True) for d in df]  # noqa: E501
+        if ops:
+            self.terms.bulk_write(ops, ordered=False)
+        totals = list(self.collection.aggregate([
+            {"$group": {"_id": None, "n_docs": {"$sum": 1}, "total_length": {"$sum": "$length"}}}  # noqa: E501
+        ]))
+        self.stats.replace_one(
+            {"_id": "totals"},
+            {
+                "n_docs": totals[0]["n_docs"] if totals else 0,
+                "total_length": totals[0]["total_length"] if totals else 0
+            },
+            upsert=True
+        )
+
+    def upsert(self, record: dict) -> None:
+        from pymongo import ReturnDocument, UpdateOne
+
+        previous = self.collection.find_one_and_replace(
+            {"resume_id": record["resume_id"]},
+            copy.deepcopy(record),
+            projection={"_id": 0, "terms": 1, "length": 1},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE
+        )
+        old_terms = set(previous["terms"]) if previous else set()
+        new_terms = set(record["terms"])
+        ops = [UpdateOne({"_id": t}, {"$inc": {"df": 1}}, upsert=True) for t in new_terms - old_terms]  # noqa: E501
+        ops += [UpdateOne({"_id": t}, {"$inc": {"df": -1}}) for t in old_terms - new_terms]  # noqa: E501
+        if ops:
+            self.terms.bulk_write(ops, ordered=False)
+        self.stats.update_one(
+            {"_id": "totals"},
+            {"$inc": {
+                "n_docs": 0 if previous else 1,
+                "total_length": record["length"] - (previous["length"] if previous else 0)  # noqa: E501
+            }},
+            upsert=True
+        )
+
+    def get(self, resume_id: str) -> Optional[dict]:
+        return self.collection.find_one({"resume_id": resume_id}, {"_id": 0})
+
+    def candidates(
+        self,
+        terms: List[str],
+        skills: List[str]
+    ) -> Tuple[List[dict], Dict[str, int], int, float]:
+        query = {}
+        if terms:
+            query["terms"] = {"$in": terms}
+        if skills:
+            query["skill_keys"] = {"$all": skills}
+        if not query:
+            return [], {}, 0, 0.0
+
+        totals = self.stats.find_one({"_id": "totals"}) or {}
+        n_docs = totals.get("n_docs", 0)
+        avg_length = totals.get("total_length", 0) / n_docs if n_docs else 0.0
+        df = dict.fromkeys(terms, 0)
+        for doc in self.terms.find({"_id": {"$in": terms}}):
+            df[doc["_id"]] = doc["df"]
+        projection = {"_id": 0, **dict.fromkeys(CANDIDATE_FIELDS, 1)}
+        records = list(self.collection.find(query, projection))
+        return records, df, n_docs, avg_length
+
+
+def create_store():
+    if RESUME_STORE_BACKEND == "mongo":
+        return MongoResumeStore()
+    return InMemoryResumeStore()
+
+
+class ResumeRepository:
+    """
+    Guarda texto, resumo e dados extraídos de cada currículo analisado e
+    responde buscas pelo índice invertido, sem OCR nem modelos.
+    """
+
+    def __init__(self, store=None):
+        self._store = store
+
+    @property
+    def store(self):
+        # Criado no primeiro uso para não conectar ao banco no import
+        if self._store is None:
+            self._store = create_store()
+        return self._store
+
+    def save(self, filename: str, text: str, summary: str) -> str:
+        """Indexa (ou atualiza) um currículo e retorna seu id."""
+        record = build_record(filename, text, summary)
+        self.store.upsert(record)
+        return record["resume_id"]
+
+    def get(self, resume_id: str) -> Optional[dict]:
+        return self.store.get(resume_id)
+
+    def search(
+        self,
+        query: str = "",
+        skills: Optional[List[str]] = None,
+        limit: int = RESUME_SEARCH_LIMIT
+    ) -> List[dict]:
+        """
+        Currículos que citam os termos da consulta, ordenados por BM25.
+        `skills` filtra pelos que têm todas as habilidades informadas.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        skill_keys = [skill.strip().lower() for skill in skills or [] if skill.strip()]  # noqa: E501
+        if not terms and not skill_keys:
+            return []
+
+        records, df, n_docs, avg_length = self.store.candidates(terms, skill_keys)  # noqa: E501
+        results = []
+        for record in records:
+            counts = dict(zip(record["terms"], record["term_counts"]))
+            matched = [term for term in terms if term in counts]
+            score = sum(
+                bm25_term_weight(counts[term], df[term], n_docs, record["length"], avg_length)  # noqa: E501
+                for term in matched
+            )
+            result = {field: record.get(field) for field in SUMMARY_FIELDS}
+            result["score"] = round(score, 4)
+            result["matched_terms"] = matched
+            results.append(result)
+
+        results.sort(key=lambda r: (-r["score"], r["filename"] or ""))
+        # Cópia só do que é devolvido (os candidatos são referências)
+        return copy.deepcopy(results[:max(0, limit)])
+
+
+resume_repository = ResumeRepository()
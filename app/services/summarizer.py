@@ -1,20 +1,59 @@
 # app/services/summarizer.py
-from transformers import pipeline
-import torch
+import logging
 import re
+from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
+from app.config import (
+    SUMMARIZER_BATCH_SIZE,
+    SUMMARIZER_CHUNK_OVERLAP,
+    SUMMARIZER_CHUNK_TOKENS,
+    SUMMARIZER_MAX_CHUNKS,
+    SUMMARIZER_MODE
+)
+from app.services import metrics
+from app.services.cache import chunk_cache, hash_text, summary_cache
+from app.services.chunking import chunk_sections, token_counter
+from app.services.inference import (
+    InferenceProfile,
+    get_profile,
+    inference_mode,
+    prepare_model
+)
+from app.services.models import registry
+from app.services.taxonomy import get_taxonomy
 
-MAX_INPUT_CHARS = 3000  # máximo caracteres para o modelo
-device = 0 if torch.cuda.is_available() else -1
+logger = logging.getLogger(__name__)
 
-# Inicializa pipeline de sumarização (modelo genérico, balanceado)
-summarizer_pipeline = pipeline(
-    "summarization",
-    model="sshleifer/distilbart-cnn-12-6",
-    device=device,
-    max_length=512,
-    truncation=True
-)
+MAX_INPUT_CHARS = 3000  # máximo caracteres para o modelo (modo truncate)
+MAX_REDUCE_ROUNDS = 3  # rodadas de re-sumarização no modo chunked
+SUMMARIZER_MODEL = "sshleifer/distilbart-cnn-12-6"
+
+
+def _load_summarizer_pipeline(profile: Optional[InferenceProfile] = None):
+    """Inicializa pipeline de sumarização (modelo genérico, balanceado)"""
+    import torch
+    from transformers import pipeline
+
+    profile = profile or get_profile()
+    device = 0 if torch.cuda.is_available() else -1
+    summarization = pipeline(
+        "summarization",
+        model=SUMMARIZER_MODEL,
+        device=device,
+        max_length=512,
+        truncation=True
+    )
+    summarization.model = prepare_model(summarization.model, device, profile)
+    return summarization
+
+
+registry.register("summarizer", _load_summarizer_pipeline)
+
+
+def get_summarizer_pipeline():
+    """Retorna o pipeline de sumarização, carregando-o no primeiro uso."""
+    return registry.get("summarizer")
 
 
 def clean_text(text: str) -> str:
@@ -26,6 +65,126 @@ def clean_text(text: str) -> str:
     return ' '.join(filtered).strip()
 
 
+# Cabeçalhos de cada seção (palavras separadas por espaços opcionais)
+SECTION_HEADERS = {
+    'experiencia': [
+        'experiência profissional', 'histórico profissional',
+        'experiência', 'trabalho', 'carreira'
+    ],
+    'formacao': [
+        'formação', 'educação', 'acadêmica', 'ensino', 'graduação'
+    ],
+    'habilidades': [
+        'habilidades comportamentais', 'soft skills', 'habilidades',
+        'competências', 'skills', 'tecnologias', 'conhecimentos'
+    ],
+    'certificacoes': [
+        'certificações', 'certificados', 'cursos', 'qualificações'
+    ],
+    'conquistas': ['conquistas', 'resultados', 'prêmios']
+}
+
+_HEADER_TO_SECTION = {
+    header.replace(' ', ''): section
+    for section, headers in SECTION_HEADERS.items()
+    for header in headers
+}
+
+# Um único padrão para cabeçalhos e linhas em branco (fim de seção);
+# os cabeçalhos mais longos vêm primeiro na alternância e só casam
+# palavras inteiras ("cursos" não abre seção dentro de "recursos")
+SECTION_PATTERN = re.compile(
+    r'(?P<blank>\n\s*\n)|(?P<header>\b(?:' + '|'.join(
+        r'\s*'.join(re.escape(word) for word in header.split())
+        for header in sorted(
+            (h for headers in SECTION_HEADERS.values() for h in headers),
+            key=len,
+            reverse=True
+        )
+    ) + r')\b)'
+)
+
+# Padrões de anos de experiência, em ordem de prioridade
+EXPERIENCE_PATTERN = re.compile('|'.join(
+    f'(?:{pattern})' for pattern in (
+        r'(\d+)\s*anos?\s*de\s*experiência',
+        r'experiência\s*de\s*(\d+)\s*anos?',
+        r'(\d+)\+?\s*anos?\s*experiência',
+        r'mais\s*de\s*(\d+)\s*anos?',
+        r'(\d+)\s*years?\s*of\s*experience',
+        r'experience\s*of\s*(\d+)\s*years?'
+    )
+))
+
+JOB_TITLE_PATTERN = re.compile(r'gerente|coordenador|analista|assistente|técnico|supervisor|consultor|especialista|diretor|presidente|administrador|engenheiro|desenvolvedor|programador|professor|médico|enfermeiro|advogado|contador|vendedor|representante|estagiário|estagiaria|auxiliar|operador')  # noqa: E501
+
+
+@dataclass
+class ResumeSegments:
+    """Resultado de uma única passada sobre o texto do currículo."""
+    text_lower: str
+    sections: Dict[str, List[str]] = field(default_factory=dict)
+    experience_years: Optional[str] = None
+    job_titles: List[str] = field(default_factory=list)
+
+
+def _split_sections(text_lower: str) -> Dict[str, List[str]]:
+    """
+    Divide o texto em seções sem sobreposição: cada seção vai do seu
+    cabeçalho até o cabeçalho de outra seção ou uma linha em branco.
+    """
+    sections: Dict[str, List[str]] = {}
+    current, start = None, 0
+
+    def close(end: int):
+        if current is None:
+            return
+        content = text_lower[start:end].strip()
+        if len(content) > 20:
+            sections.setdefault(current, []).append(content)
+
+    for m in SECTION_PATTERN.finditer(text_lower):
+        if m.group('header'):
+            section = _HEADER_TO_SECTION[re.sub(r'\s+', '', m.group('header'))]  # noqa: E501
+            # Palavra-chave repetida no corpo não abre uma nova seção
+            if section == current:
+                continue
+            close(m.start())
+            current, start = section, m.start()
+        else:
+            close(m.start())
+            current = None
+    close(len(text_lower))
+    return sections
+
+
+def _find_experience_years(text_lower: str) -> Optional[str]:
+    best = None
+    for m in EXPERIENCE_PATTERN.finditer(text_lower):
+        priority = m.lastindex
+        if best is None or priority < best.lastindex:
+            best = m
+        if priority == 1:
+            break
+    if best is None:
+        return None
+    return f"{best.group(best.lastindex)} anos de experiência"
+
+
+def segment_resume(text: str) -> ResumeSegments:
+    """
+    Passada única sobre o texto: seções, anos de experiência e cargos,
+    todos a partir da mesma cópia em minúsculas.
+    """
+    text_lower = text.lower()
+    return ResumeSegments(
+        text_lower=text_lower,
+        sections=_split_sections(text_lower),
+        experience_years=_find_experience_years(text_lower),
+        job_titles=list(set(JOB_TITLE_PATTERN.findall(text_lower)))
+    )
+
+
 def extract_structured_info(text: str) -> Dict[str, List[str]]:
     """
     Extrai seções principais do currículo, incluindo:
@@ -35,89 +194,30 @@ def extract_structured_info(text: str) -> Dict[str, List[str]]:
     - certificações/cursos
     - conquistas/resultados (opcional)
     """
-    section_patterns = {
-        'experiencia': [
-            r'experiência\s*profissional.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'experiência.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'trabalho.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'carreira.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'histórico\s*profissional.*?(?=\n\s*\n|\n[A-Z]|$)'
-        ],
-        'formacao': [
-            r'formação.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'educação.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'acadêmica.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'ensino.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'graduação.*?(?=\n\s*\n|\n[A-Z]|$)'
-        ],
-        'habilidades': [
-            r'habilidades.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'competências.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'skills.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'habilidades comportamentais.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'soft skills.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'tecnologias.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'conhecimentos.*?(?=\n\s*\n|\n[A-Z]|$)'
-        ],
-        'certificacoes': [
-            r'certificações.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'certificados.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'cursos.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'qualificações.*?(?=\n\s*\n|\n[A-Z]|$)'
-        ],
-        'conquistas': [
-            r'conquistas.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'resultados.*?(?=\n\s*\n|\n[A-Z]|$)',
-            r'prêmios.*?(?=\n\s*\n|\n[A-Z]|$)'
-        ]
-    }
-
-    extracted_info = {}
-    text_lower = text.lower()
-
-    for section, patterns in section_patterns.items():
-        contents = []
-        for pattern in patterns:
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE | re.DOTALL)  # noqa: E501
-            for m in matches:
-                c = m.group(0).strip()
-                if len(c) > 20:
-                    contents.append(c)
-        if contents:
-            extracted_info[section] = contents
-
-    return extracted_info
+    return _split_sections(text.lower())
 
 
 def extract_experience_years(text: str) -> Optional[str]:
     """Extrai anos de experiência geral do texto."""
-    patterns = [
-        r'(\d+)\s*anos?\s*de\s*experiência',
-        r'experiência\s*de\s*(\d+)\s*anos?',
-        r'(\d+)\+?\s*anos?\s*experiência',
-        r'mais\s*de\s*(\d+)\s*anos?',
-        r'(\d+)\s*years?\s*of\s*experience',
-        r'experience\s*of\s*(\d+)\s*years?'
-    ]
-    for p in patterns:
-        m = re.search(p, text.lower())
-        if m:
-            return f"{m.group(1)} anos de experiência"
-    return None
+    return _find_experience_years(text.lower())
 
 
 def extract_job_titles(text: str) -> List[str]:
     """Extrai cargos/funções amplas (genéricas, para várias áreas)."""
-    title_pattern = r'(gerente|coordenador|analista|assistente|técnico|supervisor|consultor|especialista|diretor|presidente|administrador|engenheiro|desenvolvedor|programador|professor|médico|enfermeiro|advogado|contador|vendedor|representante|estagiário|estagiaria|auxiliar|operador)(?:\s+de\s+[\w\s]+)?'  # noqa: E501
-    titles = re.findall(title_pattern, text.lower())
-    return list(set(titles))  # Remove duplicatas
+    return list(set(JOB_TITLE_PATTERN.findall(text.lower())))  # Remove duplicatas  # noqa: E501
+
+
+def extract_skills(text: str) -> List[str]:
+    """Habilidades da taxonomia citadas no texto, sem duplicatas."""
+    return get_taxonomy().skills(text)
 
 
 def create_structured_summary(text: str) -> str:
     """Cria resumo estruturado focado em aptidão para vaga, com base em extrações."""  # noqa: E501
-    info = extract_structured_info(text)
-    experience = extract_experience_years(text)
-    titles = extract_job_titles(text)
+    segments = segment_resume(text)
+    info = segments.sections
+    experience = segments.experience_years
+    titles = segments.job_titles
 
     summary_parts = []
 
@@ -143,7 +243,7 @@ def create_structured_summary(text: str) -> str:
         conquistas = conquistas[:200] + ('...' if len(conquistas) > 200 else '')  # noqa: E501
         summary_parts.append(f"Conquistas/Resultados: {conquistas}")
 
-    if 'formacao' in info or any(k in text.lower() for k in ['superior', 'graduação', 'bacharelado', 'tecnólogo', 'técnico']):  # noqa: E501
+    if 'formacao' in info or any(k in segments.text_lower for k in ['superior', 'graduação', 'bacharelado', 'tecnólogo', 'técnico']):  # noqa: E501
         formacao_str = 'Formação acadêmica mencionada'
         summary_parts.append(formacao_str)
 
@@ -158,62 +258,257 @@ def create_structured_summary(text: str) -> str:
     return "Profissional com experiência e formação diversificada."
 
 
-def summarize_text(text: str) -> str:
-    """Função principal para gerar resumo do currículo."""
-    if not text.strip():
-        return "Texto vazio, não foi possível gerar resumo."
+def _run_summarizer(
+    inputs: List[str],
+    summarization=None,
+    profile: Optional[InferenceProfile] = None
+) -> List[str]:
+    """Executa o pipeline de sumarização em lote."""
+    summarization = summarization or get_summarizer_pipeline()
+    profile = profile or get_profile()
+    with metrics.track("summarize.model"), inference_mode():
+        outputs = summarization(
+            inputs,
+            **profile.summary_generation_kwargs(),
+            batch_size=SUMMARIZER_BATCH_SIZE
+        )
+    # Para listas o pipeline pode devolver [[{...}], ...] ou [{...}, ...]
+    return [
+        (item[0] if isinstance(item, list) else item)["summary_text"]
+        for item in outputs
+    ]
 
-    cleaned = clean_text(text)
 
-    if len(cleaned) < 100:
-        return "Texto muito curto para gerar resumo adequado."
+def _generate_from_ids(
+    input_ids: List[List[int]],
+    summarization=None,
+    profile: Optional[InferenceProfile] = None
+) -> List[str]:
+    """
+    Resume blocos já tokenizados, chamando `generate` direto no modelo do
+    pipeline (que tokenizaria o texto de novo).
+    """
+    summarization = summarization or get_summarizer_pipeline()
+    profile = profile or get_profile()
+    tokenizer, model = summarization.tokenizer, summarization.model
+    batch_size = max(1, SUMMARIZER_BATCH_SIZE)
+    outputs: List[str] = []
+    with metrics.track("summarize.model"), inference_mode():
+        for start in range(0, len(input_ids), batch_size):
+            batch = tokenizer.pad(
+                {"input_ids": input_ids[start:start + batch_size]},
+                return_tensors="pt"
+            ).to(model.device)
+            generated = model.generate(**batch, **profile.summary_generation_kwargs())  # noqa: E501
+            outputs.extend(tokenizer.batch_decode(generated, skip_special_tokens=True))  # noqa: E501
+    return [output.strip() for output in outputs]
+
+
+def section_texts(text: str) -> List[str]:
+    """Trechos do texto delimitados pelos cabeçalhos de seção."""
+    starts = [0] + [
+        m.start() for m in SECTION_PATTERN.finditer(text.lower())
+        if m.group('header')
+    ]
+    pieces = [text[a:b] for a, b in zip(starts, starts[1:] + [len(text)])]
+    return [piece for piece in pieces if piece.strip()]
+
+
+def encode_chunks(chunks: List[str], tokenizer) -> List[dict]:
+    """Blocos com o texto e os ids de entrada do modelo (com especiais)."""
+    if not chunks:
+        return []
+    input_ids = tokenizer(chunks, truncation=True)["input_ids"]
+    return [
+        {"text": chunk, "input_ids": list(ids)}
+        for chunk, ids in zip(chunks, input_ids)
+    ]
 
-    try:
-        structured_summary = create_structured_summary(cleaned)
+
+def get_chunks(cleaned: str, tokenizer) -> List[dict]:
+    """
+    Blocos do texto que cabem na janela do modelo, cortados de preferência
+    entre seções, já tokenizados. Ficam em cache (texto e ids) pelo hash
+    do texto e pelos parâmetros: um acerto não passa pelo tokenizer.
+    """
+    key = f"{hash_text(cleaned)}:{SUMMARIZER_MODEL}:{SUMMARIZER_CHUNK_TOKENS}:{SUMMARIZER_CHUNK_OVERLAP}:ids"  # noqa: E501
+    chunks = chunk_cache.get_or_compute(
+        key,
+        lambda: encode_chunks(
+            chunk_sections(
+                section_texts(cleaned),
+                SUMMARIZER_CHUNK_TOKENS,
+                SUMMARIZER_CHUNK_OVERLAP,
+                token_counter(tokenizer)
+            ),
+            tokenizer
+        )
+    )
+    if len(chunks) > SUMMARIZER_MAX_CHUNKS:
+        logger.warning(f"Texto com {len(chunks)} blocos, usando os primeiros {SUMMARIZER_MAX_CHUNKS}")  # noqa: E501
+    return chunks[:SUMMARIZER_MAX_CHUNKS]
+
+
+def _summarize_chunked(texts: List[str]) -> List[str]:
+    """
+    Map-reduce: resume em um único lote os blocos de todos os textos;
+    textos com mais de um bloco têm os resumos parciais unidos e
+    resumidos de novo, até caberem em um bloco.
+    """
+    tokenizer = get_summarizer_pipeline().tokenizer
+    results: List[Optional[str]] = [None] * len(texts)
+    level = {i: get_chunks(text, tokenizer) for i, text in enumerate(texts)}
+
+    for _ in range(MAX_REDUCE_ROUNDS):
+        flat = [(i, chunk) for i, chunks in level.items() for chunk in chunks]
+        # Maiores primeiro para reduzir o padding dentro do lote
+        order = sorted(range(len(flat)), key=lambda k: len(flat[k][1]["input_ids"]), reverse=True)  # noqa: E501
+        outputs = dict(zip(order, _generate_from_ids([flat[k][1]["input_ids"] for k in order])))  # noqa: E501
+        partials = defaultdict(list)
+        for k, (i, _) in enumerate(flat):
+            partials[i].append(outputs[k])
+
+        next_level = {}
+        for i, summaries in partials.items():
+            merged = " ".join(summaries)
+            if len(level[i]) == 1:
+                results[i] = merged
+            else:
+                next_level[i] = encode_chunks(
+                    chunk_sections([merged], SUMMARIZER_CHUNK_TOKENS, 0, token_counter(tokenizer)),  # noqa: E501
+                    tokenizer
+                )
+        if not next_level:
+            break
+        level = next_level
+
+    for i, chunks in level.items():
+        if results[i] is None:
+            results[i] = " ".join(chunk["text"] for chunk in chunks)
+    return results
+
+
+def _combine_summaries(structured_summary: str, ml_summary: str) -> str:
+    """Combina o resumo estruturado com o resumo gerado pelo modelo."""
+    # Se resumo estruturado for muito curto, retorna só ML
+    if len(structured_summary) < 50:
+        final = ml_summary
+    else:
+        # Tenta combinar ambos, dando prioridade ao estruturado
+        final = f"{structured_summary} {ml_summary}"
+
+    final = re.sub(r'\s+', ' ', final).strip()
+    if not final.endswith('.'):
+        final += '.'
+    return final
+
+
+def summary_key(cleaned: str) -> str:
+    """
+    Chave do resumo: texto, modelo, modo (truncate ou chunked) com os
+    parâmetros dos blocos e perfil de inferência, que mudam a saída.
+    """
+    if SUMMARIZER_MODE == "chunked":
+        mode = f"chunked:{SUMMARIZER_CHUNK_TOKENS}:{SUMMARIZER_CHUNK_OVERLAP}:{SUMMARIZER_MAX_CHUNKS}"  # noqa: E501
+    else:
+        mode = f"truncate:{MAX_INPUT_CHARS}"
+    return f"{hash_text(cleaned)}:{SUMMARIZER_MODEL}:{mode}:{get_profile().name}"  # noqa: E501
+
+
+def summarize_texts(texts: List[str]) -> List[str]:
+    """
+    Gera resumos para vários currículos de uma vez.
+
+    A parte baseada em regras roda para todos os textos; apenas os que
+    precisam do modelo ML são enviados ao pipeline, em um único lote
+    ordenado por tamanho. Se o lote falhar, cada item é refeito
+    isoladamente e os que falharem recebem o resumo estruturado.
+    """
+    results: List[Optional[str]] = [None] * len(texts)
+    pending = []  # (índice, texto limpo, resumo estruturado)
+
+    for idx, text in enumerate(texts):
+        if not text.strip():
+            results[idx] = "Texto vazio, não foi possível gerar resumo."
+            continue
+
+        cleaned = clean_text(text)
+
+        if len(cleaned) < 100:
+            results[idx] = "Texto muito curto para gerar resumo adequado."
+            continue
+
+        hit, cached = summary_cache.lookup(summary_key(cleaned))
+        if hit:
+            results[idx] = cached
+            continue
+
+        try:
+            with metrics.track("summarize.structured"):
+                structured_summary = create_structured_summary(cleaned)
+        except Exception as e:
+            results[idx] = f"Erro ao gerar resumo: {str(e)}"
+            continue
 
         # Se resumo estruturado é satisfatório, retorna
         if len(structured_summary) > 80:
-            return structured_summary
-
-        # Caso contrário, usa modelo ML para gerar resumo mais natural
-        input_for_model = cleaned[:MAX_INPUT_CHARS]
-
-        ml_summary = summarizer_pipeline(
-            input_for_model,
-            max_length=180,
-            min_length=50,
-            do_sample=False,
-            num_beams=3,
-            early_stopping=True
-        )[0]["summary_text"]
-
-        # Se resumo estruturado for muito curto, retorna só ML
-        if len(structured_summary) < 50:
-            final = ml_summary
+            results[idx] = structured_summary
+            summary_cache.store(summary_key(cleaned), structured_summary)
         else:
-            # Tenta combinar ambos, dando prioridade ao estruturado
-            final = f"{structured_summary} {ml_summary}"
+            pending.append((idx, cleaned, structured_summary))
+
+    if not pending:
+        return results
 
-        final = re.sub(r'\s+', ' ', final).strip()
-        if not final.endswith('.'):
-            final += '.'
-        return final
+    # Caso contrário, usa modelo ML para gerar resumo mais natural.
+    # Ordenar por tamanho reduz o padding dentro de cada lote.
+    pending.sort(key=lambda item: len(item[1]), reverse=True)
+    if SUMMARIZER_MODE == "chunked":
+        summarize_batch = _summarize_chunked
+        inputs = [cleaned for _, cleaned, _ in pending]
+    else:
+        summarize_batch = _run_summarizer
+        inputs = [cleaned[:MAX_INPUT_CHARS] for _, cleaned, _ in pending]
 
+    try:
+        ml_summaries = summarize_batch(inputs)
     except Exception as e:
-        try:
-            return create_structured_summary(cleaned)
-        except:   # noqa: E722
-            return f"Erro ao gerar resumo: {str(e)}"
+        logger.warning(f"Erro no lote de sumarização, refazendo por item: {str(e)}")  # noqa: E501
+        ml_summaries = []
+        for input_for_model in inputs:
+            try:
+                ml_summaries.append(summarize_batch([input_for_model])[0])
+            except Exception:
+                ml_summaries.append(None)
+
+    for (idx, cleaned, structured_summary), ml_summary in zip(pending, ml_summaries):  # noqa: E501
+        if ml_summary is None:
+            results[idx] = structured_summary
+        else:
+            results[idx] = _combine_summaries(structured_summary, ml_summary)
+            summary_cache.store(summary_key(cleaned), results[idx])
+
+    return results
+
+
+def summarize_text(text: str) -> str:
+    """Função principal para gerar resumo do currículo."""
+    return summarize_texts([text])[0]
 
 
-def analyze_resume_details(text: str) -> Dict[str, any]:
-    """Retorna análise detalhada opcional do currículo."""
+def analyze_resume_details(text: str, summary: Optional[str] = None) -> Dict[str, any]:  # noqa: E501
+    """
+    Retorna análise detalhada opcional do currículo.
+    Se `summary` for informado, o resumo não é gerado novamente.
+    """
     cleaned = clean_text(text)
+    segments = segment_resume(cleaned)
     return {
-        'summary': summarize_text(text),
-        'experience_years': extract_experience_years(cleaned),
-        'job_titles': extract_job_titles(cleaned),
-        'sections_found': list(extract_structured_info(cleaned).keys()),
+        'summary': summary if summary is not None else summarize_text(text),
+        'experience_years': segments.experience_years,
+        'job_titles': segments.job_titles,
+        'skills': extract_skills(cleaned),
+        'sections_found': list(segments.sections.keys()),
         'text_length': len(cleaned),
         'word_count': len(cleaned.split())
     }
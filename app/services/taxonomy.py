@@ -0,0 +1,192 @@
+# app/services/taxonomy.py
+"""Taxonomia de habilidades/cargos e casamento com autômato Aho-Corasick"""
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.config import SKILLS_TAXONOMY_PATH
+
+logger = logging.getLogger(__name__)
+
+KIND_SKILL = "skill"
+KIND_ROLE = "role"
+
+# Caracteres que, colados ao termo, indicam que ele faz parte de outra
+# palavra ("git" em "digital", "js" em "node.js", "c" em "c++")
+_WORD_CHARS = "_+#"
+
+
+@dataclass(frozen=True)
+class Term:
+    name: str
+    kind: str
+    category: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Match:
+    name: str
+    kind: str
+    category: Optional[str]
+    alias: str
+    start: int
+    end: int
+
+
+class AhoCorasick:
+    """
+    Autômato de múltiplos padrões: uma passada pelo texto encontra todas
+    as ocorrências, com custo proporcional ao tamanho do texto (mais o
+    número de ocorrências), independente da quantidade de padrões.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, object]]] = [[]]
+        self._built = False
+
+    def add(self, pattern: str, payload: object) -> None:
+        if self._built:
+            raise RuntimeError("Autômato já compilado")
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = next_node
+        self._outputs[node].append((len(pattern), payload))
+
+    def build(self) -> "AhoCorasick":
+        """Calcula os links de falha em largura (BFS)."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]  # noqa: E501
+        self._built = True
+        return self
+
+    def iter(self, text: str) -> Iterator[Tuple[int, int, object]]:
+        """Gera (início, fim, payload) de cada ocorrência no texto."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, payload in outputs[node]:
+                yield index + 1 - length, index + 1, payload
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char in _WORD_CHARS
+
+
+def _at_boundary(text: str, start: int, end: int) -> bool:
+    if start > 0:
+        before = text[start - 1]
+        if _is_word_char(before) or before == ".":
+            return False
+    if end < len(text):
+        after = text[end]
+        if _is_word_char(after):
+            return False
+        # Ponto seguido de letra continua o termo ("node" em "node.js")
+        if after == "." and end + 1 < len(text) and text[end + 1].isalnum():  # noqa: E501
+            return False
+    return True
+
+
+class Taxonomy:
+    """
+    Habilidades e cargos com seus apelidos, compilados uma única vez em
+    um autômato. O casamento ignora maiúsculas e respeita limites de
+    palavra; ocorrências sobrepostas ficam com o apelido mais longo.
+    """
+
+    def __init__(self, data: dict):
+        self.terms: Dict[str, Term] = {}
+        self._automaton = AhoCorasick()
+        for kind, section in ((KIND_SKILL, "skills"), (KIND_ROLE, "roles")):
+            for name, entry in (data.get(section) or {}).items():
+                entry = entry or {}
+                term = Term(str(name), kind, entry.get("category"))
+                self.terms[term.name] = term
+                aliases = entry.get("aliases") or [name]
+                for alias in aliases:
+                    alias = str(alias).strip().lower()
+                    if alias:
+                        self._automaton.add(alias, (term, alias))
+        self._automaton.build()
+
+    @classmethod
+    def from_yaml(cls, path: str) -> "Taxonomy":
+        import yaml
+
+        with open(path, encoding="utf-8") as f:
+            return cls(yaml.safe_load(f) or {})
+
+    def find(self, text: str, kind: Optional[str] = None) -> List[Match]:
+        """Ocorrências de termos no texto, em ordem, com seus offsets."""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Raro: minúsculas com tamanho diferente desalinhariam offsets
+            lowered = "".join(char.lower()[:1] or char for char in text)
+
+        candidates = [
+            (start, end, term, alias)
+            for start, end, (term, alias) in self._automaton.iter(lowered)
+            if (kind is None or term.kind == kind) and _at_boundary(lowered, start, end)  # noqa: E501
+        ]
+        candidates.sort(key=lambda c: (c[0], -(c[1] - c[0])))
+
+        matches: List[Match] = []
+        last_end = 0
+        for start, end, term, alias in candidates:
+            if start < last_end:
+                continue
+            matches.append(Match(term.name, term.kind, term.category, alias, start, end))  # noqa: E501
+            last_end = end
+        return matches
+
+    def names(self, text: str, kind: Optional[str] = None) -> List[str]:
+        """Nomes canônicos encontrados, sem duplicatas, na ordem do texto."""
+        return list(dict.fromkeys(match.name for match in self.find(text, kind)))  # noqa: E501
+
+    def skills(self, text: str) -> List[str]:
+        return self.names(text, KIND_SKILL)
+
+    def roles(self, text: str) -> List[str]:
+        return self.names(text, KIND_ROLE)
+
+
+_taxonomy: Optional[Taxonomy] = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_taxonomy() -> Taxonomy:
+    """Taxonomia configurada (SKILLS_TAXONOMY_PATH), compilada no primeiro uso."""  # noqa: E501
+    global _taxonomy
+    with _taxonomy_lock:
+        if _taxonomy is None:
+            _taxonomy = Taxonomy.from_yaml(SKILLS_TAXONOMY_PATH)
+            logger.info(f"Taxonomia carregada: {len(_taxonomy.terms)} termos de {SKILLS_TAXONOMY_PATH}")  # noqa: E501
+        return _taxonomy
+
+
+def find_matches(text: str, kind: Optional[str] = None) -> List[Match]:
+    """Atalho para `get_taxonomy().find`."""
+    return get_taxonomy().find(text, kind)
@@ -0,0 +1,166 @@
+# app/services/uploads.py
+"""Uploads gravados em disco em blocos, com limites de tamanho e páginas"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from fastapi import UploadFile
+from pdf2image import pdfinfo_from_path
+
+from app.config import (
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_MAX_FILE_MB,
+    UPLOAD_MAX_FILE_PAGES,
+    UPLOAD_MAX_REQUEST_MB,
+    UPLOAD_MAX_REQUEST_PAGES,
+    UPLOAD_SPOOL_DIR
+)
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+class UploadLimitError(Exception):
+    """Arquivo ou requisição acima dos limites de upload (HTTP 413)."""
+
+
+@dataclass
+class SpooledUpload:
+    """Upload gravado em disco, com o hash calculado durante a gravação."""
+    filename: str
+    path: str
+    size: int
+    sha256: str
+    pages: Optional[int] = None
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _write_chunk(out, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    out.write(chunk)
+
+
+async def spool(
+    file: UploadFile,
+    max_bytes: int,
+    directory: Optional[str] = None,
+    chunk_size: Optional[int] = None
+) -> SpooledUpload:
+    """
+    Copia o upload para um arquivo em `directory`, bloco a bloco, sem
+    manter o conteúdo inteiro em memória. Passando de `max_bytes`, o
+    arquivo parcial é apagado e UploadLimitError é lançada.
+    """
+    directory = directory or UPLOAD_SPOOL_DIR
+    chunk_size = chunk_size or UPLOAD_CHUNK_SIZE
+    os.makedirs(directory, exist_ok=True)
+    suffix = os.path.splitext(file.filename or "")[1].lower()
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=directory)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadLimitError(f"{file.filename} excede o limite de {max_bytes / MB:.0f} MB")  # noqa: E501
+                # Hash e escrita fora do event loop
+                await asyncio.to_thread(_write_chunk, out, digest, chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return SpooledUpload(file.filename, path, size, digest.hexdigest())
+
+
+def count_pages(upload: SpooledUpload) -> Optional[int]:
+    """Páginas do PDF (imagens contam 1); None se o poppler não souber."""
+    if not upload.filename.lower().endswith(".pdf"):
+        return 1
+    try:
+        return int(pdfinfo_from_path(upload.path)["Pages"])
+    except Exception as e:
+        logger.warning(f"Não foi possível contar as páginas de {upload.filename}: {str(e)}")  # noqa: E501
+        return None
+
+
+def check_pages(
+    uploads: List[SpooledUpload],
+    max_file_pages: int = UPLOAD_MAX_FILE_PAGES,
+    max_request_pages: int = UPLOAD_MAX_REQUEST_PAGES
+) -> None:
+    """Conta as páginas de cada arquivo e aplica os limites (0 = sem limite)."""  # noqa: E501
+    if not max_file_pages and not max_request_pages:
+        return
+    total = 0
+    for upload in uploads:
+        upload.pages = count_pages(upload)
+        if upload.pages is None:
+            continue
+        if max_file_pages and upload.pages > max_file_pages:
+            raise UploadLimitError(f"{upload.filename} tem {upload.pages} páginas (limite {max_file_pages})")  # noqa: E501
+        total += upload.pages
+        if max_request_pages and total > max_request_pages:
+            raise UploadLimitError(f"A requisição passa de {max_request_pages} páginas")  # noqa: E501
+
+
+async def spool_uploads(
+    files: List[UploadFile],
+    max_file_bytes: int = int(UPLOAD_MAX_FILE_MB * MB),
+    max_request_bytes: int = int(UPLOAD_MAX_REQUEST_MB * MB)
+) -> List[Tuple[str, Optional[SpooledUpload]]]:
+    """
+    Grava todos os uploads em disco aplicando os limites por arquivo e por
+    requisição. Uploads ilegíveis viram None; se algum limite for
+    excedido, os arquivos já gravados são apagados.
+    """
+    uploads: List[Tuple[str, Optional[SpooledUpload]]] = []
+    total = 0
+    try:
+        for file in files:
+            # Tamanho informado pelo multipart: recusa antes de copiar
+            if file.size is not None and file.size > max_file_bytes:
+                raise UploadLimitError(f"{file.filename} excede o limite de {max_file_bytes / MB:.0f} MB")  # noqa: E501
+
+            remaining = max_request_bytes - total
+            try:
+                upload = await spool(file, min(max_file_bytes, remaining))
+            except UploadLimitError:
+                if remaining < max_file_bytes:
+                    raise UploadLimitError(f"A requisição excede o limite de {max_request_bytes / MB:.0f} MB")  # noqa: E501
+                raise
+            except Exception as e:
+                logger.error(f"Erro ao ler {file.filename}: {str(e)}")
+                uploads.append((file.filename, None))
+                continue
+
+            total += upload.size
+            uploads.append((file.filename, upload))
+
+        await asyncio.to_thread(
+            check_pages, [upload for _, upload in uploads if upload]
+        )
+    except BaseException:
+        remove_uploads(uploads)
+        raise
+    return uploads
+
+
+def remove_uploads(uploads: Iterable[Tuple[str, object]]) -> None:
+    """Apaga os arquivos gravados (conteúdos em bytes são ignorados)."""
+    for _, content in uploads:
+        if isinstance(content, SpooledUpload):
+            content.remove()
@@ -0,0 +1,160 @@
+# benchmarks/bench_inference.py
+"""
+Latência e concordância dos perfis de inferência contra o baseline fp32.
+
+Uso:
+    python -m benchmarks.bench_inference [--profiles quality,balanced,fast]
+                                         [--task qa|summarize|all]
+                                         [--json resultado.json]
+
+O baseline é o perfil `quality` (fp32, beam search). Para cada perfil os
+modelos são carregados de novo, aquecidos com uma chamada e executados
+sobre o mesmo conjunto fixo de currículos. A concordância do QA é a
+fração de respostas Sim/Não iguais às do baseline; a dos resumos é a
+sobreposição média de termos (Jaccard) com o resumo do baseline.
+Requer torch e transformers instalados.
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from app.services import question_answering, summarizer
+from app.services.executors import configure_torch_threads
+from app.services.inference import PROFILES, get_profile
+from app.services.ranking import tokenize
+
+RESUMES = [
+    "Desenvolvedor Python com 6 anos de experiência em Django, FastAPI, "
+    "PostgreSQL e AWS. Liderou a migração de um monólito para "
+    "microsserviços com Docker e Kubernetes.",
+    "Analista de dados com Python, Pandas, SQL e Power BI. Construiu "
+    "pipelines de ETL com Airflow e modelos de previsão de demanda.",
+    "Desenvolvedora frontend com React, TypeScript e Next.js. Experiência "
+    "com testes em Jest e Cypress e design systems no Figma.",
+    "Engenheiro Java com Spring Boot, Kafka e Oracle em sistemas "
+    "bancários. 10 anos de experiência em arquitetura de software.",
+    "Designer de produto com foco em pesquisa com usuários, prototipação "
+    "no Figma e métricas de conversão em e-commerce.",
+    "Engenheiro de machine learning com PyTorch, Hugging Face e MLOps "
+    "(MLflow). Colocou em produção modelos de NLP para atendimento.",
+    "Técnico de suporte com Linux, redes e scripts em Bash. Atendimento "
+    "a usuários e manutenção de servidores on-premise.",
+    "Desenvolvedor mobile com Flutter e Kotlin, publicação de apps na "
+    "Play Store e integração com Firebase.",
+]
+
+QUESTIONS = [
+    "Essa pessoa tem experiência com Python e APIs REST?",
+    "O candidato pode atuar como desenvolvedor backend sênior?",
+    "Tem experiência com computação em nuvem?",
+]
+
+
+def _answer_label(text: str) -> str:
+    return question_answering.extract_answer_and_justification(text)[0]
+
+
+def _jaccard(a: str, b: str) -> float:
+    ta, tb = set(tokenize(a)), set(tokenize(b))
+    if not ta and not tb:
+        return 1.0
+    return len(ta & tb) / len(ta | tb)
+
+
+def _timed(fn: Callable[..., List[str]], *args) -> tuple:
+    start = time.perf_counter()
+    output = fn(*args)[0]
+    return output, (time.perf_counter() - start) * 1000
+
+
+def run_qa(profile_name: str) -> Dict[str, object]:
+    profile = get_profile(profile_name)
+    qa = question_answering._load_qa_model(profile)
+    prompts = [
+        question_answering.PROMPT_TEMPLATE.format(curriculo=resume, query=question)  # noqa: E501
+        for resume in RESUMES
+        for question in QUESTIONS
+    ]
+    question_answering.generate_batch(prompts[:1], qa=qa)  # aquecimento
+
+    outputs, latencies = [], []
+    for prompt in prompts:
+        output, elapsed = _timed(question_answering.generate_batch, [prompt], 800, qa)  # noqa: E501
+        outputs.append(output)
+        latencies.append(elapsed)
+
+    del qa
+    gc.collect()
+    return {"outputs": outputs, "latencies": latencies}
+
+
+def run_summarize(profile_name: str) -> Dict[str, object]:
+    profile = get_profile(profile_name)
+    pipe = summarizer._load_summarizer_pipeline(profile)
+    summarizer._run_summarizer(RESUMES[:1], pipe, profile)  # aquecimento
+
+    outputs, latencies = [], []
+    for resume in RESUMES:
+        output, elapsed = _timed(summarizer._run_summarizer, [resume], pipe, profile)  # noqa: E501
+        outputs.append(output)
+        latencies.append(elapsed)
+
+    del pipe
+    gc.collect()
+    return {"outputs": outputs, "latencies": latencies}
+
+
+def _report(task: str, runs: Dict[str, Dict], agreement: Callable[[str, str], float]) -> List[dict]:  # noqa: E501
+    baseline = runs["quality"]["outputs"]
+    rows = []
+    for name, run in runs.items():
+        latencies = sorted(run["latencies"])
+        rows.append({
+            "task": task,
+            "profile": name,
+            "mean_ms": round(statistics.mean(latencies), 1),
+            "p50_ms": round(statistics.median(latencies), 1),
+            "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))], 1),
+            "agreement": round(statistics.mean(
+                agreement(out, ref) for out, ref in zip(run["outputs"], baseline)  # noqa: E501
+            ), 3)
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", default=",".join(PROFILES))
+    parser.add_argument("--task", choices=["qa", "summarize", "all"], default="all")  # noqa: E501
+    parser.add_argument("--json", help="Grava as linhas do relatório em JSON")  # noqa: E501
+    args = parser.parse_args()
+
+    configure_torch_threads()
+    names = ["quality"] + [
+        name.strip() for name in args.profiles.split(",")
+        if name.strip() and name.strip() != "quality"
+    ]
+
+    rows = []
+    if args.task in ("qa", "all"):
+        runs = {name: run_qa(name) for name in names}
+        rows += _report("qa", runs, lambda a, b: float(_answer_label(a) == _answer_label(b)))  # noqa: E501
+    if args.task in ("summarize", "all"):
+        runs = {name: run_summarize(name) for name in names}
+        rows += _report("summarize", runs, _jaccard)
+
+    print(f"{'tarefa':<10} {'perfil':<9} {'média ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'concordância':>13}")  # noqa: E501
+    for row in rows:
+        print(f"{row['task']:<10} {row['profile']:<9} {row['mean_ms']:>9} {row['p50_ms']:>8} {row['p95_ms']:>8} {row['agreement']:>13}")  # noqa: E501
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
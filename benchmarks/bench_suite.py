@@ -0,0 +1,284 @@
+# benchmarks/bench_suite.py
+"""
+Suíte de benchmarks reproduzível: etapas isoladas e ponta a ponta pela API.
+
+Uso:
+    python -m benchmarks.bench_suite [--docs 20] [--seed 42] [--repeat 3]
+                                     [--stages preprocess_image,...]
+                                     [--skip-api] [--real-models]
+                                     [--json resultado.json]
+                                     [--compare baseline.json]
+
+Gera um corpus sintético (`benchmarks.corpus`) e mede cada etapa
+isoladamente e o fluxo completo via `POST /analyze/`, com os caches
+desligados. Por padrão os modelos são trocados pelos stubs de
+`benchmarks.stubs`, então nada é baixado; `--real-models` usa os
+modelos de verdade.
+
+O resultado (JSON) traz, por etapa, vazão, p50/p95/p99 e o pico de RSS
+do processo ao fim da etapa, além do commit e das ferramentas
+disponíveis (`pdftotext`/`pdftoppm`), para comparar execuções entre
+commits com `--compare`.
+"""
+
+import os
+
+# Antes de importar o app: cada chamada deve fazer o trabalho completo
+os.environ.setdefault("CACHE_ENABLED", "false")
+os.environ.setdefault("RESUME_STORE_ENABLED", "false")
+os.environ.setdefault("MODELS_WARMUP", "false")
+
+import argparse  # noqa: E402
+import io  # noqa: E402
+import json  # noqa: E402
+import platform  # noqa: E402
+import resource  # noqa: E402
+import shutil  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+import uuid  # noqa: E402
+from datetime import datetime, timezone  # noqa: E402
+from typing import Callable, Dict, List, Tuple  # noqa: E402
+
+import numpy as np  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from app.services import ocr, question_answering, summarizer  # noqa: E402
+from benchmarks import corpus, stubs  # noqa: E402
+
+QUESTIONS = [
+    "Essa pessoa tem experiência com Python e Django?",
+    "Is this candidate a good fit for a Data Engineer role with Airflow?",
+    "O candidato pode atuar como desenvolvedor frontend com React?",
+]
+
+STAGES = (
+    "preprocess_image",
+    "extract_text",
+    "clean_text",
+    "extract_structured_info",
+    "summarize_text",
+    "fallback_analysis",
+    "answer_question",
+)
+
+MEDIA_TYPES = {".pdf": "application/pdf", ".png": "image/png", ".jpg": "image/jpeg"}  # noqa: E501
+
+
+def peak_rss_mb() -> float:
+    """Pico de memória residente do processo até agora (Linux: KB)."""
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)  # noqa: E501
+
+
+def summarize_latencies(latencies: List[float], elapsed: float, items: int) -> Dict[str, float]:  # noqa: E501
+    values = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99]) if len(values) else (0, 0, 0)  # noqa: E501
+    return {
+        "calls": len(latencies),
+        "items": items,
+        "total_s": round(elapsed, 4),
+        "throughput_per_s": round(items / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+    }
+
+
+def measure(calls: List[Callable[[], object]], repeat: int) -> Dict[str, float]:  # noqa: E501
+    """Executa cada chamada `repeat` vezes, medindo uma a uma."""
+    if calls:
+        calls[0]()  # aquecimento (imports, compilação de regex, leitores)
+    latencies = []
+    errors = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for call in calls:
+            call_start = time.perf_counter()
+            result = call()
+            latencies.append(time.perf_counter() - call_start)
+            if isinstance(result, str) and result.startswith("[ERRO"):
+                errors += 1
+    elapsed = time.perf_counter() - start
+    return {
+        **summarize_latencies(latencies, elapsed, len(latencies)),
+        "errors": errors,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def _page_images(documents: List[corpus.Document]) -> List[np.ndarray]:
+    images = []
+    for document in documents:
+        if document.kind == corpus.KIND_IMAGE:
+            images.append(np.array(Image.open(io.BytesIO(document.content))))  # noqa: E501
+    return images
+
+
+def stage_calls(documents: List[corpus.Document]) -> Dict[str, List[Callable[[], object]]]:  # noqa: E501
+    """Entradas de cada etapa, preparadas fora da medição."""
+    texts = [document.text for document in documents]
+    cleaned = [summarizer.clean_text(text) for text in texts]
+    summaries = [summarizer.create_structured_summary(text) for text in cleaned]  # noqa: E501
+    pairs = [
+        (summary, QUESTIONS[i % len(QUESTIONS)])
+        for i, summary in enumerate(summaries)
+    ]
+    return {
+        "preprocess_image": [
+            lambda image=image: ocr.preprocess_image(image)
+            for image in _page_images(documents)
+        ],
+        "extract_text": [
+            lambda d=d: ocr.extract_text(d.filename, d.content)
+            for d in documents
+        ],
+        "clean_text": [lambda t=t: summarizer.clean_text(t) for t in texts],
+        "extract_structured_info": [
+            lambda t=t: summarizer.extract_structured_info(t) for t in cleaned
+        ],
+        "summarize_text": [
+            lambda t=t: summarizer.summarize_text(t) for t in texts
+        ],
+        "fallback_analysis": [
+            lambda p=p: question_answering.fallback_analysis(*p) for p in pairs
+        ],
+        "answer_question": [
+            lambda p=p: question_answering.answer_question(*p) for p in pairs
+        ],
+    }
+
+
+def _form(batch: List[corpus.Document], query: str) -> Tuple[list, dict]:
+    files = [
+        ("files", (d.filename, d.content, MEDIA_TYPES[os.path.splitext(d.filename)[1]]))  # noqa: E501
+        for d in batch
+    ]
+    data = {"request_id": str(uuid.uuid4()), "user_id": "bench"}
+    if query:
+        data["query"] = query
+    return files, data
+
+
+def run_api(documents: List[corpus.Document], repeat: int, batch_size: int) -> Dict[str, Dict]:  # noqa: E501
+    """Fluxo completo por `POST /analyze/`, com e sem pergunta."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    client = TestClient(app)
+    batches = [documents[i:i + batch_size] for i in range(0, len(documents), batch_size)]  # noqa: E501
+    results = {}
+    for name, query in (("analyze_summary", None), ("analyze_query", QUESTIONS[0])):  # noqa: E501
+        latencies, statuses = [], {}
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for batch in batches:
+                files, data = _form(batch, query)
+                call_start = time.perf_counter()
+                response = client.post("/analyze/", files=files, data=data)
+                latencies.append(time.perf_counter() - call_start)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1  # noqa: E501
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            **summarize_latencies(latencies, elapsed, len(documents) * repeat),  # noqa: E501
+            "batch_size": batch_size,
+            "status_codes": {str(k): v for k, v in sorted(statuses.items())},
+            "peak_rss_mb": peak_rss_mb(),
+        }
+    return results
+
+
+def environment(args: argparse.Namespace) -> Dict[str, object]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "models": "real" if args.real_models else "stubs",
+        "docs": args.docs,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "tools": {tool: shutil.which(tool) is not None for tool in ("pdftotext", "pdftoppm")},  # noqa: E501
+    }
+
+
+def compare(current: Dict, baseline_path: str) -> None:
+    """Variação de p50/p95 e vazão em relação a uma execução anterior."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nComparação com {baseline_path} (commit {baseline['environment'].get('commit')})")  # noqa: E501
+    print(f"{'etapa':<26}{'p50 ms':>18}{'p95 ms':>18}{'vazão/s':>18}")
+    for section in ("stages", "api"):
+        for name, now in current.get(section, {}).items():
+            before = baseline.get(section, {}).get(name)
+            if not before:
+                continue
+            cells = []
+            for key in ("p50_ms", "p95_ms", "throughput_per_s"):
+                delta = (now[key] / before[key] - 1) * 100 if before[key] else 0.0  # noqa: E501
+                cells.append(f"{now[key]:>9.2f} ({delta:+5.1f}%)")
+            print(f"{name:<26}" + "".join(f"{cell:>18}" for cell in cells))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--max-pages", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=4, help="Arquivos por requisição na API")  # noqa: E501
+    parser.add_argument("--stages", default=",".join(STAGES))
+    parser.add_argument("--skip-api", action="store_true")
+    parser.add_argument("--real-models", action="store_true")
+    parser.add_argument("--json", help="Grava o resultado neste arquivo")
+    parser.add_argument("--compare", help="Resultado anterior (JSON) para comparação")  # noqa: E501
+    args = parser.parse_args()
+
+    if not args.real_models:
+        stubs.install()
+
+    documents = corpus.build_corpus(args.docs, args.seed, args.max_pages)
+    calls = stage_calls(documents)
+    selected = [name for name in args.stages.split(",") if name]
+    unknown = set(selected) - set(STAGES)
+    if unknown:
+        parser.error(f"Etapas desconhecidas: {', '.join(sorted(unknown))}")
+
+    result = {
+        "environment": environment(args),
+        "corpus": {
+            kind: sum(1 for d in documents if d.kind == kind)
+            for kind in corpus.KINDS
+        },
+        "stages": {},
+    }
+    for name in selected:
+        print(f"Medindo {name}...", file=sys.stderr)
+        result["stages"][name] = measure(calls[name], args.repeat)
+    if not args.skip_api:
+        print("Medindo a API...", file=sys.stderr)
+        result["api"] = run_api(documents, args.repeat, args.batch_size)
+    result["peak_rss_mb"] = peak_rss_mb()
+
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        compare(result, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+# benchmarks/corpus.py
+"""
+Corpus sintético e determinístico de currículos para os benchmarks.
+
+Cada documento é gerado a partir de uma semente e sai em um de três
+formatos: PDF com camada de texto (montado à mão, fonte Helvetica),
+PDF "escaneado" (só imagens, com ruído e leve rotação) ou imagem
+PNG/JPEG de uma página. O texto original fica junto do documento para
+as etapas que não dependem do OCR.
+"""
+
+import io
+import random
+import textwrap
+from dataclasses import dataclass
+from typing import List
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+KIND_TEXT_PDF = "text_pdf"
+KIND_SCAN_PDF = "scan_pdf"
+KIND_IMAGE = "image"
+KINDS = (KIND_TEXT_PDF, KIND_SCAN_PDF, KIND_IMAGE)
+
+PAGE_SIZE = (850, 1100)  # pixels (~100 dpi em A4)
+PDF_PAGE_SIZE = (595, 842)  # pontos (A4)
+
+SKILLS = [
+    "Python", "Django", "FastAPI", "Flask", "PostgreSQL", "MongoDB", "Redis",
+    "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Terraform", "Java",
+    "Spring Boot", "Kafka", "React", "TypeScript", "Node.js", "SQL",
+    "Pandas", "PyTorch", "Airflow", "Power BI", "Linux", "Git", "Scrum"
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Tyrell"]  # noqa: E501
+
+TEMPLATES = {
+    "pt": {
+        "roles": [
+            "Desenvolvedor Python", "Engenheiro de Dados", "Analista de Dados",
+            "Desenvolvedora Frontend", "Engenheiro de Software",
+            "Cientista de Dados", "Arquiteto de Software"
+        ],
+        "header": "{name}\n{role}\n{email} | São Paulo, SP",
+        "summary": "Resumo\n{role} com mais de {years} anos de experiência em {skills}.",  # noqa: E501
+        "experience": "Experiência Profissional\n{role} na {company} ({start}–{end}). Atuação com {skills}. Redução de {gain}% no tempo de resposta das APIs.",  # noqa: E501
+        "education": "Formação\nGraduação em Ciência da Computação, ensino superior completo.",  # noqa: E501
+        "skills": "Habilidades\n{skills}. Soft skills: comunicação e trabalho em equipe.",  # noqa: E501
+        "certs": "Certificações\nCursos de {skill} e arquitetura em nuvem.",
+    },
+    "en": {
+        "roles": [
+            "Python Developer", "Data Engineer", "Data Analyst",
+            "Frontend Developer", "Software Engineer", "Data Scientist",
+            "Software Architect"
+        ],
+        "header": "{name}\n{role}\n{email} | Lisbon, PT",
+        "summary": "Summary\n{role} with {years} years of experience in {skills}.",  # noqa: E501
+        "experience": "Professional Experience\n{role} at {company} ({start}–{end}). Worked with {skills}. Cut API response time by {gain}%.",  # noqa: E501
+        "education": "Education\nBachelor's degree in Computer Science.",
+        "skills": "Skills\n{skills}. Soft skills: communication and teamwork.",  # noqa: E501
+        "certs": "Certifications\n{skill} courses and cloud architecture.",
+    }
+}
+NAMES = ["Ana Souza", "Bruno Lima", "Carla Dias", "Diego Alves", "Elisa Rocha", "Felipe Melo"]  # noqa: E501
+
+
+@dataclass
+class Document:
+    filename: str
+    content: bytes
+    kind: str
+    language: str
+    pages: int
+    text: str
+
+
+def resume_pages(rng: random.Random, language: str, pages: int) -> List[str]:  # noqa: E501
+    """Texto de um currículo com `pages` páginas."""
+    template = TEMPLATES[language]
+    role = rng.choice(template["roles"])
+    name = rng.choice(NAMES)
+
+    def skills(k: int) -> str:
+        return ", ".join(rng.sample(SKILLS, k))
+
+    first = "\n\n".join([
+        template["header"].format(name=name, role=role, email=name.split()[0].lower() + "@example.com"),  # noqa: E501
+        template["summary"].format(role=role, years=rng.randint(1, 15), skills=skills(4)),  # noqa: E501
+        template["education"],
+        template["skills"].format(skills=skills(8)),
+        template["certs"].format(skill=rng.choice(SKILLS)),
+    ])
+    result = [first]
+    for _ in range(pages - 1):
+        blocks = []
+        for _ in range(3):
+            start = rng.randint(2008, 2020)
+            blocks.append(template["experience"].format(
+                role=rng.choice(template["roles"]),
+                company=rng.choice(COMPANIES),
+                start=start,
+                end=start + rng.randint(1, 4),
+                skills=skills(3),
+                gain=rng.randint(10, 60)
+            ))
+        result.append("\n\n".join(blocks))
+    return result
+
+
+def _wrap(text: str, width: int) -> List[str]:
+    lines = []
+    for paragraph in text.split("\n"):
+        lines.extend(textwrap.wrap(paragraph, width) or [""])
+    return lines
+
+
+def _pdf_escape(line: str) -> bytes:
+    encoded = line.encode("cp1252", errors="replace")
+    return encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")  # noqa: E501
+
+
+def text_pdf(pages: List[str]) -> bytes:
+    """PDF mínimo com camada de texto (Helvetica, WinAnsiEncoding)."""
+    width, height = PDF_PAGE_SIZE
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # Pages, preenchido depois de conhecer as páginas
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",  # noqa: E501
+    ]
+    kids = []
+    for text in pages:
+        stream = [b"BT /F1 11 Tf 14 TL 50 %d Td" % (height - 60)]
+        for line in _wrap(text, 90):
+            stream.append(b"(" + _pdf_escape(line) + b") Tj T*")
+        stream.append(b"ET")
+        content = b"\n".join(stream)
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")  # noqa: E501
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (width, height, content_id)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d >>" % len(kids)  # noqa: E501
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, xref)
+    )
+    return out.getvalue()
+
+
+def render_page(text: str, rng: random.Random, noisy: bool = True) -> Image.Image:  # noqa: E501
+    """Página em escala de cinza com o texto; `noisy` simula digitalização."""  # noqa: E501
+    image = Image.new("L", PAGE_SIZE, 255)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=18)
+    y = 50
+    for line in _wrap(text, 70):
+        draw.text((50, y), line, fill=0, font=font)
+        y += 24
+        if y > PAGE_SIZE[1] - 50:
+            break
+    if not noisy:
+        return image
+
+    image = image.rotate(rng.uniform(-1.5, 1.5), fillcolor=255, resample=Image.Resampling.BILINEAR)  # noqa: E501
+    image = image.filter(ImageFilter.GaussianBlur(0.6))
+    pixels = image.load()
+    for _ in range(PAGE_SIZE[0] * PAGE_SIZE[1] // 400):
+        x, y = rng.randrange(PAGE_SIZE[0]), rng.randrange(PAGE_SIZE[1])
+        pixels[x, y] = rng.choice((0, 96, 160))
+    return image
+
+
+def scan_pdf(images: List[Image.Image]) -> bytes:
+    out = io.BytesIO()
+    images[0].save(out, "PDF", resolution=100.0, save_all=True, append_images=images[1:])  # noqa: E501
+    return out.getvalue()
+
+
+def image_bytes(image: Image.Image, fmt: str) -> bytes:
+    out = io.BytesIO()
+    image.save(out, fmt)
+    return out.getvalue()
+
+
+def build_corpus(size: int = 20, seed: int = 42, max_pages: int = 10) -> List[Document]:  # noqa: E501
+    """
+    `size` documentos alternando formato e idioma; PDFs têm de 1 a
+    `max_pages` páginas. A mesma semente gera sempre os mesmos bytes.
+    """
+    rng = random.Random(seed)
+    documents = []
+    for index in range(size):
+        kind = KINDS[index % len(KINDS)]
+        language = ("pt", "en")[(index // len(KINDS)) % 2]
+        pages = 1 if kind == KIND_IMAGE else rng.randint(1, max_pages)
+        texts = resume_pages(rng, language, pages)
+
+        if kind == KIND_TEXT_PDF:
+            filename, content = f"cv_{index:03d}.pdf", text_pdf(texts)
+        elif kind == KIND_SCAN_PDF:
+            images = [render_page(text, rng) for text in texts]
+            filename, content = f"cv_{index:03d}.pdf", scan_pdf(images)
+        else:
+            fmt = rng.choice(("PNG", "JPEG"))
+            filename = f"cv_{index:03d}.{'png' if fmt == 'PNG' else 'jpg'}"
+            content = image_bytes(render_page(texts[0], rng), fmt)
+
+        documents.append(Document(
+            filename, content, kind, language, pages, "\n\n".join(texts)
+        ))
+    return documents
@@ -0,0 +1,261 @@
+# benchmarks/load_test.py
+"""
+Gerador de carga em malha fechada para `POST /analyze/`.
+
+Uso:
+    python -m benchmarks.load_test [--url http://localhost:8000]
+                                   [--concurrency 1,2,4,8,16]
+                                   [--duration 20] [--files 1-3]
+                                   [--mix text_pdf=0.5,scan_pdf=0.3,image=0.2]
+                                   [--query-ratio 0.5] [--slo-p95-ms 5000]
+                                   [--real-models] [--json carga.json]
+
+Cada usuário virtual envia uma requisição, espera a resposta e envia a
+próxima (malha fechada). A carga sobe em degraus de concorrência, cada um
+com `--duration` segundos; por degrau são medidos vazão, distribuição de
+latência e taxa de erros.
+
+Sem `--url` o app roda no mesmo processo via `httpx.ASGITransport` (sem
+lifespan) e, por padrão, com os modelos trocados pelos stubs de
+`benchmarks.stubs` e os caches desligados: o resultado isola o custo da
+API, do OCR de PDF e do agendamento entre os pools. Com `--url` a carga
+vai para um servidor já no ar (uvicorn ou gunicorn), com os modelos que
+ele tiver carregado.
+
+O ponto de saturação é o primeiro degrau em que a vazão para de crescer
+(ganho menor que `--min-gain`) ou em que o p95 ou a taxa de erros
+ultrapassam o SLO.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+from benchmarks import corpus
+
+QUERIES = [
+    "Quem se encaixa melhor para vaga de Engenheiro Python?",
+    "Essa pessoa tem experiência com Docker e Kubernetes?",
+    "Is this candidate a fit for a Data Engineer role?",
+]
+
+MEDIA_TYPES = {".pdf": "application/pdf", ".png": "image/png", ".jpg": "image/jpeg"}  # noqa: E501
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        kind, _, weight = part.partition("=")
+        if kind not in corpus.KINDS:
+            raise argparse.ArgumentTypeError(f"Tipo desconhecido: {kind}")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def parse_range(value: str) -> Tuple[int, int]:
+    low, _, high = value.partition("-")
+    return int(low), int(high or low)
+
+
+class RequestFactory:
+    """Monta requisições aleatórias (mas reproduzíveis) a partir do corpus."""
+
+    def __init__(self, documents: List[corpus.Document], mix: Dict[str, float], files: Tuple[int, int], query_ratio: float, seed: int):  # noqa: E501
+        self.by_kind = {
+            kind: [d for d in documents if d.kind == kind]
+            for kind in mix
+        }
+        self.kinds = [kind for kind in mix if self.by_kind[kind]]
+        self.weights = [mix[kind] for kind in self.kinds]
+        self.files = files
+        self.query_ratio = query_ratio
+        self.rng = random.Random(seed)
+
+    def build(self) -> Tuple[list, dict, int]:
+        count = self.rng.randint(*self.files)
+        files = []
+        for _ in range(count):
+            kind = self.rng.choices(self.kinds, self.weights)[0]
+            document = self.rng.choice(self.by_kind[kind])
+            media_type = MEDIA_TYPES[os.path.splitext(document.filename)[1]]
+            files.append(("files", (document.filename, document.content, media_type)))  # noqa: E501
+        data = {"request_id": str(uuid.uuid4()), "user_id": "load-test"}
+        if self.rng.random() < self.query_ratio:
+            data["query"] = self.rng.choice(QUERIES)
+        return files, data, count
+
+
+async def virtual_user(client: httpx.AsyncClient, factory: RequestFactory, deadline: float, samples: list, endpoint: str) -> None:  # noqa: E501
+    while time.perf_counter() < deadline:
+        files, data, count = factory.build()
+        start = time.perf_counter()
+        try:
+            response = await client.post(endpoint, files=files, data=data)
+            status = response.status_code
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        samples.append((time.perf_counter() - start, status, count))
+
+
+def summarize_step(concurrency: int, samples: list, elapsed: float, slo_p95_ms: float, max_error_rate: float) -> Dict[str, object]:  # noqa: E501
+    latencies = np.array([latency for latency, _, _ in samples]) * 1000
+    errors = sum(1 for _, status, _ in samples if not (isinstance(status, int) and status < 400))  # noqa: E501
+    statuses: Dict[str, int] = {}
+    for _, status, _ in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(samples) else (0, 0, 0)  # noqa: E501
+    error_rate = errors / len(samples) if samples else 0.0
+    return {
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "files": sum(count for _, _, count in samples),
+        "elapsed_s": round(elapsed, 2),
+        "rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "files_per_s": round(sum(count for _, _, count in samples) / elapsed, 2) if elapsed else 0.0,  # noqa: E501
+        "p50_ms": round(float(p50), 1),
+        "p95_ms": round(float(p95), 1),
+        "p99_ms": round(float(p99), 1),
+        "max_ms": round(float(latencies.max()), 1) if len(samples) else 0.0,
+        "error_rate": round(error_rate, 4),
+        "status_codes": statuses,
+        "within_slo": bool(samples) and p95 <= slo_p95_ms and error_rate <= max_error_rate,  # noqa: E501
+    }
+
+
+def saturation(steps: List[Dict[str, object]], min_gain: float) -> Dict[str, object]:  # noqa: E501
+    """Primeiro degrau fora do SLO ou sem ganho de vazão relevante."""
+    saturated_at, reason = None, None
+    for previous, step in zip([None] + steps, steps):
+        if not step["within_slo"]:
+            saturated_at, reason = step["concurrency"], "slo"
+            break
+        if previous and step["rps"] < previous["rps"] * (1 + min_gain):
+            saturated_at, reason = step["concurrency"], "throughput"
+            break
+
+    within = [step["concurrency"] for step in steps if step["within_slo"]]
+    peak = max(steps, key=lambda step: step["rps"], default=None)
+    return {
+        "saturated_at": saturated_at,
+        "reason": reason,
+        "max_concurrency_within_slo": max(within, default=None),
+        "peak_rps": peak["rps"] if peak else None,
+        "peak_rps_concurrency": peak["concurrency"] if peak else None,
+    }
+
+
+def make_client(args: argparse.Namespace) -> httpx.AsyncClient:
+    timeout = httpx.Timeout(args.timeout)
+    if args.url:
+        limits = httpx.Limits(max_connections=max(args.levels))
+        return httpx.AsyncClient(base_url=args.url, timeout=timeout, limits=limits)  # noqa: E501
+
+    # Antes de importar o app, para valer na leitura do app.config
+    if not args.cache:
+        os.environ.setdefault("CACHE_ENABLED", "false")
+    os.environ.setdefault("RESUME_STORE_ENABLED", "false")
+    os.environ.setdefault("MODELS_WARMUP", "false")
+    from app.main import app
+
+    if not args.real_models:
+        from benchmarks import stubs
+
+        stubs.install()
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=timeout)  # noqa: E501
+
+
+async def run(args: argparse.Namespace) -> Dict[str, object]:
+    documents = corpus.build_corpus(args.corpus_size, args.seed, args.max_pages)  # noqa: E501
+    factory = RequestFactory(documents, args.mix, args.files, args.query_ratio, args.seed)  # noqa: E501
+    steps = []
+
+    async with make_client(args) as client:
+        if args.warmup:
+            files, data, _ = factory.build()
+            await client.post(args.endpoint, files=files, data=data)
+
+        for concurrency in args.levels:
+            samples: list = []
+            start = time.perf_counter()
+            deadline = start + args.duration
+            await asyncio.gather(*(
+                virtual_user(client, factory, deadline, samples, args.endpoint)  # noqa: E501
+                for _ in range(concurrency)
+            ))
+            step = summarize_step(
+                concurrency, samples, time.perf_counter() - start,
+                args.slo_p95_ms, args.max_error_rate
+            )
+            steps.append(step)
+            print(
+                f"c={concurrency:<4} req={step['requests']:<6} rps={step['rps']:<8} "  # noqa: E501
+                f"p50={step['p50_ms']:<9} p95={step['p95_ms']:<9} p99={step['p99_ms']:<9} "  # noqa: E501
+                f"erros={step['error_rate']:.2%}{'' if step['within_slo'] else '  (fora do SLO)'}",  # noqa: E501
+                file=sys.stderr
+            )
+            if not step["within_slo"] and args.stop_on_slo:
+                break
+
+    return {
+        "target": args.url or "in-process",
+        "models": "server" if args.url else ("real" if args.real_models else "stubs"),  # noqa: E501
+        "config": {
+            "endpoint": args.endpoint,
+            "duration_s": args.duration,
+            "files_per_request": list(args.files),
+            "mix": args.mix,
+            "query_ratio": args.query_ratio,
+            "slo_p95_ms": args.slo_p95_ms,
+            "max_error_rate": args.max_error_rate,
+            "seed": args.seed,
+        },
+        "steps": steps,
+        "saturation": saturation(steps, args.min_gain),
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", help="Servidor já no ar; sem ele o app roda no processo")  # noqa: E501
+    parser.add_argument("--endpoint", default="/analyze/")
+    parser.add_argument("--concurrency", default="1,2,4,8,16", help="Degraus de concorrência")  # noqa: E501
+    parser.add_argument("--duration", type=float, default=20, help="Segundos por degrau")  # noqa: E501
+    parser.add_argument("--files", type=parse_range, default=(1, 3), help="Arquivos por requisição (ex.: 1-3)")  # noqa: E501
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("text_pdf=0.5,scan_pdf=0.3,image=0.2"))  # noqa: E501
+    parser.add_argument("--query-ratio", type=float, default=0.5, help="Fração das requisições com query")  # noqa: E501
+    parser.add_argument("--slo-p95-ms", type=float, default=5000)
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--min-gain", type=float, default=0.05, help="Ganho mínimo de vazão entre degraus")  # noqa: E501
+    parser.add_argument("--stop-on-slo", action="store_true", help="Para no primeiro degrau fora do SLO")  # noqa: E501
+    parser.add_argument("--corpus-size", type=int, default=30)
+    parser.add_argument("--max-pages", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--no-warmup", dest="warmup", action="store_false")
+    parser.add_argument("--cache", action="store_true", help="Mantém os caches ligados (no processo)")  # noqa: E501
+    parser.add_argument("--real-models", action="store_true", help="Usa os modelos reais (no processo)")  # noqa: E501
+    parser.add_argument("--json", help="Grava o resultado neste arquivo")
+    args = parser.parse_args(argv)
+    args.levels = [int(level) for level in args.concurrency.split(",") if level]  # noqa: E501
+
+    result = asyncio.run(run(args))
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
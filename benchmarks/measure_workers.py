@@ -0,0 +1,69 @@
+# benchmarks/measure_workers.py
+"""
+Memória do master e dos workers do gunicorn (Linux, /proc/<pid>/smaps_rollup).
+
+Uso:
+    python -m benchmarks.measure_workers <pid do master>
+
+RSS conta as páginas compartilhadas em todos os processos; PSS divide
+cada página compartilhada entre os processos que a usam; USS é a
+memória privada do processo. O custo de um worker a mais é o seu USS.
+"""
+
+import argparse
+import os
+from typing import Dict, List
+
+FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Shared_Clean": "shared",
+    "Shared_Dirty": "shared",
+    "Private_Clean": "uss",
+    "Private_Dirty": "uss",
+}
+
+
+def memory(pid: int) -> Dict[str, float]:
+    """Memória do processo em MB."""
+    totals = {"rss": 0.0, "pss": 0.0, "shared": 0.0, "uss": 0.0}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in FIELDS:
+                totals[FIELDS[key]] += int(value.split()[0]) / 1024
+    return totals
+
+
+def children(pid: int) -> List[int]:
+    pids = []
+    for task in os.listdir(f"/proc/{pid}/task"):
+        with open(f"/proc/{pid}/task/{task}/children") as f:
+            pids.extend(int(child) for child in f.read().split())
+    return sorted(pids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pid", type=int, help="PID do master do gunicorn")
+    args = parser.parse_args()
+
+    workers = children(args.pid)
+    print(f"{'processo':<16} {'RSS MB':>9} {'PSS MB':>9} {'compart. MB':>12} {'USS MB':>9}")  # noqa: E501
+    rows = [("master", args.pid)] + [(f"worker {pid}", pid) for pid in workers]  # noqa: E501
+    total_pss = 0.0
+    worker_uss = []
+    for label, pid in rows:
+        mem = memory(pid)
+        total_pss += mem["pss"]
+        if pid != args.pid:
+            worker_uss.append(mem["uss"])
+        print(f"{label:<16} {mem['rss']:>9.0f} {mem['pss']:>9.0f} {mem['shared']:>12.0f} {mem['uss']:>9.0f}")  # noqa: E501
+
+    print(f"\nMemória total real (soma do PSS): {total_pss:.0f} MB")
+    if worker_uss:
+        print(f"Custo médio por worker extra (USS): {sum(worker_uss) / len(worker_uss):.0f} MB")  # noqa: E501
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# gunicorn.conf.py
+"""
+Implantação com vários workers compartilhando os pesos dos modelos.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Com `preload_app` o app é importado uma vez no processo master, que
+carrega EasyOCR, sumarizador e flan-t5 antes de criar os workers. Os
+workers herdam as páginas dos pesos por copy-on-write: só o que cada um
+altera depois do fork passa a ocupar memória própria.
+
+Com mais de um worker, o estado dos jobs e o repositório de currículos
+precisam estar no MongoDB (`JOBS_BACKEND=mongo`, `RESUME_STORE_BACKEND=mongo`):
+no backend `memory` cada worker vê só o que ele mesmo processou, e
+`/jobs/{job_id}` ou `/resumes/search` respondem conforme o worker que
+atender. Nesse caso o master se recusa a iniciar, a não ser que
+`GUNICORN_ALLOW_LOCAL_STORES=true`.
+"""
+
+import gc
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "300"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+# Lido por app/config.py (importado depois deste arquivo) para dividir
+# os núcleos entre os workers (ver TORCH_THREADS)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+
+def process_local_stores():
+    """Repositórios configurados em memória, que não são vistos entre workers."""  # noqa: E501
+    from app.config import JOBS_BACKEND, RESUME_STORE_BACKEND, RESUME_STORE_ENABLED  # noqa: E501
+
+    stores = []
+    if JOBS_BACKEND != "mongo":
+        stores.append("JOBS_BACKEND")
+    if RESUME_STORE_ENABLED and RESUME_STORE_BACKEND != "mongo":
+        stores.append("RESUME_STORE_BACKEND")
+    return stores
+
+
+def on_starting(server):
+    """Carrega os modelos no master (o app já foi importado pelo preload)."""
+    local_stores = process_local_stores()
+    if workers > 1 and local_stores:
+        message = (
+            f"{workers} workers com {', '.join(local_stores)} em memória: "
+            "cada worker teria seus próprios jobs/currículos. Use o backend "
+            "mongo ou WEB_CONCURRENCY=1"
+        )
+        if os.getenv("GUNICORN_ALLOW_LOCAL_STORES", "").lower() not in ("1", "true", "yes"):  # noqa: E501
+            server.log.error(message)
+            raise SystemExit(1)
+        server.log.warning(f"{message} (GUNICORN_ALLOW_LOCAL_STORES ligado)")
+
+    try:
+        import torch
+
+        # Sem pool de threads do torch no master: ele não sobrevive ao
+        # fork; cada worker configura o seu em post_fork
+        torch.set_num_threads(1)
+    except ImportError:
+        pass
+
+    from app.services.models import registry
+
+    registry.warmup()
+    server.log.info(f"Modelos carregados no master: {registry.status()}")
+
+    # Tira da coleta de lixo os objetos já criados: o GC percorreria
+    # todos eles em cada worker e copiaria suas páginas
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    from app.services.executors import configure_torch_threads
+
+    configure_torch_threads()
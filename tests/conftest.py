@@ -0,0 +1,11 @@
+# tests/conftest.py
+import pytest
+from app.services import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_result_caches():
+    # Resultados em cache de um teste não devem vazar para o próximo
+    cache.clear_memory()
+    yield
+    cache.clear_memory()
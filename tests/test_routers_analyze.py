@@ -2,14 +2,19 @@
 from unittest.mock import patch
 from fastapi.testclient import TestClient
 from app.main import app
+from app.services.ocr import ExtractionResult
+from app.services.uploads import UploadLimitError
+import json
 import uuid
 
 client = TestClient(app)
 
 
-@patch("app.services.ocr.extract_text")
+@patch("app.services.ocr.extract_document")
 def test_analyze_with_query(mock_ocr):
-    mock_ocr.return_value = "Texto extraído simulado para consulta."
+    mock_ocr.return_value = ExtractionResult(
+        "Texto extraído simulado para consulta."
+    )
 
     with open("tests/assets/sample_resume.pdf", "rb") as fake_file:
         files = [("files", ("resume.pdf", fake_file, "text/plain"))]
@@ -47,3 +52,120 @@ def test_analyze_without_query(mock_summarize):
         assert json_data["resume.pdf"]["summary"] == (
             "Resumo simulado para teste."
             )
+
+
+async def _fake_analyze_file(filename, content, query=None, timings=None):
+    timings.update({"ocr": 1.0, "summarize": 2.0, "total": 3.0})
+    return {"summary": f"Resumo de {filename}"}
+
+
+@patch("app.services.logger.save_log")
+@patch("app.services.pipeline.analyze_file", side_effect=_fake_analyze_file)
+def test_analyze_stream_emits_one_record_per_file(mock_analyze, mock_log):
+    files = [
+        ("files", ("a.pdf", b"%PDF-a", "application/pdf")),
+        ("files", ("b.png", b"png", "image/png")),
+    ]
+    data = {"request_id": str(uuid.uuid4()), "user_id": "fabio"}
+
+    response = client.post("/analyze/stream", files=files, data=data)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["type"] for r in records] == ["result", "result", "summary"]
+    assert {r["filename"] for r in records[:2]} == {"a.pdf", "b.png"}
+    assert records[0]["timings_ms"]["total"] == 3.0
+    assert records[-1]["files_processed"] == 2
+    mock_log.assert_called_once()
+
+
+async def _fake_extract(filename, content):
+    return f"Texto de {filename}", []
+
+
+async def _fake_summarize_all(filenames, texts):
+    return [
+        "Engenheiro Python com Django e FastAPI",
+        "Designer com Figma",
+        "Desenvolvedor Python",
+    ]
+
+
+async def _fake_answer(filename, summary, query):
+    return {"answer": f"Sim ({filename})", "justification": summary}
+
+
+@patch("app.services.logger.save_log")
+@patch("app.services.pipeline.answer", side_effect=_fake_answer)
+@patch("app.services.pipeline.summarize_all", side_effect=_fake_summarize_all)  # noqa: E501
+@patch("app.services.pipeline.extract", side_effect=_fake_extract)
+def test_rank_runs_model_only_on_top_k(mock_extract, mock_summarize, mock_answer, mock_log):  # noqa: E501
+    files = [
+        ("files", ("a.pdf", b"%PDF-a", "application/pdf")),
+        ("files", ("b.pdf", b"%PDF-b", "application/pdf")),
+        ("files", ("c.pdf", b"%PDF-c", "application/pdf")),
+    ]
+    data = {
+        "request_id": str(uuid.uuid4()),
+        "user_id": "fabio",
+        "query": "Engenheiro Python com Django",
+        "top_k": "1"
+    }
+
+    response = client.post("/analyze/rank", files=files, data=data)
+    assert response.status_code == 200
+
+    ranking = response.json()["ranking"]
+    assert [c["filename"] for c in ranking] == ["a.pdf", "c.pdf", "b.pdf"]
+    assert [c["evaluated"] for c in ranking] == [True, False, False]
+    assert ranking[0]["answer"] == "Sim (a.pdf)"
+    assert "answer" not in ranking[1]
+    assert mock_answer.call_count == 1
+    mock_log.assert_called_once()
+
+
+@patch("app.services.logger.save_log")
+@patch("app.services.ocr.extract_document")
+def test_analyze_profiles_request_with_token_header(mock_ocr, mock_log, tmp_path):  # noqa: E501
+    mock_ocr.return_value = ExtractionResult("")
+    files = [("files", ("resume.pdf", b"%PDF-a", "application/pdf"))]
+    data = {"request_id": str(uuid.uuid4()), "user_id": "fabio"}
+
+    with patch("app.services.profiling.PROFILING_ENABLED", True), \
+            patch("app.services.profiling.PROFILING_TOKEN", "segredo"), \
+            patch("app.services.profiling.PROFILING_DIR", str(tmp_path)):
+        response = client.post(
+            "/analyze/", files=files, data=data,
+            headers={"X-Profile": "segredo"}
+        )
+        plain = client.post("/analyze/", files=files, data=data)
+
+    assert response.status_code == 200
+    assert (tmp_path / response.headers["X-Profile-File"]).exists()
+    assert "X-Profile-File" not in plain.headers
+    logged = mock_log.call_args_list[0].args[0]
+    assert logged["profile"]["reason"] == "header"
+    assert "profile" not in mock_log.call_args_list[1].args[0]
+
+
+@patch("app.routers.analyze.spool_uploads")
+def test_analyze_rejects_uploads_over_limit(mock_spool):
+    mock_spool.side_effect = UploadLimitError("resume.pdf excede o limite de 20 MB")  # noqa: E501
+    files = [("files", ("resume.pdf", b"%PDF-a", "application/pdf"))]
+    data = {"request_id": str(uuid.uuid4()), "user_id": "fabio"}
+
+    response = client.post("/analyze/", files=files, data=data)
+
+    assert response.status_code == 413
+    assert "20 MB" in response.json()["detail"]
+
+
+def test_analyze_rejects_large_content_length_before_reading_body():
+    with patch("app.main.UPLOAD_MAX_REQUEST_MB", 0.001):
+        response = client.post(
+            "/analyze/",
+            files=[("files", ("resume.pdf", b"x" * 2_000_000, "application/pdf"))],  # noqa: E501
+            data={"request_id": str(uuid.uuid4()), "user_id": "fabio"}
+        )
+    assert response.status_code == 413
@@ -0,0 +1,31 @@
+# tests/test_routers_health.py
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_live_answers_without_models():
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+
+
+def test_ready_is_503_until_models_load():
+    with patch("app.routers.health.registry.ready", return_value=False):
+        response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "loading"
+
+    with patch("app.routers.health.registry.ready", return_value=True):
+        response = client.get("/health/ready")
+    assert response.status_code == 200
+
+
+def test_ready_without_warmup_does_not_wait_for_lazy_models():
+    with patch("app.routers.health.MODELS_WARMUP", False), \
+            patch.dict("app.routers.health.registry._loaders", {"lazy": lambda: None}):  # noqa: E501
+        response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["models"]["lazy"]["state"] == "pending"
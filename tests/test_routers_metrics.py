@@ -0,0 +1,15 @@
+# tests/test_routers_metrics.py
+from fastapi.testclient import TestClient
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_metrics_exposes_prometheus_text():
+    client.get("/health/live")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")  # noqa: E501
+    assert 'resume_http_request_duration_seconds_count{method="GET",route="/health/live",status="200"}' in response.text  # noqa: E501
+    assert 'resume_queue_depth{queue="logs"}' in response.text
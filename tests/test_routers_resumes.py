@@ -0,0 +1,26 @@
+# tests/test_routers_resumes.py
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.resume_store import InMemoryResumeStore, ResumeRepository
+
+client = TestClient(app)
+
+
+def test_search_and_get_stored_resume():
+    repository = ResumeRepository(store=InMemoryResumeStore())
+    resume_id = repository.save(
+        "cv.pdf", "Desenvolvedor Python com FastAPI e Redis.", "Dev Python"
+    )
+
+    with patch("app.routers.resumes.resume_repository", repository):
+        response = client.get("/resumes/search", params={"q": "fastapi"})
+        assert response.status_code == 200
+        assert [r["resume_id"] for r in response.json()["results"]] == [resume_id]  # noqa: E501
+
+        response = client.get(f"/resumes/{resume_id}")
+        assert response.status_code == 200
+        assert response.json()["skills"] == ["Python", "FastAPI", "Redis"]
+
+        assert client.get("/resumes/inexistente").status_code == 404
+        assert client.get("/resumes/search").status_code == 400
@@ -0,0 +1,108 @@
+# tests/test_services_batching.py
+import contextvars
+import threading
+import pytest
+from app.services.batching import MicroBatcher
+
+
+def test_concurrent_items_are_batched_and_routed_back():
+    calls = []
+
+    def batch_fn(items):
+        calls.append(list(items))
+        return [item.upper() for item in items]
+
+    batcher = MicroBatcher("test", batch_fn, max_batch_size=4, max_wait_ms=200)
+    results = {}
+    barrier = threading.Barrier(4)
+
+    def worker(word):
+        barrier.wait()
+        results[word] = batcher(word)
+
+    threads = [threading.Thread(target=worker, args=(w,)) for w in "abcd"]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {"a": "A", "b": "B", "c": "C", "d": "D"}
+    assert len(calls) < 4
+    stats = batcher.stats()
+    assert stats["items"] == 4
+    assert sum(size * count for size, count in stats["batch_sizes"].items()) == 4  # noqa: E501
+
+
+def test_batch_size_is_capped():
+    sizes = []
+    batcher = MicroBatcher(
+        "test",
+        lambda items: sizes.append(len(items)) or items,
+        max_batch_size=2,
+        max_wait_ms=50
+    )
+    futures = [batcher.submit(i) for i in range(5)]
+
+    assert [f.result(timeout=2) for f in futures] == list(range(5))
+    assert max(sizes) <= 2
+
+
+def test_items_with_different_kwargs_run_in_separate_batches():
+    calls = []
+    batcher = MicroBatcher(
+        "test",
+        lambda items, max_length: calls.append((max_length, len(items))) or items,  # noqa: E501
+        max_batch_size=4,
+        max_wait_ms=100
+    )
+    futures = [batcher.submit(i, max_length=800 if i % 2 else 200) for i in range(4)]  # noqa: E501
+
+    assert [f.result(timeout=2) for f in futures] == list(range(4))
+    assert sorted(calls) == [(200, 2), (800, 2)]
+
+
+def test_errors_propagate_to_callers():
+    def broken(items):
+        raise RuntimeError("falha no generate")
+
+    batcher = MicroBatcher("test", broken, max_wait_ms=1)
+    with pytest.raises(RuntimeError, match="falha no generate"):
+        batcher("prompt")
+
+
+def test_batch_is_profiled_and_wait_is_timed_for_the_request():
+    from unittest.mock import patch
+
+    from app.services import metrics, profiling
+    from app.services import question_answering as qa
+
+    def batch_fn(items, max_length):
+        return [sum(range(1000)) and item for item in items]
+
+    batcher = MicroBatcher("test", batch_fn, max_batch_size=1, max_wait_ms=0)
+
+    def request():
+        timings = metrics.start_request_timing()
+        profile = profiling.start("req", "header")
+        assert qa.completion("prompt") == "prompt"
+        return timings, profile
+
+    with patch.object(qa, "qa_batcher", batcher), \
+            patch.object(qa, "QA_BATCHING_ENABLED", True):
+        timings, profile = contextvars.copy_context().run(request)
+
+    assert timings.as_dict()["qa.batch"]["count"] == 1
+    assert any("batch_fn" in entry["function"] for entry in profile.top(50))
+
+
+def test_dispatched_batches_are_observed_in_histogram():
+    from app.services import metrics
+    from app.services.batching import batch_sizes
+
+    before = batch_sizes.count(batcher="hist")
+    batcher = MicroBatcher("hist", lambda items: items, max_batch_size=2, max_wait_ms=50)  # noqa: E501
+    futures = [batcher.submit(i) for i in range(4)]
+    [f.result(timeout=2) for f in futures]
+
+    assert batch_sizes.count(batcher="hist") - before >= 2
+    assert 'resume_batch_size_bucket{batcher="hist",le="2"}' in metrics.render()  # noqa: E501
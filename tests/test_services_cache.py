@@ -0,0 +1,69 @@
+# tests/test_services_cache.py
+import os
+
+import pytest
+
+from app.services.cache import DiskTier, LRUCache, TieredCache, loads, track_events  # noqa: E501
+from app.services.ocr import ExtractionResult, PageExtraction
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_items=2, ttl_seconds=0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_expires_by_ttl():
+    now = [0.0]
+    cache = LRUCache(max_items=10, ttl_seconds=5, clock=lambda: now[0])
+    cache.set("a", 1)
+
+    now[0] = 4
+    assert cache.get("a") == 1
+    now[0] = 10
+    cache.get("a")
+    assert len(cache) == 0
+
+
+def test_get_or_compute_records_hits():
+    cache = TieredCache("teste", memory=LRUCache(max_items=10, ttl_seconds=0))  # noqa: E501
+    calls = []
+
+    with track_events() as events:
+        assert cache.get_or_compute("k", lambda: calls.append(1) or "v") == "v"  # noqa: E501
+        assert cache.get_or_compute("k", lambda: calls.append(1) or "v") == "v"  # noqa: E501
+
+    assert calls == [1]
+    assert [e["hit"] for e in events] == [False, True]
+    assert events[1]["tier"] == "memory"
+
+
+def test_second_tier_is_promoted_to_memory(tmp_path):
+    disk = DiskTier(directory=str(tmp_path), ttl_seconds=0)
+    TieredCache("teste", second_tier=disk).set("k", {"texto": "valor"})
+
+    fresh = TieredCache("teste", memory=LRUCache(max_items=10), second_tier=disk)  # noqa: E501
+    assert fresh.get("k") == (True, {"texto": "valor"}, "disk")
+    assert fresh.get("k") == (True, {"texto": "valor"}, "memory")
+
+
+def test_disk_tier_round_trips_json_values(tmp_path):
+    disk = DiskTier(directory=str(tmp_path), ttl_seconds=0)
+    result = ExtractionResult("texto", [PageExtraction(1, "ocr", 5)])
+    disk.set("ocr:k", result)
+    disk.set("answer:k", ({"answer": "Sim"}, True))
+
+    assert disk.get("ocr:k") == result
+    assert disk.get("answer:k") == [{"answer": "Sim"}, True]
+    assert all(name.endswith(".json") for name in os.listdir(tmp_path))
+
+
+def test_loads_rejects_unregistered_types():
+    with pytest.raises(ValueError):
+        loads('{"__type__": "Popen", "args": ["sh"]}')
@@ -0,0 +1,95 @@
+# tests/test_services_cascade.py
+from unittest.mock import patch
+from app.services import question_answering as qa
+from app.services.cascade import Cascade, StageError, StageResult
+
+CONTEXT = "Desenvolvedor Python com Django, Docker e AWS há 5 anos."
+
+
+def test_cascade_stops_at_first_confident_stage():
+    calls = []
+
+    def stage(name, confidence):
+        def run(context, question):
+            calls.append(name)
+            return StageResult("Sim", name, confidence)
+        return name, run
+
+    cascade = Cascade(
+        [stage("a", 0.5), stage("b", 0.9), stage("c", 1.0)],
+        thresholds={"a": 0.8, "b": 0.8}
+    )
+    analysis, cacheable = cascade.run("contexto", "pergunta")
+
+    assert calls == ["a", "b"]
+    assert cacheable
+    assert analysis["cascade"]["stage"] == "b"
+    assert analysis["cascade"]["accepted"]
+    assert set(analysis["cascade"]["timings_ms"]) == {"a", "b"}
+
+
+def test_cascade_falls_back_to_best_result_when_model_fails():
+    def failing(context, question):
+        raise StageError("modelo indisponível")
+
+    cascade = Cascade(
+        [("a", lambda c, q: StageResult("Não", "fraco", 0.4)), ("model", failing)],  # noqa: E501
+        thresholds={"a": 0.8}
+    )
+    analysis, cacheable = cascade.run("contexto", "pergunta")
+
+    assert analysis["answer"] == "Não"
+    assert analysis["cascade"]["stage"] == "a"
+    assert not analysis["cascade"]["accepted"]
+    assert not cacheable
+
+
+def test_keyword_stage_answers_without_model():
+    with patch.object(qa, "completion") as mock_completion:
+        analysis, _ = qa._answer_question(CONTEXT, "Tem experiência com Django e AWS?")  # noqa: E501
+
+    mock_completion.assert_not_called()
+    assert analysis["answer"] == "Sim"
+    assert analysis["cascade"]["stage"] == "keyword"
+
+
+def test_borderline_question_reaches_model():
+    with patch.object(qa, "build_prompt", return_value="prompt"), \
+            patch.object(qa, "completion", return_value="Sim. Tem Kotlin em projetos Android citados."):  # noqa: E501
+        analysis, _ = qa._answer_question(CONTEXT, "Tem experiência com Kotlin e Spring?")  # noqa: E501
+
+    assert analysis["cascade"]["stage"] == "model"
+    assert list(analysis["cascade"]["timings_ms"]) == ["keyword", "lexical", "model"]  # noqa: E501
+
+
+def test_cached_answer_drops_timings_and_follows_cascade_config():
+    question = "Tem experiência com Django e AWS?"
+    with patch.object(qa, "build_prompt", return_value="prompt"), \
+            patch.object(qa, "completion") as mock_completion:
+        first = qa.answer_question(CONTEXT, question)
+        second = qa.answer_question(CONTEXT, question)
+        with patch.object(qa, "qa_cascade", qa.build_cascade(["model"])):
+            mock_completion.return_value = "Não. Sem experiência citada."
+            third = qa.answer_question(CONTEXT, question)
+
+    assert "timings_ms" in first["cascade"]
+    assert "cached" not in first["cascade"]
+    assert second["cascade"]["cached"]
+    assert "timings_ms" not in second["cascade"]
+    assert second["answer"] == first["answer"]
+    assert third["cascade"]["stage"] == "model"
+
+
+def test_fallback_answer_is_not_cached_and_hits_store_plain_analysis():
+    question = "Tem experiência com Kotlin e Spring?"
+    with patch.object(qa, "build_prompt", return_value="prompt"), \
+            patch.object(qa, "completion", side_effect=RuntimeError("falhou")) as mock_completion:  # noqa: E501
+        qa.answer_question(CONTEXT, question)
+        qa.answer_question(CONTEXT, question)
+    assert mock_completion.call_count == 2
+
+    question = "Tem experiência com Django e AWS?"
+    with patch.object(qa.answer_cache, "set") as mock_set:
+        qa.answer_question(CONTEXT, question)
+    stored = mock_set.call_args.args[1]
+    assert isinstance(stored, dict) and stored["cascade"]["stage"] == "keyword"
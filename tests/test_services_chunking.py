@@ -0,0 +1,34 @@
+# tests/test_services_chunking.py
+from app.services.chunking import chunk_sections, truncate_to_tokens
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def test_chunks_fit_budget_and_prefer_section_boundaries():
+    sections = [
+        "Experiência um dois três. Quatro cinco seis sete. Oito nove.",
+        "Formação a b c d e f. G h i j.",
+    ]
+    chunks = chunk_sections(sections, 12, 0, count_words)
+
+    assert all(count_words(chunk) <= 12 for chunk in chunks)
+    assert chunks[0].endswith("Oito nove.")
+    assert chunks[1].startswith("Formação")
+
+
+def test_overlap_repeats_last_sentences_and_long_sentences_are_split():
+    text = "A b c. D e f. G h i. " + " ".join(f"p{i}" for i in range(10)) + "."  # noqa: E501
+    chunks = chunk_sections([text], 7, 3, count_words)
+
+    assert chunks[:2] == ["A b c. D e f.", "D e f. G h i."]
+    assert chunks[2] == "p0 p1 p2 p3 p4 p5 p6"
+    assert chunks[-1].endswith("p9.")
+    assert all(count_words(chunk) <= 7 for chunk in chunks)
+
+
+def test_truncate_to_tokens_cuts_at_sentence_end():
+    text = "Primeira frase curta. Segunda frase bem mais longa que a primeira."
+    assert truncate_to_tokens(text, 20, count_words) == (text, False)
+    assert truncate_to_tokens(text, 5, count_words) == ("Primeira frase curta.", True)  # noqa: E501
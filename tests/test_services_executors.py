@@ -0,0 +1,55 @@
+# tests/test_services_executors.py
+import asyncio
+import threading
+import time
+from app.services import executors
+
+
+def test_map_ordered_keeps_input_order():
+    def slow_square(value):
+        time.sleep(0.01 * (5 - value))
+        return value * value
+
+    assert executors.map_ordered("ocr_files", slow_square, range(5)) == [0, 1, 4, 9, 16]  # noqa: E501
+
+
+def test_map_ordered_runs_in_parallel():
+    barrier = threading.Barrier(2, timeout=2)
+
+    def wait_for_peer(value):
+        # Só termina se as duas tarefas rodarem ao mesmo tempo
+        barrier.wait()
+        return value
+
+    assert executors.map_ordered("ocr_pages", wait_for_peer, [1, 2]) == [1, 2]
+
+
+def test_torch_threads_divides_cpus_between_workers(monkeypatch):
+    monkeypatch.setattr(executors, "TORCH_THREADS", 0)
+    monkeypatch.setattr(executors, "OCR_PAGE_WORKERS", 4)
+    monkeypatch.setattr(executors, "WEB_CONCURRENCY", 1)
+    monkeypatch.setattr(executors.os, "cpu_count", lambda: 8)
+    assert executors.torch_threads() == 2
+
+    # Vários processos da API dividem os mesmos núcleos
+    monkeypatch.setattr(executors, "WEB_CONCURRENCY", 2)
+    assert executors.torch_threads() == 1
+
+
+def test_run_does_not_block_event_loop():
+    async def scenario():
+        started = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def blocking():
+            loop.call_soon_threadsafe(started.set)
+            time.sleep(0.05)
+            return "ok"
+
+        task = asyncio.ensure_future(executors.run("summarize", blocking))
+        # O loop continua respondendo enquanto a etapa roda na thread
+        await asyncio.wait_for(started.wait(), timeout=1)
+        assert not task.done()
+        return await task
+
+    assert asyncio.run(scenario()) == "ok"
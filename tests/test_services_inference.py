@@ -0,0 +1,48 @@
+# tests/test_services_inference.py
+from unittest.mock import MagicMock, patch
+from app.services import question_answering, summarizer
+from app.services.inference import get_profile
+
+
+def test_profiles_set_decoding_options():
+    quality = get_profile("quality").qa_generation_kwargs(800)
+    fast = get_profile("fast").qa_generation_kwargs(800)
+
+    assert quality == {"do_sample": False, "num_beams": 3, "max_length": 800, "early_stopping": True}  # noqa: E501
+    assert fast == {"do_sample": False, "num_beams": 1, "max_new_tokens": 64}  # noqa: E501
+    assert get_profile("inexistente").name == "quality"
+
+
+def test_generate_batch_uses_profile_of_loaded_model():
+    tokenizer = MagicMock()
+    tokenizer.return_value = {"input_ids": "ids"}
+    tokenizer.batch_decode.return_value = [" Sim. Tem Python. "]
+    model = MagicMock()
+    qa = {
+        "tokenizer": tokenizer,
+        "model": model,
+        "device": -1,
+        "profile": get_profile("balanced")
+    }
+
+    outputs = question_answering.generate_batch(["prompt"], qa=qa)
+
+    assert outputs == ["Sim. Tem Python."]
+    kwargs = model.generate.call_args.kwargs
+    assert kwargs["num_beams"] == 2
+    assert kwargs["max_new_tokens"] == 96
+    assert "max_length" not in kwargs
+
+
+def test_answer_and_summary_keys_follow_inference_profile():
+    with patch("app.services.summarizer.get_profile", return_value=get_profile("fast")):  # noqa: E501
+        fast = summarizer.summary_key("texto")
+    assert fast != summarizer.summary_key("texto")
+
+    keys = []
+    context = "contexto suficiente para análise"
+    with patch.object(question_answering.answer_cache, "get_or_compute", side_effect=lambda key, *args, **kwargs: keys.append(key) or {"answer": "Sim"}):  # noqa: E501
+        question_answering.answer_question(context, "pergunta")
+        with patch("app.services.question_answering.get_profile", return_value=get_profile("fast")):  # noqa: E501
+            question_answering.answer_question(context, "pergunta")
+    assert keys[0] != keys[1]
@@ -0,0 +1,148 @@
+# tests/test_services_jobs.py
+import asyncio
+import time
+from unittest.mock import patch
+from app.services.jobs import InMemoryJobStore, JobManager
+
+
+async def _fake_analyze_file(filename, content, query=None):
+    await asyncio.sleep(0.01)
+    if content is None:
+        raise RuntimeError("arquivo ilegível")
+    return {"summary": f"Resumo de {filename}"}
+
+
+def test_job_processes_files_and_reports_progress():
+    manager = JobManager(store=InMemoryJobStore(), max_concurrency=2)
+    uploads = [("a.pdf", b"a"), ("b.pdf", None), ("c.png", b"c")]
+
+    async def scenario():
+        job_id = await manager.submit(uploads, "req-1", "fabio")
+        initial = manager.status(job_id)
+        await asyncio.gather(*manager._tasks)
+        return job_id, initial
+
+    with patch("app.services.jobs.pipeline.analyze_file", side_effect=_fake_analyze_file), \
+            patch("app.services.jobs.log_sink.save_log") as mock_log:  # noqa: E501
+        job_id, initial = asyncio.run(scenario())
+
+    assert initial["total"] == 3
+    assert initial["status"] in ("queued", "running")
+
+    status = manager.status(job_id)
+    assert status["status"] == "completed"
+    assert status["completed"] == 3
+    assert [f["state"] for f in status["files"]] == ["done", "error", "done"]
+    assert all("result" not in f for f in status["files"])
+
+    results = manager.results(job_id)["results"]
+    assert results["a.pdf"] == {"summary": "Resumo de a.pdf"}
+    assert "arquivo ilegível" in results["b.pdf"]["error"]
+    mock_log.assert_called_once()
+
+
+def test_concurrency_is_bounded():
+    manager = JobManager(store=InMemoryJobStore(), max_concurrency=2)
+    running = []
+    peak = []
+
+    async def tracked(filename, content, query=None):
+        running.append(filename)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(filename)
+        return {"summary": "ok"}
+
+    async def scenario():
+        await manager.submit([(f"{i}.pdf", b"x") for i in range(6)], "req", "u")  # noqa: E501
+        await asyncio.gather(*manager._tasks)
+
+    with patch("app.services.jobs.log_sink.save_log"), \
+            patch("app.services.jobs.pipeline.analyze_file", side_effect=tracked):  # noqa: E501
+        asyncio.run(scenario())
+
+    assert max(peak) == 2
+
+
+def test_unknown_job_returns_none():
+    manager = JobManager(store=InMemoryJobStore())
+    assert manager.status("nao-existe") is None
+    assert manager.results("nao-existe") is None
+
+
+def test_store_error_marks_job_as_failed():
+    store = InMemoryJobStore()
+    manager = JobManager(store=store)
+    original_update_file = store.update_file
+
+    def failing_update_file(job_id, index, **fields):
+        if "result" in fields:
+            raise RuntimeError("banco indisponível")
+        original_update_file(job_id, index, **fields)
+
+    async def scenario():
+        job_id = await manager.submit([("a.pdf", b"a")], "req", "u")
+        await asyncio.gather(*manager._tasks)
+        return job_id
+
+    with patch.object(store, "update_file", side_effect=failing_update_file), \
+            patch("app.services.jobs.pipeline.analyze_file", side_effect=_fake_analyze_file), \
+            patch("app.services.jobs.log_sink.save_log") as mock_log:  # noqa: E501
+        job_id = asyncio.run(scenario())
+
+    status = manager.status(job_id)
+    assert status["status"] == "failed"
+    assert "banco indisponível" in status["error"]
+    assert status["finished_at"] is not None
+    mock_log.assert_not_called()
+
+
+def test_finished_jobs_are_evicted_by_ttl_and_cap():
+    now = [0.0]
+    store = InMemoryJobStore(retention_seconds=60, max_finished=2, clock=lambda: now[0])  # noqa: E501
+    for job_id in ("a", "b", "c", "running"):
+        store.create({"job_id": job_id, "status": "queued"})
+    for job_id in ("a", "b", "c"):
+        store.update(job_id, status="completed")
+
+    assert store.get("a") is None
+    assert store.get("b") is not None
+
+    now[0] = 120
+    assert store.get("b") is None
+    assert store.get("c") is None
+    assert store.get("running") is not None
+
+
+def test_shutdown_cancels_running_jobs_and_marks_them_failed():
+    manager = JobManager(store=InMemoryJobStore())
+
+    async def slow(filename, content, query=None):
+        await asyncio.sleep(10)
+
+    async def scenario():
+        job_id = await manager.submit([("a.pdf", b"a")], "req", "u")
+        await asyncio.sleep(0.05)
+        await manager.shutdown(timeout=0.05)
+        return job_id
+
+    with patch("app.services.jobs.pipeline.analyze_file", side_effect=slow), \
+            patch("app.services.jobs.log_sink.save_log"):
+        job_id = asyncio.run(scenario())
+
+    status = manager.status(job_id)
+    assert status["status"] == "failed"
+    assert "encerramento" in status["error"]
+
+
+def test_recover_fails_jobs_without_recent_heartbeat():
+    store = InMemoryJobStore()
+    store.create({"job_id": "stale", "status": "running", "heartbeat_at": 0})
+    store.create({"job_id": "alive", "status": "running", "heartbeat_at": time.time()})  # noqa: E501
+    store.create({"job_id": "done", "status": "completed", "heartbeat_at": 0})
+    manager = JobManager(store=store, stale_seconds=60)
+
+    assert asyncio.run(manager.recover()) == 1
+    assert store.get("stale")["status"] == "failed"
+    assert store.get("alive")["status"] == "running"
+    assert store.get("done")["status"] == "completed"
@@ -1,9 +1,9 @@
 # tests/test_services_logger.py
-from unittest.mock import patch
+import json
 from app.services import logger
 
 
-def test_save_log_calls_insert_one():
+def test_save_log_writes_batch_in_background():
     dummy_log = {
         "request_id": "123",
         "user_id": "fabio",
@@ -11,7 +11,32 @@ def test_save_log_calls_insert_one():
         "query": None,
         "resultado": {"resume.pdf": {"summary": "Texto simulado"}}
     }
+    collection = logger.InMemoryCollection()
+    sink = logger.LogSink(collection=collection, batch_size=10, flush_interval=0.05)  # noqa: E501
 
-    with patch("app.services.logger.collection.insert_one") as mock_insert:
-        logger.save_log(dummy_log)
-        mock_insert.assert_called_once_with(dummy_log)
+    sink.save(dummy_log)
+    sink.save({**dummy_log, "request_id": "456"})
+    sink.stop()
+
+    assert [doc["request_id"] for doc in collection.documents] == ["123", "456"]  # noqa: E501
+    assert sink.stats()["written"] == 2
+
+
+def test_unreachable_db_spills_to_file(tmp_path):
+    class BrokenCollection:
+        def insert_many(self, documents, ordered=True):
+            raise ConnectionError("MongoDB indisponível")
+
+    spill_path = tmp_path / "logs.jsonl"
+    sink = logger.LogSink(
+        collection=BrokenCollection(),
+        flush_interval=0.01,
+        spill_path=str(spill_path)
+    )
+
+    sink.save({"request_id": "123"})
+    sink.stop()
+
+    lines = spill_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["request_id"] for line in lines] == ["123"]
+    assert sink.stats()["spilled"] == 1
@@ -0,0 +1,59 @@
+# tests/test_services_metrics.py
+import asyncio
+
+import pytest
+
+from app.services import executors, metrics
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = metrics.MetricsRegistry()
+    histogram = registry.histogram("h_seconds", "teste", ("stage",), buckets=(0.1, 1))  # noqa: E501
+    histogram.observe(0.05, stage="ocr")
+    histogram.observe(0.5, stage="ocr")
+    histogram.observe(5, stage="ocr")
+
+    text = registry.render()
+    assert "# TYPE h_seconds histogram" in text
+    assert 'h_seconds_bucket{stage="ocr",le="0.1"} 1' in text
+    assert 'h_seconds_bucket{stage="ocr",le="1"} 2' in text
+    assert 'h_seconds_bucket{stage="ocr",le="+Inf"} 3' in text
+    assert 'h_seconds_count{stage="ocr"} 3' in text
+
+
+def test_counter_and_gauge():
+    registry = metrics.MetricsRegistry()
+    counter = registry.counter("c_total", "teste", ("cache",))
+    counter.inc(cache="ocr")
+    counter.inc(2, cache="ocr")
+    gauge = registry.gauge("g", "teste", ("queue",))
+    gauge.set_function(lambda: 7, queue="logs")
+    gauge.set_function(lambda: 1 / 0, queue="quebrada")
+
+    text = registry.render()
+    assert 'c_total{cache="ocr"} 3' in text
+    assert 'g{queue="logs"} 7' in text
+    assert "quebrada" not in text
+    # O mesmo nome devolve a mesma métrica
+    assert registry.counter("c_total", "teste", ("cache",)) is counter
+
+
+def test_track_accumulates_request_timings_across_threads():
+    async def handle():
+        timings = metrics.start_request_timing()
+        with metrics.track("teste.etapa"):
+            pass
+        await executors.run("qa", lambda: metrics.record_stage("teste.etapa", 0.5))  # noqa: E501
+        return timings.as_dict()
+
+    breakdown = asyncio.run(handle())
+    assert breakdown["teste.etapa"]["count"] == 2
+    assert breakdown["teste.etapa"]["ms"] >= 500
+
+
+def test_track_counts_errors():
+    before = metrics.stage_errors.value(stage="teste.falha")
+    with pytest.raises(ValueError):
+        with metrics.track("teste.falha"):
+            raise ValueError("x")
+    assert metrics.stage_errors.value(stage="teste.falha") == before + 1
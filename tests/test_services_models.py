@@ -0,0 +1,51 @@
+# tests/test_services_models.py
+import threading
+import time
+from app.services.models import ModelRegistry
+
+
+def test_model_is_loaded_only_on_first_use():
+    calls = []
+    registry = ModelRegistry()
+    registry.register("dummy", lambda: calls.append(1) or "modelo")
+
+    assert calls == []
+    assert not registry.ready()
+    assert registry.get("dummy") == "modelo"
+    assert registry.get("dummy") == "modelo"
+    assert calls == [1]
+    assert registry.ready()
+
+
+def test_concurrent_get_loads_once():
+    calls = []
+    registry = ModelRegistry()
+
+    def slow_loader():
+        calls.append(1)
+        time.sleep(0.02)
+        return object()
+
+    registry.register("dummy", slow_loader)
+    threads = [threading.Thread(target=registry.get, args=("dummy",)) for _ in range(5)]  # noqa: E501
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert calls == [1]
+
+
+def test_warmup_records_errors_without_raising():
+    registry = ModelRegistry()
+
+    def broken():
+        raise RuntimeError("sem pesos")
+
+    registry.register("broken", broken)
+    registry.warmup()
+
+    status = registry.status()["broken"]
+    assert status["state"] == "error"
+    assert "sem pesos" in status["error"]
+    assert not registry.ready()
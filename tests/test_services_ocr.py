@@ -1,4 +1,8 @@
 # app/tests/test_services_ocr.py
+import subprocess
+import time
+from unittest.mock import patch
+from PIL import Image
 from app.services import ocr
 
 
@@ -14,3 +18,85 @@ def test_extract_text_pdf_valid():
 def test_extract_text_pdf_empty():
     text = ocr.extract_text("empty.pdf", b"")
     assert "Erro" in text
+
+
+def _pdftotext_output(*pages):
+    return subprocess.CompletedProcess(
+        args=["pdftotext"],
+        returncode=0,
+        stdout=("\f".join(pages) + "\f").encode("utf-8")
+    )
+
+
+def test_extract_document_uses_text_layer_without_ocr():
+    page = "Experiência profissional: Desenvolvedor Python com FastAPI e Docker."  # noqa: E501
+
+    with patch("app.services.ocr.subprocess.run", return_value=_pdftotext_output(page, page)), \
+            patch("app.services.ocr.convert_from_bytes") as mock_convert:  # noqa: E501
+        result = ocr.extract_document("resume.pdf", b"%PDF")
+
+    mock_convert.assert_not_called()
+    assert [p.method for p in result.pages] == ["text_layer", "text_layer"]
+    assert result.text == f"{page}\n\n{page}"
+
+
+def test_extract_document_ocr_only_for_empty_pages():
+    page = "Formação acadêmica: Bacharelado em Ciência da Computação, 2015."
+
+    with patch("app.services.ocr.subprocess.run", return_value=_pdftotext_output(page, "  ")), \
+            patch("app.services.ocr.convert_from_bytes", return_value=[Image.new("L", (10, 10))]) as mock_convert, \
+            patch("app.services.ocr.extract_text_from_image", return_value="Texto do OCR"):  # noqa: E501
+        result = ocr.extract_document("resume.pdf", b"%PDF")
+
+    mock_convert.assert_called_once()
+    assert mock_convert.call_args.kwargs["first_page"] == 2
+    assert [p.method for p in result.pages] == ["text_layer", "ocr"]
+    assert result.text.endswith("Texto do OCR")
+
+
+def test_is_usable_text_rejects_garbage():
+    assert not ocr.is_usable_text("")
+    assert not ocr.is_usable_text("�" * 80)
+    assert not ocr.is_usable_text("·•·•·•" * 20)
+    assert ocr.is_usable_text("Desenvolvedor backend com experiência em Python e APIs REST")  # noqa: E501
+
+
+def test_page_windows_groups_consecutive_pages():
+    windows = list(ocr._page_windows([6, 1, 2, 3, 5], 2))
+    assert windows == [(1, 2), (3, 3), (5, 6)]
+
+
+def test_iter_pdf_pages_renders_grayscale_windows():
+    def fake_convert(content, first_page, last_page, **kwargs):
+        return [Image.new("L", (10, 10)) for _ in range(first_page, last_page + 1)]  # noqa: E501
+
+    with patch("app.services.ocr.page_window_size", return_value=2), \
+            patch("app.services.ocr.convert_from_bytes", side_effect=fake_convert) as mock_convert:  # noqa: E501
+        pages = [page for page, _ in ocr.iter_pdf_pages(b"%PDF", [1, 2, 3])]
+
+    assert pages == [1, 2, 3]
+    assert mock_convert.call_count == 2
+    assert mock_convert.call_args.kwargs["grayscale"] is True
+    assert mock_convert.call_args.kwargs["size"] == ocr.OCR_MAX_IMAGE_SIDE
+
+
+def test_extract_documents_keeps_upload_order():
+    def fake_extract(filename, content):
+        time.sleep(0.02 if filename == "a.pdf" else 0)
+        return ocr.ExtractionResult(filename)
+
+    with patch("app.services.ocr.extract_document", side_effect=fake_extract):
+        results = ocr.extract_documents([("a.pdf", b""), ("b.png", b"")])
+
+    assert [r.text for r in results] == ["a.pdf", "b.png"]
+
+
+def test_cache_key_changes_with_extraction_settings():
+    pdf = ocr.extraction_settings("pdf")
+    with patch.object(ocr, "OCR_PDF_DPI", 150):
+        assert ocr.extraction_settings("pdf") != pdf
+    with patch.object(ocr, "PDF_TEXT_LAYER_ENABLED", False):
+        assert ocr.extraction_settings("pdf") != pdf
+    image = ocr.extraction_settings("image")
+    with patch.object(ocr, "OCR_LANGUAGES", ["en"]):
+        assert ocr.extraction_settings("image") != image
@@ -0,0 +1,48 @@
+# tests/test_services_profiling.py
+import asyncio
+import os
+import pstats
+from unittest.mock import patch
+
+from app.services import executors, profiling
+
+
+def _busy_work():
+    return sum(i * i for i in range(20000))
+
+
+def test_profile_collects_work_from_executor_threads(tmp_path):
+    async def handle():
+        profile = profiling.start("req-1", "header")
+        await executors.run("qa", _busy_work)
+        return profile
+
+    profile = asyncio.run(handle())
+    summary = profile.finish(directory=str(tmp_path), top_n=50)
+
+    assert summary["reason"] == "header"
+    assert any("_busy_work" in entry["function"] for entry in summary["top"])
+    assert os.path.dirname(summary["file"]) == str(tmp_path)
+    assert pstats.Stats(summary["file"]).total_calls > 0
+
+
+def test_profiled_is_identity_without_active_profile():
+    assert profiling.profiled(_busy_work) is _busy_work
+
+
+def test_should_profile_requires_enabled_and_matching_token():
+    with patch.object(profiling, "PROFILING_ENABLED", False), \
+            patch.object(profiling, "PROFILING_TOKEN", "segredo"):
+        assert profiling.should_profile("segredo") is None
+
+    with patch.object(profiling, "PROFILING_ENABLED", True), \
+            patch.object(profiling, "PROFILING_TOKEN", "segredo"), \
+            patch.object(profiling, "PROFILING_SAMPLE_RATE", 0):
+        assert profiling.should_profile("segredo") == "header"
+        assert profiling.should_profile("outro") is None
+        assert profiling.should_profile(None) is None
+
+    with patch.object(profiling, "PROFILING_ENABLED", True), \
+            patch.object(profiling, "PROFILING_TOKEN", ""), \
+            patch.object(profiling, "PROFILING_SAMPLE_RATE", 1.0):
+        assert profiling.should_profile(None) == "sample"
@@ -0,0 +1,39 @@
+# tests/test_services_ranking.py
+from app.services.ranking import bm25_scores, rank_candidates, tokenize
+
+SUMMARIES = [
+    "Desenvolvedora Java com Spring e Kafka.",
+    "Engenheiro Python com Django, FastAPI e AWS. Python há 6 anos.",
+    "Analista de dados com Python e Pandas.",
+    "Designer de produto com Figma.",
+]
+
+
+def test_tokenize_removes_accents_and_stopwords():
+    assert tokenize("Experiência com C++ e Node.js.") == ["c++", "node.js"]
+
+
+def test_most_relevant_resume_ranks_first():
+    ranking = rank_candidates(SUMMARIES, "Engenheiro Python com Django", top_k=2)  # noqa: E501
+
+    assert ranking[0]["index"] == 1
+    assert ranking[1]["index"] == 2
+    assert [r["evaluate"] for r in ranking] == [True, True, False, False]
+    assert ranking[-1]["score"] == 0
+
+
+def test_min_score_and_excluded_skip_model_evaluation():
+    ranking = rank_candidates(
+        SUMMARIES,
+        "Python",
+        top_k=10,
+        excluded=[False, True, False, False]
+    )
+
+    evaluated = [r["index"] for r in ranking if r["evaluate"]]
+    assert evaluated == [2]
+    assert ranking[-1]["index"] == 1
+
+
+def test_empty_query_scores_zero():
+    assert not bm25_scores(SUMMARIES, "de com").any()
@@ -0,0 +1,94 @@
+# tests/test_services_reader_pool.py
+import threading
+import time
+from app.services.reader_pool import ReaderPool
+
+
+def test_reader_is_loaded_once_and_reused():
+    created = []
+    pool = ReaderPool(instances=1, factory=lambda key: created.append(key) or object())  # noqa: E501
+
+    with pool.acquire(["pt", "en"]) as first:
+        pass
+    with pool.acquire(["pt", "en"]) as second:
+        pass
+
+    assert first is second
+    assert created == [("pt", "en")]
+    stats = pool.stats()["pt,en"]
+    assert stats["loaded"] == 1
+    assert stats["acquired"] == 2
+    assert stats["reused"] == 1
+
+
+def test_separate_instances_per_language_set():
+    pool = ReaderPool(instances=1, factory=lambda key: object())
+
+    with pool.acquire(["pt", "en"]) as pt_en:
+        pass
+    with pool.acquire(["en"]) as en:
+        pass
+
+    assert pt_en is not en
+    assert set(pool.stats()) == {"pt,en", "en"}
+
+
+def test_concurrent_acquire_respects_instance_limit():
+    pool = ReaderPool(instances=2, factory=lambda key: object())
+    in_use = set()
+    peak = []
+    lock = threading.Lock()
+
+    def worker():
+        with pool.acquire(["pt"]) as reader:
+            with lock:
+                assert reader not in in_use
+                in_use.add(reader)
+                peak.append(len(in_use))
+            time.sleep(0.01)
+            with lock:
+                in_use.discard(reader)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert max(peak) <= 2
+    assert pool.stats()["pt"]["loaded"] == 2
+
+
+def test_warmup_preloads_readers():
+    pool = ReaderPool(instances=2, factory=lambda key: object())
+    pool.warmup(["pt"])
+
+    stats = pool.stats()["pt"]
+    assert stats["loaded"] == 2
+    assert stats["idle"] == 2
+
+
+def test_reset_swaps_factory_and_drops_readers():
+    pool = ReaderPool(instances=1, factory=lambda key: "real")
+    with pool.acquire(["pt"]) as reader:
+        assert reader == "real"
+
+    pool.reset(factory=lambda key: "stub")
+
+    with pool.acquire(["pt"]) as reader:
+        assert reader == "stub"
+    assert pool.stats()["pt"]["loaded"] == 1
+
+
+def test_reset_while_reader_is_checked_out_drops_stale_reader():
+    pool = ReaderPool(instances=1, factory=lambda key: "real")
+
+    with pool.acquire(["pt"]) as reader:
+        pool.reset(factory=lambda key: "stub")
+    assert reader == "real"
+
+    with pool.acquire(["pt"]) as reader:
+        assert reader == "stub"
+    stats = pool.stats()["pt"]
+    assert stats["loaded"] == 1
+    assert stats["idle"] == 1
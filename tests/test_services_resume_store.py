@@ -0,0 +1,76 @@
+# tests/test_services_resume_store.py
+from app.services.resume_store import InMemoryResumeStore, ResumeRepository
+
+PYTHON_CV = (
+    "Engenheiro de software com 6 anos de experiência em Python, Django "
+    "e AWS. Python em produção desde 2018."
+)
+JAVA_CV = "Desenvolvedor Java com Spring, Kafka e Docker."
+DATA_CV = "Analista de dados com Python, Pandas e Docker."
+
+
+def _repository():
+    repository = ResumeRepository(store=InMemoryResumeStore())
+    ids = [
+        repository.save("python.pdf", PYTHON_CV, "Engenheiro Python sênior"),
+        repository.save("java.pdf", JAVA_CV, "Desenvolvedor Java"),
+        repository.save("data.pdf", DATA_CV, "Analista de dados"),
+    ]
+    return repository, ids
+
+
+def test_save_extracts_details():
+    repository, ids = _repository()
+    record = repository.get(ids[0])
+
+    assert record["filename"] == "python.pdf"
+    assert record["skills"] == ["Python", "Django", "AWS"]
+    assert record["experience_years"] == "6 anos de experiência"
+    assert "django" in record["terms"]
+
+
+def test_search_ranks_by_terms_and_filters_by_skill():
+    repository, _ = _repository()
+
+    results = repository.search("python django")
+    assert [r["filename"] for r in results] == ["python.pdf", "data.pdf"]
+    assert results[0]["matched_terms"] == ["python", "django"]
+    assert "text" not in results[0]
+
+    results = repository.search("", skills=["docker"])
+    assert {r["filename"] for r in results} == {"java.pdf", "data.pdf"}
+
+    results = repository.search("python", skills=["Docker"])
+    assert [r["filename"] for r in results] == ["data.pdf"]
+
+
+def test_resaving_same_text_replaces_record():
+    repository, ids = _repository()
+    resume_id = repository.save("python-v2.pdf", PYTHON_CV, "Engenheiro Python")  # noqa: E501
+
+    assert resume_id == ids[0]
+    assert repository.get(resume_id)["filename"] == "python-v2.pdf"
+    assert len(repository.search("python")) == 2
+    assert repository.search("kotlin") == []
+
+
+def test_memory_store_evicts_least_recently_used():
+    repository = ResumeRepository(store=InMemoryResumeStore(max_records=2))
+    python_id = repository.save("python.pdf", PYTHON_CV, "Engenheiro Python")
+    repository.save("java.pdf", JAVA_CV, "Desenvolvedor Java")
+    repository.get(python_id)
+    repository.save("data.pdf", DATA_CV, "Analista de dados")
+
+    assert {r["filename"] for r in repository.search("docker python")} == {"python.pdf", "data.pdf"}  # noqa: E501
+    assert repository.search("kafka") == []
+
+
+def test_candidates_skip_text_and_results_do_not_alias_store():
+    repository, ids = _repository()
+
+    records, _, _, _ = repository.store.candidates(["python"], [])
+    assert records and all("text" not in record for record in records)
+
+    results = repository.search("python")
+    results[0]["skills"].append("COBOL")
+    assert "COBOL" not in repository.get(results[0]["resume_id"])["skills"]
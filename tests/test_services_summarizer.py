@@ -43,3 +43,130 @@ def test_summarize_text_erro_pipeline():
     ):
         summary = summarizer.summarize_text(text)
         assert summary.startswith("Erro ao gerar resumo:")
+
+
+def test_summarize_texts_batches_only_ml_inputs():
+    structured = ("Cargos/Funções: Desenvolvedor. Experiência: 5 anos de "
+                  "experiência. Competências e habilidades: habilidades "
+                  "python, fastapi, docker e kubernetes em produção.")
+    texts = ["Lorem " * 30, "", structured, "Ipsum " * 60]
+
+    with patch("app.services.summarizer._run_summarizer") as mock_run:
+        mock_run.side_effect = lambda inputs: [f"ML {len(i)}" for i in inputs]
+        summaries = summarizer.summarize_texts(texts)
+
+    mock_run.assert_called_once()
+    inputs = mock_run.call_args.args[0]
+    # Apenas os textos que precisam do modelo, do maior para o menor
+    assert [len(i) for i in inputs] == sorted((len(i) for i in inputs), reverse=True)  # noqa: E501
+    assert len(inputs) == 2
+    assert summaries[1] == "Texto vazio, não foi possível gerar resumo."
+    assert summaries[2].startswith("Cargos/Funções")
+    assert summaries[0].endswith(f"ML {len(inputs[1])}.")
+    assert summaries[3].endswith(f"ML {len(inputs[0])}.")
+
+
+def test_summarize_texts_isolates_item_errors():
+    texts = ["Lorem " * 30, "Ipsum " * 60]
+
+    def flaky(inputs):
+        if len(inputs) > 1 or inputs[0].startswith("Ipsum"):
+            raise RuntimeError("Falha no modelo")
+        return ["Resumo do modelo"]
+
+    with patch("app.services.summarizer._run_summarizer", side_effect=flaky):
+        summaries = summarizer.summarize_texts(texts)
+
+    assert summaries[0].endswith("Resumo do modelo.")
+    assert summaries[1] == "Profissional com experiência e formação diversificada."  # noqa: E501
+
+
+def test_segment_resume_splits_non_overlapping_sections():
+    text = ("Experiência Profissional Engenheiro na Acme com mais de 6 anos de "  # noqa: E501
+            "experiência em Python. Formação Bacharelado em Computação pela "
+            "USP. Habilidades: Python, Django, Docker e AWS em produção.")
+
+    segments = summarizer.segment_resume(text)
+
+    assert list(segments.sections) == ["experiencia", "formacao", "habilidades"]  # noqa: E501
+    assert segments.sections["experiencia"][0].endswith("em python.")
+    assert segments.sections["formacao"][0].startswith("formação bacharelado")  # noqa: E501
+    assert segments.experience_years == "6 anos de experiência"
+    assert segments.job_titles == ["engenheiro"]
+
+
+def test_segment_resume_matches_whole_header_words_only():
+    text = ("Experiência Gestão de recursos humanos e trabalhos voluntários "
+            "na Acme por muitos anos.")
+
+    segments = summarizer.segment_resume(text)
+
+    assert list(segments.sections) == ["experiencia"]
+    assert "trabalhos voluntários" in segments.sections["experiencia"][0]
+
+
+def test_experience_years_keeps_pattern_priority():
+    text = "Mais de 10 anos na área, sendo 4 anos de experiência com Python"
+    assert summarizer.extract_experience_years(text) == "4 anos de experiência"  # noqa: E501
+
+
+def _word_tokenizer(text, add_special_tokens=True, truncation=False):
+    if isinstance(text, list):
+        return {"input_ids": [t.split() for t in text]}
+    return {"input_ids": text.split()}
+
+
+def test_chunked_mode_summarizes_all_chunks_in_one_batch_then_reduces():
+    long_text = " ".join(
+        f"Experiência {i}: desenvolvimento de APIs em Python e Django." for i in range(30)  # noqa: E501
+    )
+    short_text = "Formação em Computação. " + "Projetos de dados com Pandas. " * 3  # noqa: E501
+    pipeline = type("Pipeline", (), {"tokenizer": staticmethod(_word_tokenizer)})()  # noqa: E501
+    batches = []
+
+    def fake_run(inputs):
+        batches.append(inputs)
+        return [f"resumo{len(batches)}"] * len(inputs)
+
+    with patch.object(summarizer, "SUMMARIZER_MODE", "chunked"), \
+            patch.object(summarizer, "SUMMARIZER_CHUNK_TOKENS", 60), \
+            patch.object(summarizer, "SUMMARIZER_CHUNK_OVERLAP", 0), \
+            patch.object(summarizer, "get_summarizer_pipeline", return_value=pipeline), \
+            patch.object(summarizer, "_generate_from_ids", side_effect=fake_run), \
+            patch.object(summarizer, "create_structured_summary", return_value=""):  # noqa: E501
+        summaries = summarizer.summarize_texts([long_text, short_text])
+
+    # 1º lote: todos os blocos dos dois textos; 2º: só a redução do longo
+    assert len(batches[0]) > 2
+    assert len(batches[1]) == 1
+    assert summaries == ["resumo2.", "resumo1."]
+
+
+def test_summary_key_changes_with_mode_and_chunk_parameters():
+    truncate = summarizer.summary_key("texto")
+    with patch.object(summarizer, "SUMMARIZER_MODE", "chunked"):
+        chunked = summarizer.summary_key("texto")
+        with patch.object(summarizer, "SUMMARIZER_CHUNK_TOKENS", 256):
+            smaller = summarizer.summary_key("texto")
+    with patch.object(summarizer, "SUMMARIZER_MODEL", "outro/modelo"):
+        other_model = summarizer.summary_key("texto")
+
+    assert len({truncate, chunked, smaller, other_model}) == 4
+
+
+def test_chunk_cache_hit_skips_tokenizer():
+    text = " ".join(f"Experiência {i}: APIs em Python e Django." for i in range(30))  # noqa: E501
+    calls = []
+
+    def tokenizer(text, **kwargs):
+        calls.append(text)
+        return _word_tokenizer(text, **kwargs)
+
+    with patch.object(summarizer, "SUMMARIZER_CHUNK_TOKENS", 60):
+        first = summarizer.get_chunks(text, tokenizer)
+        calls.clear()
+        second = summarizer.get_chunks(text, tokenizer)
+
+    assert len(first) > 1 and second == first
+    assert first[0]["input_ids"] == first[0]["text"].split()
+    assert calls == []
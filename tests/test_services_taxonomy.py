@@ -0,0 +1,46 @@
+# tests/test_services_taxonomy.py
+from app.services.taxonomy import AhoCorasick, Taxonomy, get_taxonomy
+
+TAXONOMY = Taxonomy({
+    "skills": {
+        "JavaScript": {"category": "linguagem", "aliases": ["javascript", "js"]},  # noqa: E501
+        "Node.js": {"aliases": ["node.js", "node"]},
+        "Git": {"aliases": ["git"]},
+        "C++": {"aliases": ["c++"]},
+        "Machine Learning": {"aliases": ["machine learning", "ml"]},
+    },
+    "roles": {
+        "engenheiro de machine learning": {"aliases": ["engenheiro de machine learning"]},  # noqa: E501
+    }
+})
+
+
+def test_automaton_finds_overlapping_patterns():
+    automaton = AhoCorasick()
+    for pattern in ("he", "she", "his", "hers"):
+        automaton.add(pattern, pattern)
+    automaton.build()
+
+    found = sorted((start, payload) for start, _, payload in automaton.iter("ushers"))  # noqa: E501
+    assert found == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+def test_find_respects_word_boundaries_and_offsets():
+    text = "Digital, JSON e Node.js; C++ com Git."
+    matches = TAXONOMY.find(text)
+
+    assert [m.name for m in matches] == ["Node.js", "C++", "Git"]
+    assert [text[m.start:m.end] for m in matches] == ["Node.js", "C++", "Git"]
+
+
+def test_longest_alias_wins_and_kinds_are_separated():
+    text = "Engenheiro de Machine Learning, ML e JS"
+
+    assert TAXONOMY.roles(text) == ["engenheiro de machine learning"]
+    assert TAXONOMY.skills(text) == ["Machine Learning", "JavaScript"]
+
+
+def test_default_taxonomy_loads_from_yaml():
+    taxonomy = get_taxonomy()
+    assert len(taxonomy.terms) > 100
+    assert taxonomy.skills("Experiência com postgres e k8s") == ["PostgreSQL", "Kubernetes"]  # noqa: E501
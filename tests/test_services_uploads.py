@@ -0,0 +1,69 @@
+# tests/test_services_uploads.py
+import asyncio
+import hashlib
+import io
+import os
+from unittest.mock import patch
+
+import pytest
+from fastapi import UploadFile
+
+from app.services.uploads import (
+    SpooledUpload,
+    UploadLimitError,
+    check_pages,
+    spool,
+    spool_uploads
+)
+
+
+def make_upload(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename)
+
+
+def test_spool_writes_file_in_chunks_and_hashes_content(tmp_path):
+    content = os.urandom(10_000)
+    upload = asyncio.run(spool(
+        make_upload("cv.pdf", content), max_bytes=20_000,
+        directory=str(tmp_path), chunk_size=1024
+    ))
+
+    assert upload.size == len(content)
+    assert upload.sha256 == hashlib.sha256(content).hexdigest()
+    assert upload.path.endswith(".pdf")
+    with open(upload.path, "rb") as f:
+        assert f.read() == content
+    upload.remove()
+    assert not os.path.exists(upload.path)
+
+
+def test_spool_over_limit_removes_partial_file(tmp_path):
+    with pytest.raises(UploadLimitError):
+        asyncio.run(spool(
+            make_upload("cv.pdf", b"x" * 5000), max_bytes=4096,
+            directory=str(tmp_path), chunk_size=1024
+        ))
+    assert os.listdir(tmp_path) == []
+
+
+def test_spool_uploads_enforces_request_limit_and_cleans_up(tmp_path):
+    files = [make_upload(f"cv{i}.png", b"x" * 3000) for i in range(3)]
+
+    with patch("app.services.uploads.UPLOAD_SPOOL_DIR", str(tmp_path)):
+        with pytest.raises(UploadLimitError, match="requisição"):
+            asyncio.run(spool_uploads(files, max_file_bytes=4000, max_request_bytes=8000))  # noqa: E501
+    assert os.listdir(tmp_path) == []
+
+
+@patch("app.services.uploads.count_pages")
+def test_check_pages_limits_per_file_and_per_request(mock_pages):
+    mock_pages.return_value = 30
+    uploads = [SpooledUpload(f"cv{i}.pdf", "", 0, "") for i in range(3)]
+
+    check_pages(uploads[:2], max_file_pages=50, max_request_pages=100)
+    assert [u.pages for u in uploads[:2]] == [30, 30]
+
+    with pytest.raises(UploadLimitError, match="páginas"):
+        check_pages(uploads, max_file_pages=50, max_request_pages=80)
+    with pytest.raises(UploadLimitError, match="cv0.pdf"):
+        check_pages(uploads, max_file_pages=20, max_request_pages=0)